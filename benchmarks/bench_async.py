@@ -0,0 +1,87 @@
+"""Event-loop responsiveness while verification runs at full load, with and without AsyncSchnorrMusig.
+
+A ticker coroutine sleeps for 1 ms in a loop and records how late each wake-up is.
+
+    python -m benchmarks.bench_async
+"""
+import asyncio
+import statistics
+import time
+from typing import Dict
+from typing import List
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEY
+from benchmarks.common import PUBLIC_KEY
+from benchmarks.common import SEED
+from benchmarks.common import emit
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_async import AsyncSchnorrMusig
+
+TICK = 0.001
+
+
+def signature(musig: SchnorrMusig) -> bytes:
+    with musig.create_signer([PUBLIC_KEY], 0) as signer:
+        signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment(SEED)))
+        return signer.aggregate_signature(signer.sign(PRIVATE_KEY, MESSAGE))
+
+
+async def ticker(lateness: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lateness.append(time.perf_counter() - start - TICK)
+
+
+def summarize(lateness: List[float], elapsed: float, calls: int) -> Dict:
+    lateness = sorted(lateness) or [0.0]
+    return {
+        'ticks': len(lateness),
+        'lateness_median': statistics.median(lateness),
+        'lateness_p99': lateness[int(len(lateness) * 0.99)],
+        'lateness_max': lateness[-1],
+        'verify_per_second': calls / elapsed,
+    }
+
+
+async def blocking(musig: SchnorrMusig, aggregated_signature: bytes, calls: int) -> Dict:
+    lateness: List[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lateness, stop))
+    start = time.perf_counter()
+    for index in range(calls):
+        musig.verify(MESSAGE, aggregated_signature, PUBLIC_KEY)
+        if index % 16 == 0:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    return summarize(lateness, elapsed, calls)
+
+
+async def wrapped(musig: SchnorrMusig, aggregated_signature: bytes, calls: int) -> Dict:
+    lateness: List[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lateness, stop))
+    async with AsyncSchnorrMusig(musig) as async_musig:
+        start = time.perf_counter()
+        await asyncio.gather(*[async_musig.verify(MESSAGE, aggregated_signature, PUBLIC_KEY) for _ in range(calls)])
+        elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    return summarize(lateness, elapsed, calls)
+
+
+def run(quick: bool = False) -> Dict:
+    calls = 200 if quick else 2000
+    musig = SchnorrMusig()
+    aggregated_signature = signature(musig)
+    return {
+        'blocking': asyncio.run(blocking(musig, aggregated_signature, calls)),
+        'async': asyncio.run(wrapped(musig, aggregated_signature, calls)),
+    }
+
+
+if __name__ == '__main__':
+    emit('async', run())
@@ -0,0 +1,65 @@
+"""Per-call cost of schnorr_musig_verify and schnorr_musig_sign through each available backend.
+
+    python -m benchmarks.bench_backends
+"""
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEY
+from benchmarks.common import PUBLIC_KEY
+from benchmarks.common import emit
+from benchmarks.common import measure
+from zksync.sdk.musig import schnorr_musig_cffi
+from zksync.sdk.musig.schnorr_musig_native import *
+
+
+def prepare(native: SchnorrMusigNative):
+    signer = native.schnorr_musig_new_signer(PUBLIC_KEY, len(PUBLIC_KEY), 0)
+    seed = (c_uint32 * 4)(16807, 282475249, 1622650073, 984943658)
+    precommitment = Precommitment()
+    native.schnorr_musig_compute_precommitment(signer, seed, 4, PrecommitmentPointer(precommitment))
+    commitment = Commitment()
+    native.schnorr_musig_receive_precommitments(signer, bytes(precommitment.data), STANDARD_ENCODING_LENGTH,
+                                                CommitmentPointer(commitment))
+    aggregated_commitment = AggregatedCommitment()
+    native.schnorr_musig_receive_commitments(signer, bytes(commitment.data), STANDARD_ENCODING_LENGTH,
+                                             AggregatedCommitmentPointer(aggregated_commitment))
+    signature = Signature()
+    native.schnorr_musig_sign(signer, PRIVATE_KEY, len(PRIVATE_KEY), MESSAGE, len(MESSAGE),
+                              SignaturePointer(signature))
+    aggregated_signature = AggregatedSignature()
+    native.schnorr_musig_receive_signature_shares(signer, bytes(signature.data), STANDARD_ENCODING_LENGTH,
+                                                  AggregatedSignaturePointer(aggregated_signature))
+    return signer, bytes(aggregated_signature.data)
+
+
+def bench_backend(native: SchnorrMusigNative, number: int) -> Dict:
+    signer, aggregated_signature = prepare(native)
+    signature = Signature()
+    signature_pointer = SignaturePointer(signature)
+
+    def verify():
+        native.schnorr_musig_verify(MESSAGE, len(MESSAGE), PUBLIC_KEY, len(PUBLIC_KEY), aggregated_signature,
+                                    len(aggregated_signature))
+
+    def sign():
+        native.schnorr_musig_sign(signer, PRIVATE_KEY, len(PRIVATE_KEY), MESSAGE, len(MESSAGE), signature_pointer)
+
+    results = {'verify': measure(verify, number), 'sign': measure(sign, number)}
+    native.schnorr_musig_delete_signer(signer)
+    return results
+
+
+def run(quick: bool = False) -> Dict:
+    number = 20 if quick else 200
+    results = {CTYPES_BACKEND: bench_backend(SchnorrMusigLoader.load(CTYPES_BACKEND), number)}
+    if schnorr_musig_cffi.is_available():
+        results[CFFI_BACKEND] = bench_backend(SchnorrMusigLoader.load(CFFI_BACKEND), number)
+        for call in ('verify', 'sign'):
+            results['saved_per_call_' + call] = (results[CTYPES_BACKEND][call]['best'] -
+                                                 results[CFFI_BACKEND][call]['best'])
+    return results
+
+
+if __name__ == '__main__':
+    emit('backends', run())
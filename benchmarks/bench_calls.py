@@ -0,0 +1,176 @@
+"""Per-call cost of every native entry point and every SchnorrMusig/SchnorrMusigSigner method.
+
+Committee sizes sweep from 1 to 1024 participants. For each call the report separates:
+
+* ffi: cost of a native call that returns immediately (zero-length verify), i.e. pure binding overhead;
+* native: raw native call time minus the ffi overhead;
+* python: SDK method time minus the raw native call it wraps.
+
+    python -m benchmarks.bench_calls
+"""
+from typing import Callable
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEYS
+from benchmarks.common import PUBLIC_KEYS
+from benchmarks.common import SEED
+from benchmarks.common import emit
+from benchmarks.common import measure
+from benchmarks.common import measure_calls
+from benchmarks.common import participants
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_cache import AggregatedPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_native import *
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+PARTICIPANTS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
+QUICK_PARTICIPANTS = [1, 4, 16]
+
+FRESH, PRECOMMITTED, COMMITTED, AGGREGATED, SIGNED = range(5)
+
+
+class Session:
+    """Deterministic round payloads for a committee, so any signer can be replayed to any stage."""
+
+    def __init__(self, musig: SchnorrMusig, count: int) -> None:
+        self.musig = musig
+        indices = participants(count)
+        self.public_keys = [PUBLIC_KEYS[index] for index in indices]
+        self.private_keys = [PRIVATE_KEYS[index] for index in indices]
+        self.encoded_public_keys = b''.join(self.public_keys)
+        self.aggregated_public_key = musig.aggregate_public_keys(*self.public_keys)
+
+        signers = [musig.create_signer(self.public_keys, index) for index in range(count)]
+        self.precommitments = b''.join(signer.compute_precommitment(SEED) for signer in signers)
+        self.commitments = b''.join(signer.receive_precommitments(self.precommitments) for signer in signers)
+        for signer in signers:
+            signer.receive_commitments(self.commitments)
+        self.shares = b''.join(signer.sign(private_key, MESSAGE)
+                               for signer, private_key in zip(signers, self.private_keys))
+        self.signature = signers[0].aggregate_signature(self.shares)
+        for signer in signers:
+            signer.revoke()
+
+    def signer(self, stage: int) -> SchnorrMusigSigner:
+        signer = self.musig.create_signer(self.public_keys, 0)
+        if stage >= PRECOMMITTED:
+            signer.compute_precommitment(SEED)
+        if stage >= COMMITTED:
+            signer.receive_precommitments(self.precommitments)
+        if stage >= AGGREGATED:
+            signer.receive_commitments(self.commitments)
+        if stage >= SIGNED:
+            signer.sign(self.private_keys[0], MESSAGE)
+        return signer
+
+
+def bench_native(session: Session, native: SchnorrMusigNative, number: int) -> Dict:
+    keys = session.encoded_public_keys
+    seed = (c_uint32 * 4).from_buffer_copy(SEED)
+    private_key = session.private_keys[0]
+
+    def at(stage: int, call: Callable[[MusigSignerPointer], object]) -> Dict:
+        return measure_calls(lambda: session.signer(stage), lambda signer: call(signer.signer), number,
+                             lambda signer: signer.revoke())
+
+    def new_signer() -> MusigSignerPointer:
+        return native.schnorr_musig_new_signer(keys, len(keys), 0)
+
+    return {
+        'schnorr_musig_new_signer': measure_calls(list, lambda created: created.append(new_signer()), number,
+                                                  lambda created: native.schnorr_musig_delete_signer(created[0])),
+        'schnorr_musig_delete_signer': measure_calls(new_signer, native.schnorr_musig_delete_signer, number),
+        'schnorr_musig_aggregate_pubkeys': measure(
+            lambda: native.schnorr_musig_aggregate_pubkeys(keys, len(keys),
+                                                           AggregatedPublicKeyPointer(AggregatedPublicKey())), number),
+        'schnorr_musig_compute_precommitment': at(FRESH, lambda signer: native.schnorr_musig_compute_precommitment(
+            signer, seed, 4, PrecommitmentPointer(Precommitment()))),
+        'schnorr_musig_receive_precommitments': at(PRECOMMITTED, lambda signer: (
+            native.schnorr_musig_receive_precommitments(signer, session.precommitments, len(session.precommitments),
+                                                        CommitmentPointer(Commitment())))),
+        'schnorr_musig_receive_commitments': at(COMMITTED, lambda signer: native.schnorr_musig_receive_commitments(
+            signer, session.commitments, len(session.commitments),
+            AggregatedCommitmentPointer(AggregatedCommitment()))),
+        'schnorr_musig_sign': at(AGGREGATED, lambda signer: native.schnorr_musig_sign(
+            signer, private_key, len(private_key), MESSAGE, len(MESSAGE), SignaturePointer(Signature()))),
+        'schnorr_musig_receive_signature_shares': at(SIGNED, lambda signer: (
+            native.schnorr_musig_receive_signature_shares(signer, session.shares, len(session.shares),
+                                                          AggregatedSignaturePointer(AggregatedSignature())))),
+        'schnorr_musig_verify': measure(
+            lambda: native.schnorr_musig_verify(MESSAGE, len(MESSAGE), session.aggregated_public_key,
+                                                STANDARD_ENCODING_LENGTH, session.signature, AGG_SIG_ENCODING_LENGTH),
+            number),
+        'schnorr_musig_verify_keys': measure(
+            lambda: native.schnorr_musig_verify(MESSAGE, len(MESSAGE), keys, len(keys), session.signature,
+                                                AGG_SIG_ENCODING_LENGTH), number),
+    }
+
+
+def bench_sdk(session: Session, number: int) -> Dict:
+    musig = session.musig
+    uncached = SchnorrMusig(key_cache=AggregatedPublicKeyCache(max_size=0), native=musig.native)
+
+    def at(stage: int, call: Callable[[SchnorrMusigSigner], object]) -> Dict:
+        return measure_calls(lambda: session.signer(stage), call, number, lambda signer: signer.revoke())
+
+    return {
+        'SchnorrMusig.create_signer': measure_calls(
+            list, lambda created: created.append(musig.create_signer(session.public_keys, 0)), number,
+            lambda created: created[0].revoke()),
+        'SchnorrMusig.aggregate_public_keys': measure(
+            lambda: uncached.aggregate_public_keys(*session.public_keys), number),
+        'SchnorrMusig.aggregate_public_keys_cached': measure(
+            lambda: musig.aggregate_public_keys(*session.public_keys), number),
+        'SchnorrMusig.verify': measure(
+            lambda: musig.verify(MESSAGE, session.signature, session.aggregated_public_key), number),
+        'SchnorrMusig.verify_keys': measure(
+            lambda: uncached.verify(MESSAGE, session.signature, session.public_keys), number),
+        'SchnorrMusigSigner.compute_precommitment': at(FRESH, lambda signer: signer.compute_precommitment(SEED)),
+        'SchnorrMusigSigner.receive_precommitments': at(
+            PRECOMMITTED, lambda signer: signer.receive_precommitments(session.precommitments)),
+        'SchnorrMusigSigner.receive_commitments': at(
+            COMMITTED, lambda signer: signer.receive_commitments(session.commitments)),
+        'SchnorrMusigSigner.sign': at(AGGREGATED, lambda signer: signer.sign(session.private_keys[0], MESSAGE)),
+        'SchnorrMusigSigner.aggregate_signature': at(
+            SIGNED, lambda signer: signer.aggregate_signature(session.shares)),
+        'SchnorrMusigSigner.verify': at(FRESH, lambda signer: signer.verify(MESSAGE, session.signature)),
+        'SchnorrMusigSigner.revoke': measure_calls(lambda: session.signer(FRESH), lambda signer: signer.revoke(),
+                                                   number),
+    }
+
+
+SDK_TO_NATIVE = {
+    'SchnorrMusig.create_signer': 'schnorr_musig_new_signer',
+    'SchnorrMusig.aggregate_public_keys': 'schnorr_musig_aggregate_pubkeys',
+    'SchnorrMusig.verify': 'schnorr_musig_verify',
+    'SchnorrMusigSigner.compute_precommitment': 'schnorr_musig_compute_precommitment',
+    'SchnorrMusigSigner.receive_precommitments': 'schnorr_musig_receive_precommitments',
+    'SchnorrMusigSigner.receive_commitments': 'schnorr_musig_receive_commitments',
+    'SchnorrMusigSigner.sign': 'schnorr_musig_sign',
+    'SchnorrMusigSigner.aggregate_signature': 'schnorr_musig_receive_signature_shares',
+}
+
+
+def run(quick: bool = False) -> Dict:
+    musig = SchnorrMusig()
+    native = musig.native
+    ffi = measure(lambda: native.schnorr_musig_verify(b'', 0, b'', 0, b'', 0), 100 if quick else 10000)['median']
+
+    results = {'backend': getattr(native, 'backend', CTYPES_BACKEND), 'ffi': ffi, 'participants': {}}
+    for count in QUICK_PARTICIPANTS if quick else PARTICIPANTS:
+        number = max(3, (50 if quick else 2000) // count)
+        session = Session(musig, count)
+        native_results = bench_native(session, native, number)
+        sdk_results = bench_sdk(session, number)
+        for result in native_results.values():
+            result['native'] = max(result['median'] - ffi, 0.0)
+        for name, result in sdk_results.items():
+            if name in SDK_TO_NATIVE:
+                result['python'] = result['median'] - native_results[SDK_TO_NATIVE[name]]['median']
+        results['participants'][count] = {'native': native_results, 'sdk': sdk_results}
+    return results
+
+
+if __name__ == '__main__':
+    emit('calls', run())
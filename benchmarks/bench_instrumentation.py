@@ -0,0 +1,49 @@
+"""Overhead of the instrumentation layer on schnorr_musig_verify: raw handle, wrapped but disabled, and
+wrapped with a MetricsSink.
+
+    python -m benchmarks.bench_instrumentation
+"""
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEY
+from benchmarks.common import PUBLIC_KEY
+from benchmarks.common import SEED
+from benchmarks.common import emit
+from benchmarks.common import measure
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_instrumentation import Instrumentation
+from zksync.sdk.musig.schnorr_musig_instrumentation import InstrumentedNative
+from zksync.sdk.musig.schnorr_musig_instrumentation import MetricsSink
+
+
+def run(quick: bool = False) -> Dict:
+    number = 200 if quick else 5000
+    musig = SchnorrMusig()
+    native = getattr(musig.native, 'native', musig.native)
+    with musig.create_signer([PUBLIC_KEY], 0) as signer:
+        signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment(SEED)))
+        signature = signer.aggregate_signature(signer.sign(PRIVATE_KEY, MESSAGE))
+
+    instrumentation = Instrumentation()
+    instrumented = InstrumentedNative(native, instrumentation)
+
+    def verify(handle):
+        return lambda: handle.schnorr_musig_verify(MESSAGE, len(MESSAGE), PUBLIC_KEY, len(PUBLIC_KEY), signature,
+                                                   len(signature))
+
+    def null(handle):
+        return lambda: handle.schnorr_musig_verify(b'', 0, b'', 0, b'', 0)
+
+    results = {'raw': measure(verify(native), number), 'raw_null': measure(null(native), number),
+               'disabled': measure(verify(instrumented), number), 'disabled_null': measure(null(instrumented), number)}
+    instrumentation.enable(MetricsSink())
+    results['metrics'] = measure(verify(instrumented), number)
+    results['metrics_null'] = measure(null(instrumented), number)
+    results['disabled_overhead'] = results['disabled_null']['median'] - results['raw_null']['median']
+    results['metrics_overhead'] = results['metrics_null']['median'] - results['raw_null']['median']
+    return results
+
+
+if __name__ == '__main__':
+    emit('instrumentation', run())
@@ -0,0 +1,58 @@
+"""Verify cost per row for data held in NumPy arrays.
+
+* rows: each row converted to bytes, then SchnorrMusig.verify_batch;
+* columnar: verify_array on the arrays as they are.
+
+    python -m benchmarks.bench_numpy
+"""
+import time
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEYS
+from benchmarks.common import PUBLIC_KEYS
+from benchmarks.common import emit
+from zksync.sdk.musig import schnorr_musig_numpy
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+
+ROWS = [1000, 100000]
+QUICK_ROWS = [1000]
+
+
+def per_row(call, rows: int) -> float:
+    start = time.perf_counter()
+    call()
+    return (time.perf_counter() - start) / rows
+
+
+def run(quick: bool = False) -> Dict:
+    if not schnorr_musig_numpy.is_available():
+        return {'skipped': 'numpy is not installed'}
+    numpy = schnorr_musig_numpy.numpy
+
+    musig = SchnorrMusig()
+    signature = SigningGroup(musig, PUBLIC_KEYS, PRIVATE_KEYS).sign(MESSAGE).signature
+    aggregated_public_key = musig.aggregate_public_keys(*PUBLIC_KEYS)
+
+    results = {}
+    for rows in QUICK_ROWS if quick else ROWS:
+        messages = numpy.frombuffer(MESSAGE * rows, dtype=numpy.uint8).reshape(rows, -1)
+        signatures = numpy.frombuffer(signature * rows, dtype=numpy.uint8).reshape(rows, -1)
+        keys = numpy.frombuffer(aggregated_public_key * rows, dtype=numpy.uint8).reshape(rows, -1)
+
+        def rows_call():
+            items = [(bytes(message), bytes(row), bytes(key))
+                     for message, row, key in zip(messages, signatures, keys)]
+            return musig.verify_batch(items)
+
+        results[rows] = {
+            'rows': per_row(rows_call, rows),
+            'columnar': per_row(lambda: schnorr_musig_numpy.verify_array(musig, messages, signatures, keys), rows),
+        }
+        results[rows]['speedup'] = results[rows]['rows'] / results[rows]['columnar']
+    return results
+
+
+if __name__ == '__main__':
+    emit('numpy', run())
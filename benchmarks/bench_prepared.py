@@ -0,0 +1,47 @@
+"""One key set, many messages: verify cost per call for each way of passing the key.
+
+* keys: the key list, aggregated on every call (no cache);
+* keys_cached: the key list through the aggregated key cache;
+* aggregated: the aggregated key bytes;
+* prepared: a PreparedPublicKey.
+
+    python -m benchmarks.bench_prepared
+"""
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEYS
+from benchmarks.common import PUBLIC_KEYS
+from benchmarks.common import emit
+from benchmarks.common import measure
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_cache import AggregatedPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+
+KEY_COUNTS = [1, len(PUBLIC_KEYS)]
+
+
+def run(quick: bool = False) -> Dict:
+    musig = SchnorrMusig()
+    uncached = SchnorrMusig(key_cache=AggregatedPublicKeyCache(max_size=0), native=musig.native)
+    number = 200 if quick else 20000
+
+    results = {}
+    for count in KEY_COUNTS:
+        public_keys = PUBLIC_KEYS[:count]
+        signature = SigningGroup(musig, public_keys, PRIVATE_KEYS[:count]).sign(MESSAGE).signature
+        aggregated_public_key = musig.aggregate_public_keys(*public_keys)
+        prepared = musig.prepare_public_key(*public_keys)
+        results[count] = {
+            'keys': measure(lambda: uncached.verify(MESSAGE, signature, public_keys), number),
+            'keys_cached': measure(lambda: musig.verify(MESSAGE, signature, public_keys), number),
+            'aggregated': measure(lambda: musig.verify(MESSAGE, signature, aggregated_public_key), number),
+            'prepared': measure(lambda: musig.verify(MESSAGE, signature, prepared), number),
+        }
+        results[count]['prepared_saving'] = results[count]['keys_cached']['median'] - \
+            results[count]['prepared']['median']
+    return results
+
+
+if __name__ == '__main__':
+    emit('prepared', run())
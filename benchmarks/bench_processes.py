@@ -0,0 +1,57 @@
+"""Verify and signing throughput of MusigProcessPool as the worker count grows.
+
+Workers are started and attached to the native library before timing, so the numbers exclude
+process start-up. Throughput should scale close to linearly up to the number of cores.
+
+    python -m benchmarks.bench_processes
+"""
+import os
+import time
+from typing import Callable
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEYS
+from benchmarks.common import PUBLIC_KEYS
+from benchmarks.common import emit
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+from zksync.sdk.musig.schnorr_musig_process import MusigProcessPool
+
+WORKERS = [1, 2, 4, 8, 16]
+QUICK_WORKERS = [1, 2]
+
+
+def throughput(call: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    call()
+    return count / (time.perf_counter() - start)
+
+
+def run(quick: bool = False) -> Dict:
+    musig = SchnorrMusig()
+    aggregated_public_key = musig.aggregate_public_keys(*PUBLIC_KEYS)
+    signature = SigningGroup(musig, PUBLIC_KEYS, PRIVATE_KEYS).sign(MESSAGE).signature
+    items = [(MESSAGE, signature, aggregated_public_key)] * (400 if quick else 40000)
+    messages = [MESSAGE] * (16 if quick else 2000)
+    cpus = os.cpu_count() or 1
+
+    results = {'cpus': cpus, 'workers': {}}
+    for workers in [count for count in (QUICK_WORKERS if quick else WORKERS) if count <= max(cpus, 2)]:
+        with MusigProcessPool(musig, max_workers=workers) as pool:
+            pool.verify_batch(items[:workers * 4])
+            results['workers'][workers] = {
+                'verify_per_second': throughput(lambda: pool.verify_batch(items), len(items)),
+                'sessions_per_second': throughput(lambda: pool.sign_all(PUBLIC_KEYS, PRIVATE_KEYS, messages),
+                                                  len(messages)),
+            }
+    single = results['workers'][1]
+    for workers, result in results['workers'].items():
+        result['verify_speedup'] = result['verify_per_second'] / single['verify_per_second']
+        result['sessions_speedup'] = result['sessions_per_second'] / single['sessions_per_second']
+        result['efficiency'] = result['verify_speedup'] / workers
+    return results
+
+
+if __name__ == '__main__':
+    emit('processes', run())
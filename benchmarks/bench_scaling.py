@@ -0,0 +1,95 @@
+"""Wall time and peak Python memory of each round for one participant, from 2 to 10,000 participants.
+
+A participant's cost at committee size N is measured on a single signer at position 0. The other
+positions echo its own round messages, which the native rounds accept, so every round processes
+N inputs without running N signers in-process (that would be quadratic in N). The aggregated
+signature this produces does not verify; the verify step still aggregates and checks all N keys.
+
+Peak memory is taken with tracemalloc in a separate run and covers allocations made by Python
+only, e.g. key and payload joins, not memory allocated inside the native library.
+
+    python -m benchmarks.bench_scaling
+"""
+import statistics
+import time
+import tracemalloc
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEYS
+from benchmarks.common import PUBLIC_KEYS
+from benchmarks.common import SEED
+from benchmarks.common import emit
+from benchmarks.common import participants
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_buffer import join
+from zksync.sdk.musig.schnorr_musig_cache import AggregatedPublicKeyCache
+
+PARTICIPANTS = [2, 10, 100, 1000, 10000]
+QUICK_PARTICIPANTS = [2, 10, 100]
+
+ROUNDS = ('join', 'aggregate_public_keys', 'create', 'precommit', 'commit', 'aggregate_commitment', 'sign',
+          'aggregate', 'verify')
+
+
+def session(musig: SchnorrMusig, public_keys: List[bytes], trace: bool) -> Dict[str, Tuple[float, int]]:
+    """Runs every round once and returns (seconds, peak traced bytes) per round."""
+    count = len(public_keys)
+    steps: Dict[str, Tuple[float, int]] = {}
+
+    def step(name: str, fn: Callable[[], object]):
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        steps[name] = (elapsed, peak if trace else 0)
+        return result
+
+    encoded_public_keys = step('join', lambda: join(public_keys))
+    step('aggregate_public_keys', lambda: musig.aggregate_encoded_public_keys(encoded_public_keys))
+    signer = step('create', lambda: musig.create_signer(public_keys, 0))
+    try:
+        precommitment = step('precommit', lambda: signer.compute_precommitment(SEED))
+        precommitments = precommitment * count
+        commitment = step('commit', lambda: signer.receive_precommitments(precommitments))
+        commitments = commitment * count
+        step('aggregate_commitment', lambda: signer.receive_commitments(commitments))
+        shares = step('sign', lambda: signer.sign(PRIVATE_KEYS[0], MESSAGE)) * count
+        signature = step('aggregate', lambda: signer.aggregate_signature(shares))
+    finally:
+        signer.revoke()
+    step('verify', lambda: musig.verify_code(MESSAGE, signature, public_keys))
+    return steps
+
+
+def run(quick: bool = False) -> Dict:
+    musig = SchnorrMusig(key_cache=AggregatedPublicKeyCache(max_size=0))
+    repeat = 1 if quick else 3
+
+    results = {}
+    for count in QUICK_PARTICIPANTS if quick else PARTICIPANTS:
+        public_keys = [PUBLIC_KEYS[index] for index in participants(count)]
+        runs = [session(musig, public_keys, trace=False) for _ in range(repeat)]
+        traced = session(musig, public_keys, trace=True)
+
+        rounds = {name: {'time': statistics.median(run[name][0] for run in runs), 'peak_memory': traced[name][1]}
+                  for name in ROUNDS}
+        total = sum(entry['time'] for entry in rounds.values())
+        results[count] = {
+            'rounds': rounds,
+            'total': total,
+            'per_participant': total / count,
+            'peak_memory': max(entry['peak_memory'] for entry in rounds.values()),
+        }
+    return results
+
+
+if __name__ == '__main__':
+    emit('scaling', run())
@@ -0,0 +1,31 @@
+"""Cost of constructing SchnorrMusig with a cold and a warm native handle cache.
+
+    python -m benchmarks.bench_startup
+"""
+import ctypes.util
+import time
+from typing import Dict
+
+from benchmarks.common import emit
+from benchmarks.common import measure
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_native import LIBRARY_NAME
+from zksync.sdk.musig.schnorr_musig_native import SchnorrMusigLoader
+
+
+def run(quick: bool = False) -> Dict:
+    number = 100 if quick else 1000
+    SchnorrMusigLoader.reset()
+    start = time.perf_counter()
+    SchnorrMusig()
+    cold = time.perf_counter() - start
+
+    return {
+        'find_library': measure(lambda: ctypes.util.find_library(LIBRARY_NAME), number=5, repeat=3),
+        'construct_cold': cold,
+        'construct_warm': measure(SchnorrMusig, number),
+    }
+
+
+if __name__ == '__main__':
+    emit('startup', run())
@@ -0,0 +1,65 @@
+"""Throughput of stateless verification and of whole signing sessions as the thread count grows.
+
+Native calls release the GIL, so verify throughput should scale with cores until Python-side
+marshalling dominates.
+
+    python -m benchmarks.bench_threads
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+
+from benchmarks.common import MESSAGE
+from benchmarks.common import PRIVATE_KEY
+from benchmarks.common import PUBLIC_KEY
+from benchmarks.common import emit
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+
+THREADS = [1, 2, 4, 8, 16]
+QUICK_THREADS = [1, 2, 4]
+
+
+def session(musig: SchnorrMusig) -> bytes:
+    with musig.create_signer([PUBLIC_KEY], 0) as signer:
+        signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment()))
+        return signer.aggregate_signature(signer.sign(PRIVATE_KEY, MESSAGE))
+
+
+def throughput(call: Callable[[], object], threads: int, calls: int) -> float:
+    def worker(count: int) -> None:
+        for _ in range(count):
+            call()
+
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        for future in [executor.submit(worker, calls // threads) for _ in range(threads)]:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return (calls // threads) * threads / elapsed
+
+
+def run(quick: bool = False) -> Dict:
+    musig = SchnorrMusig()
+    aggregated_public_key = musig.aggregate_public_keys(PUBLIC_KEY)
+    signature = session(musig)
+    calls = 400 if quick else 20000
+    sessions = 40 if quick else 2000
+
+    results = {'cpus': os.cpu_count(), 'threads': {}}
+    for threads in QUICK_THREADS if quick else THREADS:
+        results['threads'][threads] = {
+            'verify_per_second': throughput(lambda: musig.verify(MESSAGE, signature, aggregated_public_key),
+                                            threads, calls),
+            'sessions_per_second': throughput(lambda: session(musig), threads, sessions),
+        }
+    single = results['threads'][1]
+    for result in results['threads'].values():
+        result['verify_speedup'] = result['verify_per_second'] / single['verify_per_second']
+        result['sessions_speedup'] = result['sessions_per_second'] / single['sessions_per_second']
+    return results
+
+
+if __name__ == '__main__':
+    emit('threads', run())
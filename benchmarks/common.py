@@ -0,0 +1,72 @@
+import json
+import statistics
+import sys
+import time
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar('T')
+
+PUBLIC_KEY = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+PRIVATE_KEY = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+SEED = bytes.fromhex('a7410000f13ad610d9acb7602a0cb53a')
+MESSAGE = 'hello'.encode()
+
+PUBLIC_KEYS = [bytes.fromhex(key) for key in [
+    '179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d',
+    '0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f',
+    'ceafd8cb15a100e7ad0de3d73f7dcce8b9e3243cb7dbd64e3b0b0a799a93b388',
+    '3f063eeb28b912a059fc8a8c6421ec59cd2d8f2a19402b097d78df8a3864f70f',
+    '286b404714db86751d925c76cf77070997e488659c4abf74cc729a3711bc1ba4']]
+PRIVATE_KEYS = [bytes.fromhex(key) for key in [
+    '011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c',
+    '05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33',
+    '03cd8947a90f73a875623574f8e0e3d3c6abd8f9367ba54433ed02b7a62533d9',
+    '02556c232cfb6c8274ac7e2e55fe1f87b6dee119bf62a3c784102de6c25c2512',
+    '01791089b53bee682147ecbc5e26325329a21c894a6205876c58798d1c268ae4']]
+
+
+def participants(count: int) -> List[int]:
+    """Indices into PUBLIC_KEYS/PRIVATE_KEYS for a committee of `count` signers.
+
+    Only five key pairs are known, so larger committees reuse them cyclically; the native
+    cost per participant does not depend on the keys being distinct.
+    """
+    return [index % len(PUBLIC_KEYS) for index in range(count)]
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    return {'best': min(timings), 'median': statistics.median(timings), 'number': len(timings)}
+
+
+def measure(fn: Callable[[], object], number: int = 1000, repeat: int = 5) -> Dict[str, float]:
+    """Returns per-call timings of fn in seconds over `repeat` runs of `number` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return {'best': min(timings), 'median': statistics.median(timings), 'number': number, 'repeat': repeat}
+
+
+def measure_calls(prepare: Callable[[], T], call: Callable[[T], object], number: int,
+                  cleanup: Optional[Callable[[T], object]] = None) -> Dict[str, float]:
+    """Times `call` alone on fresh state from `prepare` for each of `number` calls."""
+    timings = []
+    for _ in range(number):
+        state = prepare()
+        start = time.perf_counter()
+        call(state)
+        timings.append(time.perf_counter() - start)
+        if cleanup is not None:
+            cleanup(state)
+    return summarize(timings)
+
+
+def emit(name: str, results: Dict) -> None:
+    json.dump({'benchmark': name, 'python': sys.version.split()[0], 'results': results}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
@@ -0,0 +1,62 @@
+"""Runs the benchmark suite and writes one JSON document with every result.
+
+    python -m benchmarks.runner [--quick] [--output FILE] [NAME ...]
+
+NAME selects benchmarks/bench_NAME.py modules; all of them run by default.
+"""
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import sys
+import time
+from typing import List
+from typing import Optional
+
+import benchmarks
+
+PREFIX = 'bench_'
+
+
+def available() -> List[str]:
+    return sorted(module.name[len(PREFIX):] for module in pkgutil.iter_modules(benchmarks.__path__)
+                  if module.name.startswith(PREFIX))
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='bench', description='Run the schnorr-musig benchmark suite.')
+    parser.add_argument('names', nargs='*', metavar='NAME', help='benchmarks to run: ' + ', '.join(available()))
+    parser.add_argument('--quick', action='store_true', help='fewer iterations and participant counts')
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    options = parser.parse_args(args)
+
+    unknown = set(options.names) - set(available())
+    if unknown:
+        parser.error('unknown benchmarks: ' + ', '.join(sorted(unknown)))
+
+    report = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'quick': options.quick,
+        'benchmarks': {},
+    }
+    for name in options.names or available():
+        module = importlib.import_module(benchmarks.__name__ + '.' + PREFIX + name)
+        start = time.perf_counter()
+        report['benchmarks'][name] = {'results': module.run(quick=options.quick),
+                                      'elapsed': time.perf_counter() - start}
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
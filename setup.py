@@ -40,6 +40,8 @@ sys.path.insert(0, os.path.abspath('.'))
 CODE_DIRECTORY = 'zksync'
 DOCS_DIRECTORY = 'docs'
 TESTS_DIRECTORY = 'tests'
+BENCHMARKS_DIRECTORY = 'benchmarks'
+CFFI_BUILD_SCRIPT = os.path.join(CODE_DIRECTORY, 'sdk', 'musig', 'schnorr_musig_cffi_build.py')
 PYTEST_FLAGS = ['--doctest-modules']
 
 # Import metadata. Normally this would just be:
@@ -228,16 +230,23 @@ setup_dict = dict(
     url=metadata.url,
     description=metadata.description,
     long_description=read('README.md'),
-    packages=find_packages(exclude=(TESTS_DIRECTORY,)),
+    packages=find_packages(exclude=(TESTS_DIRECTORY, BENCHMARKS_DIRECTORY, BENCHMARKS_DIRECTORY + '.*')),
     install_requires=[req.strip() for req in read("requirements.txt").splitlines() if req.strip()],
     # Allow tests to be run with `python setup.py test'.
     tests_require=[req.strip() for req in read("requirements-dev.txt").splitlines() if req.strip()],
     cmdclass={'test': TestAllCommand},
     zip_safe=False,  # don't use eggs
     include_package_data=True,
-    package_data={'': ['zksync/config/*.yaml']}
+    package_data={'': ['zksync/config/*.yaml']},
+    extras_require={'cffi': ['cffi>=1.14'], 'numpy': ['numpy>=1.17']},
 )
 
+# The cffi binding links against libmusig_c at build time, so it is only built on request.
+if os.environ.get('ZKSYNC_MUSIG_CFFI'):
+  setup_dict.update(
+      setup_requires=['cffi>=1.14'],
+      cffi_modules=[CFFI_BUILD_SCRIPT + ':ffibuilder'])
+
 
 def main():
   setup(**setup_dict)
@@ -1,4 +1,12 @@
+import pytest
+
 from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_cache import AggregatedPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_cache import ValidPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_cache import VerificationCache
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigInvalidKeyError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
 
 
 class TestSchnorrMusig:
@@ -77,3 +85,174 @@ class TestSchnorrMusig:
         assert musig.verify(TestSchnorrMusig.MSG, aggregated_signatures[0], aggregated_public_key)
         for signer in signers:
             assert signer.verify(TestSchnorrMusig.MSG, aggregated_signatures[0])
+
+    def test_verify_batch(self):
+        private_key = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig()
+        signer = musig.create_signer([public_key], 0)
+        precommitment = signer.compute_precommitment(TestSchnorrMusig.SEED)
+        commitment = signer.receive_precommitments(precommitment)
+        signer.receive_commitments(commitment)
+        signature = signer.aggregate_signature(signer.sign(private_key, TestSchnorrMusig.MSG))
+
+        items = [(TestSchnorrMusig.MSG, signature, public_key),
+                 (TestSchnorrMusig.MSG, signature, [public_key]),
+                 ('bye'.encode(), signature, public_key),
+                 (TestSchnorrMusig.MSG, signature, public_key[:16])] * 8
+
+        result = musig.verify_batch(items, max_workers=4)
+        assert len(result) == len(items)
+        assert result.results == [True, True, False, False] * 8
+        assert not result.all_valid
+        assert sorted(result.errors) == list(range(3, len(items), 4))
+        assert not musig.verify_all(items, max_workers=4)
+        assert musig.verify_all(items[:2] * 16, max_workers=4)
+
+        malformed = [(TestSchnorrMusig.MSG, signature, None), (TestSchnorrMusig.MSG, 42, public_key),
+                     (TestSchnorrMusig.MSG, signature)]
+        result = musig.verify_batch(items[:1] + malformed, max_workers=2)
+        assert result.codes == [MusigRes.OK] + [MusigRes.INVALID_INPUT_DATA] * 3
+        assert not musig.verify_all(malformed)
+
+    def test_aggregated_public_key_cache(self):
+        public_keys = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d'),
+                       bytes.fromhex('0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f')]
+
+        musig = SchnorrMusig(key_cache=AggregatedPublicKeyCache())
+        aggregated_public_key = musig.aggregate_public_keys(*public_keys)
+        assert (musig.key_cache.hits, musig.key_cache.misses) == (0, 1)
+
+        signers = [musig.create_signer(public_keys, index) for index in range(len(public_keys))]
+        for signer in signers:
+            assert signer.aggregated_public_key == aggregated_public_key
+            signer.revoke()
+        assert (musig.key_cache.hits, musig.key_cache.misses) == (2, 1)
+
+        musig.invalidate_public_keys(*public_keys)
+        assert musig.aggregate_public_keys(*public_keys) == aggregated_public_key
+        assert musig.key_cache.misses == 2
+
+    def test_buffers(self):
+        private_key = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig()
+        signer = musig.create_signer([public_key], 0)
+        rounds = bytearray(32 * 4 + 64)
+        view = memoryview(rounds)
+
+        assert signer.compute_precommitment(TestSchnorrMusig.SEED, out=view[0:32]) is not None
+        assert '93ae6e6df739d76c088755078ed857e95119909c97bdd5cdc8aa12286abc0984' == rounds[0:32].hex()
+
+        signer.receive_precommitments(view[0:32], out=view[32:64])
+        assert 'a18005f171a323d022a625e71aa53864ca6d1851a1fc50585b7627fba3f6c69f' == rounds[32:64].hex()
+
+        signer.receive_commitments(bytes(rounds[32:64]), out=view[64:96])
+        signer.sign(bytearray(private_key), memoryview(TestSchnorrMusig.MSG), out=view[96:128])
+        assert '02bae431c052b9e4f7c9b511904a577c7ba5e035625879d5253440793337f7ff' == rounds[96:128].hex()
+
+        signer.aggregate_signature(view[96:128], out=view[128:192])
+        assert musig.verify(TestSchnorrMusig.MSG, view[128:192], memoryview(public_key))
+        assert signer.verify(bytearray(TestSchnorrMusig.MSG), bytes(rounds[128:192]))
+        signer.revoke()
+
+    def test_precommitments(self):
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig()
+        seed = TestSchnorrMusig.SEED
+        seeds = [seed, bytearray(seed), memoryview(b'\x00' + seed)[1:]]
+        precommitments = []
+        for seed in seeds:
+            with musig.create_signer([public_key], 0) as signer:
+                precommitments.append(signer.compute_precommitment(seed))
+        assert len(set(precommitments)) == 1
+
+        with musig.create_signer([public_key], 0) as signer:
+            for seed in [b'', TestSchnorrMusig.SEED + b'\x01']:
+                with pytest.raises(SchnorrMusigError) as error:
+                    signer.compute_precommitment(seed)
+                assert error.value.code == MusigRes.INVALID_SEED
+
+        signers = [musig.create_signer([public_key], 0) for _ in range(3)]
+        precommitments = musig.compute_precommitments(signers)
+        assert len(precommitments) == 32 * 3
+        assert len({precommitments[index * 32:(index + 1) * 32] for index in range(3)}) == 3
+        for signer in signers:
+            signer.revoke()
+
+    def test_verification_cache(self):
+        private_key = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig(verification_cache=VerificationCache())
+        signer = musig.create_signer([public_key], 0)
+        signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment(TestSchnorrMusig.SEED)))
+        signature = signer.aggregate_signature(signer.sign(private_key, TestSchnorrMusig.MSG))
+
+        assert musig.verify(TestSchnorrMusig.MSG, signature, public_key)
+        assert musig.verify(TestSchnorrMusig.MSG, signature, public_key)
+        assert not musig.verify(b'other', signature, public_key)
+        assert not musig.verify(b'other', signature, public_key)
+        assert (musig.verification_cache.hits, musig.verification_cache.misses) == (1, 3)
+
+        assert signer.verify(TestSchnorrMusig.MSG, signature)
+        hits = musig.verification_cache.hits
+        assert signer.verify(TestSchnorrMusig.MSG, signature)
+        assert musig.verification_cache.hits == hits + 1
+        signer.revoke()
+
+    def test_prepared_public_key(self):
+        private_key = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig()
+        prepared = musig.prepare_public_key(public_key)
+        assert prepared.aggregated_public_key == musig.aggregate_public_keys(public_key)
+
+        with musig.create_signer([public_key], 0) as signer:
+            signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment()))
+            signature = signer.aggregate_signature(signer.sign(private_key, TestSchnorrMusig.MSG))
+
+        assert musig.verify(TestSchnorrMusig.MSG, signature, prepared)
+        assert not musig.verify(b'other', signature, prepared)
+        items = [(TestSchnorrMusig.MSG, signature, prepared), (b'other', signature, prepared)]
+        assert musig.verify_batch(items * 3, max_workers=2).results == [True, False] * 3
+
+        with pytest.raises(SchnorrMusigError):
+            musig.prepare_public_key(b'\xff' * 32)
+
+    def test_validate_public_keys(self):
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+        invalid_key = b'\xff' * 32
+
+        musig = SchnorrMusig(valid_key_cache=ValidPublicKeyCache())
+        keys = [public_key, invalid_key, public_key[:16]] * 100
+        result = musig.validate_public_keys(keys, max_workers=4)
+        assert not result.all_valid
+        assert sorted(result.invalid) == [index for index in range(300) if index % 3]
+        assert result.invalid[2] == MusigRes.INVALID_PUBKEY_LENGTH
+        assert list(result)[:3] == [True, False, False]
+        assert len(musig.valid_key_cache) == 1
+
+        misses = musig.valid_key_cache.misses
+        assert musig.validate_public_keys([public_key] * 10).all_valid
+        assert musig.valid_key_cache.misses == misses
+
+        with pytest.raises(SchnorrMusigInvalidKeyError) as e:
+            musig.aggregate_public_keys(invalid_key, public_key)
+        assert list(e.value.invalid) == [0]
+
+    def test_create_signer_errors(self):
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig()
+        with pytest.raises(SchnorrMusigError) as e:
+            musig.create_signer([public_key], 1)
+        assert e.value.code == MusigRes.INVALID_PARTICIPANT_POSITION
+
+        with pytest.raises(SchnorrMusigError) as e:
+            musig.create_signer([public_key[:16]], 0)
+        assert e.value.code == MusigRes.INVALID_PUBKEY_LENGTH
@@ -0,0 +1,87 @@
+import multiprocessing
+import os
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_archive import ARCHIVE_HEADER
+from zksync.sdk.musig.schnorr_musig_archive import RECORD
+from zksync.sdk.musig.schnorr_musig_archive import SignatureArchive
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+
+
+def _append(path, worker):
+    with SignatureArchive(path, fsync=False) as archive:
+        for index in range(50):
+            archive.append(f'{worker}-{index}'.encode(), bytes([worker]) * 32, bytes([index]) * 64)
+
+
+class TestSignatureArchive:
+    KEY = b'\x09' * 32
+
+    def test_append_and_get(self, tmp_path):
+        with SignatureArchive(str(tmp_path / 'signatures')) as archive:
+            assert archive.append(b'first', self.KEY, b'\x01' * 64) == 0
+            assert archive.extend([(b'second', self.KEY, b'\x02' * 64), (b'', self.KEY, b'\x03' * 64)]) == 2
+            assert archive.append(b'first', self.KEY, b'\x04' * 64) == 3
+
+            record = archive.get(b'first')
+            assert (record.index, bytes(record.signature), bytes(record.message)) == (3, b'\x04' * 64, b'first')
+            assert bytes(archive.get_digest(SignatureArchive.digest(b'')).signature) == b'\x03' * 64
+            assert b'missing' not in archive
+            assert [bytes(record.message) for record in archive] == [b'first', b'second', b'', b'first']
+            assert isinstance(record.signature, memoryview)
+
+            with pytest.raises(ValueError):
+                archive.append(b'third', self.KEY, b'\x01' * 32)
+
+    def test_torn_and_corrupt_records(self, tmp_path):
+        path = str(tmp_path / 'signatures')
+        with SignatureArchive(path) as archive:
+            archive.extend([(f'message {index}'.encode(), self.KEY, b'\x01' * 64) for index in range(3)])
+
+        with open(path, 'r+b') as file:
+            file.seek(ARCHIVE_HEADER.size + RECORD.size + 40)
+            file.write(b'\xff')
+            file.seek(0, os.SEEK_END)
+            file.write(b'\x00' * 10)
+
+        with SignatureArchive(path) as archive:
+            assert (len(archive), archive.corrupt) == (2, 1)
+            assert archive.get(b'message 1') is None
+            assert archive.append(b'message 3', self.KEY, b'\x01' * 64) == 3
+            assert archive.get(b'message 3').index == 3
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / 'signatures'
+        path.write_bytes(b'not a signature archive')
+        with pytest.raises(ValueError):
+            SignatureArchive(str(path))
+
+    def test_concurrent_processes(self, tmp_path):
+        path = str(tmp_path / 'signatures')
+        processes = [multiprocessing.Process(target=_append, args=(path, worker)) for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        with SignatureArchive(path) as archive:
+            assert (len(archive), archive.corrupt) == (200, 0)
+            for worker in range(4):
+                record = archive.get(f'{worker}-49'.encode())
+                assert bytes(record.aggregated_public_key) == bytes([worker]) * 32
+
+    def test_verify(self, tmp_path):
+        public_keys = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')]
+        private_keys = [bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')]
+        musig = SchnorrMusig()
+        aggregated_public_key = musig.aggregate_public_keys(*public_keys)
+        messages = [f'message {index}'.encode() for index in range(4)]
+        signatures = [SigningGroup(musig, public_keys, private_keys).sign(message).signature for message in messages]
+
+        with SignatureArchive(str(tmp_path / 'signatures')) as archive:
+            archive.extend((message, aggregated_public_key, signature)
+                           for message, signature in zip(messages, signatures))
+            archive.append(b'other', aggregated_public_key, signatures[0])
+            assert archive.verify(musig, max_workers=2).results == [True] * 4 + [False]
@@ -0,0 +1,66 @@
+import asyncio
+import gc
+
+from zksync.sdk.musig.schnorr_musig_async import AsyncSchnorrMusig
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+
+class TestAsyncSchnorrMusig:
+    SEED = bytes.fromhex('a7410000f13ad610d9acb7602a0cb53a')
+    MSG = 'hello'.encode()
+    PRIVATE_KEYS = [bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c'),
+                    bytes.fromhex('05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33')]
+    PUBLIC_KEYS = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d'),
+                   bytes.fromhex('0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f')]
+
+    def setup_method(self):
+        gc.collect()
+
+    def test_session(self):
+        async def session():
+            async with AsyncSchnorrMusig(max_workers=2) as musig:
+                signers = [await musig.create_signer(self.PUBLIC_KEYS, index) for index in range(2)]
+                precommitments = await asyncio.gather(*[signer.compute_precommitment(self.SEED)
+                                                        for signer in signers])
+                commitments = await asyncio.gather(*[signer.receive_precommitments(*precommitments)
+                                                     for signer in signers])
+                await asyncio.gather(*[signer.receive_commitments(*commitments) for signer in signers])
+                shares = await asyncio.gather(*[signer.sign(private_key, self.MSG)
+                                                for signer, private_key in zip(signers, self.PRIVATE_KEYS)])
+                signatures = await asyncio.gather(*[signer.aggregate_signature(*shares) for signer in signers])
+                assert signatures[0] == signatures[1]
+
+                assert await musig.verify(self.MSG, signatures[0], self.PUBLIC_KEYS)
+                assert await signers[0].verify(self.MSG, signatures[0])
+                items = [(self.MSG, signatures[0], self.PUBLIC_KEYS),
+                         ('bye'.encode(), signatures[0], self.PUBLIC_KEYS)]
+                assert (await musig.verify_batch(items * 4)).results == [True, False] * 4
+                assert not await musig.verify_all(items * 4)
+                assert await musig.verify_all(items[:1] * 4)
+
+                for signer in signers:
+                    signer.revoke()
+                assert all(signer.revoked for signer in signers)
+
+        asyncio.run(session())
+
+    def test_cancelled_session_frees_signer(self):
+        live = SchnorrMusigSigner.live_handles()
+
+        async def session(musig: AsyncSchnorrMusig, started: asyncio.Event):
+            async with await musig.create_signer(self.PUBLIC_KEYS, 0) as signer:
+                started.set()
+                await signer.compute_precommitment(self.SEED)
+                await asyncio.sleep(60)
+
+        async def main():
+            async with AsyncSchnorrMusig(max_workers=1) as musig:
+                started = asyncio.Event()
+                task = asyncio.ensure_future(session(musig, started))
+                await started.wait()
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                assert task.cancelled()
+
+        asyncio.run(main())
+        assert SchnorrMusigSigner.live_handles() == live
@@ -0,0 +1,26 @@
+from zksync.sdk.musig.schnorr_musig_batch import BatchVerificationResult
+from zksync.sdk.musig.schnorr_musig_batch import chunk_ranges
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+
+class TestSchnorrMusigBatch:
+
+    def test_chunk_ranges(self):
+        assert chunk_ranges(0, 4) == []
+        assert chunk_ranges(3, 4) == [(0, 1), (1, 2), (2, 3)]
+
+        ranges = chunk_ranges(1000, 4)
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 1000
+        assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    def test_result(self):
+        result = BatchVerificationResult([MusigRes.OK, MusigRes.SIGNATURE_VERIFICATION_FAILED,
+                                          MusigRes.INVALID_PUBKEY_LENGTH])
+        assert result.results == [True, False, False]
+        assert list(result) == [True, False, False]
+        assert result[0] and not result[1]
+        assert not result.all_valid
+        assert list(result.errors) == [2]
+        assert result.errors[2].code == MusigRes.INVALID_PUBKEY_LENGTH
+        assert BatchVerificationResult([MusigRes.OK, MusigRes.OK]).all_valid
@@ -0,0 +1,53 @@
+import ctypes
+import mmap
+import tempfile
+
+from zksync.sdk.musig.schnorr_musig_buffer import ByteBuffer
+from zksync.sdk.musig.schnorr_musig_buffer import join
+from zksync.sdk.musig.schnorr_musig_buffer import nbytes
+from zksync.sdk.musig.schnorr_musig_buffer import output
+from zksync.sdk.musig.schnorr_musig_native import Commitment
+
+
+def address(data) -> int:
+    parameter = ByteBuffer.from_param(data)
+    return ctypes.cast(getattr(parameter, '_as_parameter_', parameter), ctypes.c_void_p).value
+
+
+class TestSchnorrMusigBuffer:
+
+    def test_writable_buffers_are_not_copied(self):
+        data = bytearray(b'\x01' * 64)
+        array = (ctypes.c_ubyte * 64).from_buffer(data)
+        assert address(data) == ctypes.addressof(array)
+        assert address(memoryview(data)[32:]) == ctypes.addressof(array) + 32
+
+    def test_read_only_buffers_are_not_copied(self):
+        data = b'\x01' * 64
+        view = memoryview(data)
+        assert address(view[32:]) == address(view) + 32
+
+        with tempfile.TemporaryFile() as f:
+            f.write(data)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                assert address(mapped)
+                assert nbytes(mapped) == 64
+
+    def test_addresses_are_passed_through(self):
+        data = bytearray(b'\x01' * 64)
+        pointer = ctypes.c_void_p(ctypes.addressof((ctypes.c_ubyte * 64).from_buffer(data)) + 32)
+        assert ByteBuffer.from_param(pointer) is pointer
+        assert address(pointer) == address(memoryview(data)[32:])
+
+    def test_join(self):
+        packed = memoryview(b'\x01' * 64)
+        assert join([packed]) is packed
+        assert join([b'\x01' * 32, bytearray(b'\x02' * 32)]) == b'\x01' * 32 + b'\x02' * 32
+
+    def test_output(self):
+        out = bytearray(40)
+        commitment = output(Commitment, memoryview(out)[8:])
+        commitment.data[0] = 7
+        assert out[8] == 7
+        assert isinstance(output(Commitment), Commitment)
@@ -0,0 +1,120 @@
+from zksync.sdk.musig.schnorr_musig_cache import AggregatedPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_cache import VERIFICATION_ENTRY_SIZE
+from zksync.sdk.musig.schnorr_musig_cache import ValidPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_cache import VerificationCache
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+
+class TestAggregatedPublicKeyCache:
+    KEYS = [bytes([index]) * 32 for index in range(3)]
+
+    def test_get_or_compute(self):
+        cache = AggregatedPublicKeyCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return b'\x01' * 32
+
+        assert cache.get_or_compute(b''.join(self.KEYS), compute) == b'\x01' * 32
+        assert cache.get_or_compute(b''.join(self.KEYS), compute) == b'\x01' * 32
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+
+    def test_order_matters(self):
+        cache = AggregatedPublicKeyCache()
+        cache.put(b''.join(self.KEYS), b'\x01' * 32)
+        assert b''.join(reversed(self.KEYS)) not in cache
+
+    def test_eviction(self):
+        cache = AggregatedPublicKeyCache(max_size=2)
+        for key in self.KEYS:
+            cache.put(key, key)
+        assert len(cache) == 2
+        assert self.KEYS[0] not in cache
+
+        cache.get(self.KEYS[1])
+        cache.put(self.KEYS[0], self.KEYS[0])
+        assert self.KEYS[1] in cache
+        assert self.KEYS[2] not in cache
+
+    def test_invalidate(self):
+        cache = AggregatedPublicKeyCache()
+        for key in self.KEYS:
+            cache.put(key, key)
+        cache.invalidate(self.KEYS[0])
+        assert self.KEYS[0] not in cache
+        assert len(cache) == 2
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        cache = AggregatedPublicKeyCache(max_size=0)
+        cache.put(self.KEYS[0], self.KEYS[0])
+        assert len(cache) == 0
+
+
+class TestVerificationCache:
+    MESSAGE = b'hello'
+    SIGNATURE = b'\x01' * 64
+    KEY = b'\x02' * 32
+
+    def test_positive_only(self):
+        cache = VerificationCache()
+        cache.put(self.MESSAGE, self.SIGNATURE, self.KEY, MusigRes.SIGNATURE_VERIFICATION_FAILED)
+        assert cache.get(self.MESSAGE, self.SIGNATURE, self.KEY) is None
+
+        cache.put(self.MESSAGE, self.SIGNATURE, self.KEY, MusigRes.OK)
+        assert cache.get(self.MESSAGE, self.SIGNATURE, self.KEY) == MusigRes.OK
+        assert cache.get(self.MESSAGE, self.SIGNATURE, b'\x03' * 32) is None
+        assert cache.get(self.MESSAGE + self.SIGNATURE[:1], self.SIGNATURE[1:], self.KEY) is None
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_cache_failures(self):
+        cache = VerificationCache(cache_failures=True)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return MusigRes.SIGNATURE_VERIFICATION_FAILED
+
+        for _ in range(2):
+            assert cache.get_or_compute(self.MESSAGE, self.SIGNATURE, self.KEY, compute) == \
+                   MusigRes.SIGNATURE_VERIFICATION_FAILED
+        assert len(calls) == 1
+
+    def test_ttl(self):
+        cache = VerificationCache(ttl=0)
+        cache.put(self.MESSAGE, self.SIGNATURE, self.KEY, MusigRes.OK)
+        assert cache.get(self.MESSAGE, self.SIGNATURE, self.KEY) is None
+        assert len(cache) == 0
+
+    def test_memory_cap(self):
+        cache = VerificationCache(max_bytes=VERIFICATION_ENTRY_SIZE * 2)
+        for index in range(3):
+            cache.put(bytes([index]), self.SIGNATURE, self.KEY, MusigRes.OK)
+        assert len(cache) == 2
+        assert cache.memory_usage <= VERIFICATION_ENTRY_SIZE * 2
+        assert cache.get(b'\x00', self.SIGNATURE, self.KEY) is None
+
+
+class TestValidPublicKeyCache:
+    KEYS = [bytes([index]) * 32 for index in range(3)]
+
+    def test_check(self):
+        cache = ValidPublicKeyCache()
+        assert not cache.check(self.KEYS[0])
+        cache.add(memoryview(self.KEYS[0]))
+        assert cache.check(self.KEYS[0])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_eviction(self):
+        cache = ValidPublicKeyCache(max_size=2)
+        for key in self.KEYS:
+            cache.add(key)
+        assert self.KEYS[0] not in cache
+        cache.invalidate(self.KEYS[1])
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
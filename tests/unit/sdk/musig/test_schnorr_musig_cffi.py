@@ -0,0 +1,58 @@
+import pytest
+
+from zksync.sdk.musig import schnorr_musig_cffi
+from zksync.sdk.musig.schnorr_musig_native import *
+
+pytestmark = pytest.mark.skipif(not schnorr_musig_cffi.is_available(), reason='cffi binding is not built')
+
+
+class TestSchnorrMusigCffi:
+    PUBLIC_KEY = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+    PRIVATE_KEY = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+    SEED = [16807, 282475249, 1622650073, 984943658]
+    MESSAGE = 'hello'.encode()
+
+    def test_load(self):
+        assert SchnorrMusigLoader.load(CFFI_BACKEND).backend == CFFI_BACKEND
+        assert SchnorrMusigLoader.load(AUTO_BACKEND).backend == CFFI_BACKEND
+
+    def test_single(self):
+        musig = SchnorrMusigLoader.load(CFFI_BACKEND)
+        public_key = TestSchnorrMusigCffi.PUBLIC_KEY
+        signer = musig.schnorr_musig_new_signer(public_key, len(public_key), 0)
+        assert signer
+
+        seed = TestSchnorrMusigCffi.SEED
+        precommitment = Precommitment()
+        code = musig.schnorr_musig_compute_precommitment(signer, (c_uint32 * len(seed))(*seed), len(seed),
+                                                         PrecommitmentPointer(precommitment))
+        assert code == MusigRes.OK
+        assert '93ae6e6df739d76c088755078ed857e95119909c97bdd5cdc8aa12286abc0984' == bytes(precommitment.data).hex()
+
+        commitment = Commitment()
+        code = musig.schnorr_musig_receive_precommitments(signer, bytes(precommitment.data), STANDARD_ENCODING_LENGTH,
+                                                          CommitmentPointer(commitment))
+        assert code == MusigRes.OK
+
+        aggregated_commitment = AggregatedCommitment()
+        code = musig.schnorr_musig_receive_commitments(signer, bytes(commitment.data), STANDARD_ENCODING_LENGTH,
+                                                       AggregatedCommitmentPointer(aggregated_commitment))
+        assert code == MusigRes.OK
+
+        private_key = TestSchnorrMusigCffi.PRIVATE_KEY
+        message = TestSchnorrMusigCffi.MESSAGE
+        signature = Signature()
+        code = musig.schnorr_musig_sign(signer, private_key, len(private_key), message, len(message),
+                                        SignaturePointer(signature))
+        assert code == MusigRes.OK
+        assert '02bae431c052b9e4f7c9b511904a577c7ba5e035625879d5253440793337f7ff' == bytes(signature.data).hex()
+
+        aggregated_signature = AggregatedSignature()
+        code = musig.schnorr_musig_receive_signature_shares(signer, signature.data, STANDARD_ENCODING_LENGTH,
+                                                            AggregatedSignaturePointer(aggregated_signature))
+        assert code == MusigRes.OK
+
+        code = musig.schnorr_musig_verify(message, len(message), public_key, len(public_key),
+                                          aggregated_signature.data, AGG_SIG_ENCODING_LENGTH)
+        assert code == MusigRes.OK
+        musig.schnorr_musig_delete_signer(signer)
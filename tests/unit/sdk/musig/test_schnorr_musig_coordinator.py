@@ -0,0 +1,203 @@
+import asyncio
+import gc
+import socket
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig_async import AsyncSchnorrMusig
+from zksync.sdk.musig.schnorr_musig_coordinator import MessageKind
+from zksync.sdk.musig.schnorr_musig_coordinator import SigningCoordinator
+from zksync.sdk.musig.schnorr_musig_coordinator import SigningParticipant
+from zksync.sdk.musig.schnorr_musig_coordinator import SigningSessionError
+from zksync.sdk.musig.schnorr_musig_coordinator import SigningSessionStalled
+from zksync.sdk.musig.schnorr_musig_coordinator import SigningSessionTimeout
+from zksync.sdk.musig.schnorr_musig_coordinator import _Connection
+from zksync.sdk.musig.schnorr_musig_coordinator import frame
+from zksync.sdk.musig.schnorr_musig_coordinator import read_frame
+from zksync.sdk.musig.schnorr_musig_wire import SESSION_ID_LENGTH
+from zksync.sdk.musig.schnorr_musig_wire import Round
+from zksync.sdk.musig.schnorr_musig_wire import encode
+
+
+class TestSigningCoordinator:
+    MSG = 'hello'.encode()
+    PRIVATE_KEYS = [bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c'),
+                    bytes.fromhex('05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33'),
+                    bytes.fromhex('03cd8947a90f73a875623574f8e0e3d3c6abd8f9367ba54433ed02b7a62533d9')]
+    PUBLIC_KEYS = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d'),
+                   bytes.fromhex('0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f'),
+                   bytes.fromhex('ceafd8cb15a100e7ad0de3d73f7dcce8b9e3243cb7dbd64e3b0b0a799a93b388')]
+
+    def setup_method(self):
+        gc.collect()
+
+    async def forger(self, path, public_key, signatures):
+        """Joins as `public_key` and sends an aggregated signature after every frame it receives."""
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(frame(MessageKind.HELLO, public_key))
+
+        async def run():
+            position = None
+            for signature in signatures:
+                kind, body = await read_frame(reader)
+                session_id = bytes(body[:SESSION_ID_LENGTH])
+                if kind == MessageKind.START:
+                    position = int.from_bytes(body[SESSION_ID_LENGTH:SESSION_ID_LENGTH + 4], 'little')
+                    writer.write(frame(MessageKind.ENVELOPE, encode(session_id, Round.PRECOMMITMENT, position,
+                                                                    b'\x01' * 32)))
+                elif body[SESSION_ID_LENGTH] < Round.SIGNATURE_SHARE:
+                    writer.write(frame(MessageKind.ENVELOPE, encode(session_id, Round(body[SESSION_ID_LENGTH] + 1),
+                                                                    position, b'\x01' * 32)))
+                writer.write(frame(MessageKind.ENVELOPE, encode(session_id, Round.AGGREGATED_SIGNATURE, position,
+                                                                signature)))
+
+        return writer, asyncio.ensure_future(run())
+
+    async def participants(self, musig, connect, approve=None):
+        return [await connect(SigningParticipant(musig, private_key, public_key,
+                                                 approve if index == len(self.PUBLIC_KEYS) - 1 else None))
+                for index, (private_key, public_key) in enumerate(zip(self.PRIVATE_KEYS, self.PUBLIC_KEYS))]
+
+    def test_tcp_sessions(self):
+        async def run():
+            async with AsyncSchnorrMusig(max_workers=4) as musig:
+                coordinator = await SigningCoordinator(round_timeout=5).start_tcp()
+                host, port = coordinator.address[:2]
+                participants = await self.participants(musig, lambda participant: participant.connect_tcp(host, port))
+
+                messages = [self.MSG + bytes([index]) for index in range(8)]
+                signatures = await asyncio.gather(*[coordinator.sign(self.PUBLIC_KEYS, message)
+                                                    for message in messages])
+                for message, signature in zip(messages, signatures):
+                    assert await musig.verify(message, signature, self.PUBLIC_KEYS)
+                assert await coordinator.sign(self.PUBLIC_KEYS[:1], self.MSG)
+
+                for participant in participants:
+                    await participant.close()
+                await coordinator.close()
+
+        asyncio.run(run())
+
+    def test_unix_straggler(self, tmp_path):
+        async def straggle(message, public_keys):
+            await asyncio.sleep(1)
+            return True
+
+        async def run():
+            async with AsyncSchnorrMusig(max_workers=4) as musig:
+                path = str(tmp_path / 'coordinator.sock')
+                coordinator = await SigningCoordinator(round_timeout=0.3).start_unix(path)
+                participants = await self.participants(musig, lambda participant: participant.connect_unix(path),
+                                                       approve=straggle)
+
+                stalled, signature = await asyncio.gather(coordinator.sign(self.PUBLIC_KEYS, self.MSG),
+                                                          coordinator.sign(self.PUBLIC_KEYS[:2], self.MSG),
+                                                          return_exceptions=True)
+                assert isinstance(stalled, SigningSessionTimeout)
+                assert stalled.missing == [2]
+                assert await musig.verify(self.MSG, signature, self.PUBLIC_KEYS[:2])
+
+                with pytest.raises(SigningSessionTimeout):
+                    await coordinator.sign([b'\x01' * 32], self.MSG)
+
+                for participant in participants:
+                    await participant.close()
+                await coordinator.close()
+
+        asyncio.run(run())
+
+    def test_rejected(self, tmp_path):
+        async def run():
+            async with AsyncSchnorrMusig(max_workers=2) as musig:
+                path = str(tmp_path / 'coordinator.sock')
+                coordinator = await SigningCoordinator(round_timeout=5).start_unix(path)
+                participants = await self.participants(musig, lambda participant: participant.connect_unix(path),
+                                                       approve=lambda message, public_keys: False)
+                with pytest.raises(SigningSessionError, match='rejected'):
+                    await coordinator.sign(self.PUBLIC_KEYS, self.MSG)
+
+                for participant in participants:
+                    await participant.close()
+                await coordinator.close()
+
+        asyncio.run(run())
+
+    def test_peer_not_reading(self, tmp_path):
+        async def run():
+            async with AsyncSchnorrMusig(max_workers=2) as musig:
+                path = str(tmp_path / 'coordinator.sock')
+                coordinator = await SigningCoordinator(round_timeout=0.3, queue_size=1).start_unix(path)
+                participants = await self.participants(musig, lambda participant: participant.connect_unix(path))
+                _, writer = await asyncio.open_unix_connection(path)
+                writer.write(frame(MessageKind.HELLO, b'\x07' * 32))
+                await writer.drain()
+
+                # The silent peer never reads, so its socket fills up with the first START.
+                message = b'\x00' * (8 << 20)
+                with pytest.raises(SigningSessionTimeout):
+                    await coordinator.sign([self.PUBLIC_KEYS[0], b'\x07' * 32], message)
+                with pytest.raises(SigningSessionStalled) as e:
+                    await asyncio.wait_for(coordinator.sign([self.PUBLIC_KEYS[0], b'\x07' * 32], message), 5)
+                assert (e.value.stage, e.value.positions) == ('START', [1])
+                assert await musig.verify(self.MSG, await coordinator.sign(self.PUBLIC_KEYS, self.MSG),
+                                          self.PUBLIC_KEYS)
+
+                writer.close()
+                for participant in participants:
+                    await participant.close()
+                await coordinator.close()
+
+        asyncio.run(run())
+
+    def test_forged_signature(self, tmp_path):
+        async def run():
+            async with AsyncSchnorrMusig(max_workers=2) as musig:
+                path = str(tmp_path / 'coordinator.sock')
+                coordinator = await SigningCoordinator(round_timeout=5).start_unix(path)
+                participants = await self.participants(musig, lambda participant: participant.connect_unix(path))
+
+                writer, forging = await self.forger(path, b'\x07' * 32, [b'\x01' * 64])
+                with pytest.raises(SigningSessionError, match='must come from position 0'):
+                    await coordinator.sign([self.PUBLIC_KEYS[0], b'\x07' * 32], self.MSG)
+                writer.close()
+                forging.cancel()
+
+                # Signatures sent before the SIGNATURE_SHARE round are ignored.
+                writer, forging = await self.forger(path, b'\x08' * 32, [bytes([index]) * 64 for index in range(1, 5)])
+                assert await coordinator.sign([b'\x08' * 32], self.MSG) == b'\x04' * 64
+                writer.close()
+                forging.cancel()
+                await coordinator.close()
+
+                coordinator = await SigningCoordinator(round_timeout=5, musig=musig).start_unix(path)
+                participants += await self.participants(musig, lambda participant: participant.connect_unix(path))
+                writer, forging = await self.forger(path, b'\x09' * 32, [bytes([index]) * 64 for index in range(1, 5)])
+                with pytest.raises(SigningSessionError, match='does not verify'):
+                    await coordinator.sign([b'\x09' * 32], self.MSG)
+                assert await musig.verify(self.MSG, await coordinator.sign(self.PUBLIC_KEYS, self.MSG),
+                                          self.PUBLIC_KEYS)
+
+                writer.close()
+                forging.cancel()
+                for participant in participants:
+                    await participant.close()
+                await coordinator.close()
+
+        asyncio.run(run())
+
+    def test_peer_reset(self):
+        async def run():
+            ours, theirs = socket.socketpair()
+            reader, writer = await asyncio.open_connection(sock=ours)
+            connection = _Connection(reader, writer, 4)
+            theirs.close()
+            for _ in range(2):
+                await connection.send(b'\x00' * 1024)
+            await asyncio.wait_for(asyncio.shield(connection._writer_task), 5)
+            assert connection._writer_task.exception() is None
+            assert writer.is_closing()
+            with pytest.raises((asyncio.IncompleteReadError, ConnectionError)):
+                await read_frame(reader)
+            await connection.close()
+
+        asyncio.run(run())
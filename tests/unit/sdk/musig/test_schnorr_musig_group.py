@@ -0,0 +1,44 @@
+import gc
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+
+class TestSigningGroup:
+    SEED = bytes.fromhex('a7410000f13ad610d9acb7602a0cb53a')
+    MSG = 'hello'.encode()
+    PRIVATE_KEYS = [bytes.fromhex(key) for key in [
+        '011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c',
+        '05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33',
+        '03cd8947a90f73a875623574f8e0e3d3c6abd8f9367ba54433ed02b7a62533d9',
+        '02556c232cfb6c8274ac7e2e55fe1f87b6dee119bf62a3c784102de6c25c2512',
+        '01791089b53bee682147ecbc5e26325329a21c894a6205876c58798d1c268ae4']]
+    PUBLIC_KEYS = [bytes.fromhex(key) for key in [
+        '179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d',
+        '0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f',
+        'ceafd8cb15a100e7ad0de3d73f7dcce8b9e3243cb7dbd64e3b0b0a799a93b388',
+        '3f063eeb28b912a059fc8a8c6421ec59cd2d8f2a19402b097d78df8a3864f70f',
+        '286b404714db86751d925c76cf77070997e488659c4abf74cc729a3711bc1ba4']]
+
+    def setup_method(self):
+        gc.collect()
+
+    def test_sign(self):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        group = SigningGroup(musig, self.PUBLIC_KEYS, self.PRIVATE_KEYS)
+
+        result = group.sign(self.MSG, [self.SEED] * len(group))
+        assert musig.verify(self.MSG, result.signature, self.PUBLIC_KEYS)
+        assert set(result.timings) == set(SigningGroup.ROUNDS)
+        assert SchnorrMusigSigner.live_handles() == live
+
+    def test_sign_parallel(self):
+        musig = SchnorrMusig()
+        sequential = SigningGroup(musig, self.PUBLIC_KEYS, self.PRIVATE_KEYS).sign(self.MSG, [self.SEED] * 5)
+        group = SigningGroup(musig, self.PUBLIC_KEYS, self.PRIVATE_KEYS, max_workers=3)
+        parallel = group.sign(self.MSG, [self.SEED] * 5)
+        assert parallel.signature == sequential.signature
+        signature = SigningGroup(musig, self.PUBLIC_KEYS, self.PRIVATE_KEYS).sign(self.MSG).signature
+        assert musig.verify(self.MSG, signature, self.PUBLIC_KEYS)
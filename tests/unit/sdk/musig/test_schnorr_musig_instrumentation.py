@@ -0,0 +1,61 @@
+import logging
+from types import SimpleNamespace
+
+from zksync.sdk.musig.schnorr_musig_instrumentation import INPUT_LENGTHS
+from zksync.sdk.musig.schnorr_musig_instrumentation import INSTRUMENTATION_ENVIRONMENT_VARIABLE
+from zksync.sdk.musig.schnorr_musig_instrumentation import INSTRUMENTATION_LOGGER
+from zksync.sdk.musig.schnorr_musig_instrumentation import Instrumentation
+from zksync.sdk.musig.schnorr_musig_instrumentation import InstrumentedNative
+from zksync.sdk.musig.schnorr_musig_instrumentation import LoggingSink
+from zksync.sdk.musig.schnorr_musig_instrumentation import MetricsSink
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+
+class TestInstrumentation:
+
+    @staticmethod
+    def native(code: MusigRes = MusigRes.OK):
+        return SimpleNamespace(**{function: lambda *args: code for function in INPUT_LENGTHS})
+
+    def test_disabled(self):
+        instrumentation = Instrumentation()
+        native = InstrumentedNative(self.native(), instrumentation)
+        assert native.schnorr_musig_verify(b'', 0, b'', 0, b'', 0) == MusigRes.OK
+        assert not instrumentation.enabled
+
+    def test_metrics(self):
+        instrumentation = Instrumentation()
+        sink = MetricsSink()
+        instrumentation.enable(sink)
+        native = InstrumentedNative(self.native(MusigRes.SIGNATURE_VERIFICATION_FAILED), instrumentation)
+
+        native.schnorr_musig_verify(b'hello', 5, b'\x00' * 32, 32, b'\x00' * 64, 64)
+        native.schnorr_musig_verify(b'hello', 5, b'\x00' * 32, 32, b'\x00' * 64, 64)
+        native.schnorr_musig_compute_precommitment(None, None, 4, None)
+
+        metrics = sink.snapshot()
+        assert metrics['schnorr_musig_verify']['calls'] == 2
+        assert metrics['schnorr_musig_verify']['input_bytes'] == 2 * (5 + 32 + 64)
+        assert metrics['schnorr_musig_verify']['codes'] == {'SIGNATURE_VERIFICATION_FAILED': 2}
+        assert sum(metrics['schnorr_musig_verify']['latency_buckets'].values()) == 2
+        assert metrics['schnorr_musig_compute_precommitment']['input_bytes'] == 16
+
+        instrumentation.disable()
+        native.schnorr_musig_verify(b'hello', 5, b'\x00' * 32, 32, b'\x00' * 64, 64)
+        assert sink.snapshot()['schnorr_musig_verify']['calls'] == 2
+
+    def test_configure(self, monkeypatch, caplog):
+        monkeypatch.delenv(INSTRUMENTATION_ENVIRONMENT_VARIABLE, raising=False)
+        caplog.set_level(logging.WARNING, logger=INSTRUMENTATION_LOGGER)
+        assert not Instrumentation().configure()
+
+        monkeypatch.setenv(INSTRUMENTATION_ENVIRONMENT_VARIABLE, 'metrics')
+        instrumentation = Instrumentation()
+        assert instrumentation.configure()
+        assert isinstance(instrumentation.sink, MetricsSink)
+
+        monkeypatch.delenv(INSTRUMENTATION_ENVIRONMENT_VARIABLE)
+        caplog.set_level(logging.DEBUG, logger=INSTRUMENTATION_LOGGER)
+        instrumentation = Instrumentation()
+        assert instrumentation.configure()
+        assert isinstance(instrumentation.sink, LoggingSink)
@@ -1,7 +1,24 @@
 import ctypes
+import os
+import re
 
+import zksync
 from zksync.sdk.musig.schnorr_musig_native import *
 
+HEADER_PATH = os.path.join(os.path.dirname(zksync.__file__), 'schnorr_musig_patched.h')
+
+
+def header_codes() -> dict:
+    """MusigRes names and values as numbered by the C header."""
+    with open(HEADER_PATH) as f:
+        body = re.search(r'enum MusigRes \{(.*?)\}', f.read(), re.S).group(1)
+    codes, value = {}, -1
+    for entry in filter(None, (entry.strip() for entry in body.split(','))):
+        name, _, explicit = entry.partition('=')
+        value = int(explicit) if explicit else value + 1
+        codes[name.strip()] = value
+    return codes
+
 
 class TestSchnorrMusigNative:
     PUBLIC_KEY = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
@@ -10,23 +27,48 @@ class TestSchnorrMusigNative:
 
     MESSAGE = 'hello'.encode()
 
+    def test_result_codes_match_header(self):
+        assert {code.name: code.value for code in MusigRes} == header_codes()
+        assert MusigRes(114) == MusigRes.INVALID_SEED
+
     def test_load_c_library(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         assert musig
+        assert SchnorrMusigLoader.load(CTYPES_BACKEND) is musig
+
+    def test_library_path_is_resolved_once(self, monkeypatch):
+        calls = []
+
+        def find_library(name):
+            calls.append(name)
+            return '/opt/musig/libmusig_c.so'
+
+        monkeypatch.setattr(SchnorrMusigLoader, '_found_library_path', None)
+        monkeypatch.delenv(LIBRARY_PATH_ENVIRONMENT_VARIABLE, raising=False)
+        monkeypatch.setattr(ctypes.util, 'find_library', find_library)
+
+        assert SchnorrMusigLoader.library_path() == '/opt/musig/libmusig_c.so'
+        assert SchnorrMusigLoader.library_path() == '/opt/musig/libmusig_c.so'
+        assert calls == [LIBRARY_NAME]
+
+        monkeypatch.setenv(LIBRARY_PATH_ENVIRONMENT_VARIABLE, '/tmp/libmusig_c.so')
+        assert SchnorrMusigLoader.library_path() == '/tmp/libmusig_c.so'
+        assert SchnorrMusigLoader.library_path('/usr/lib/libmusig_c.so') == '/usr/lib/libmusig_c.so'
+        assert len(calls) == 1
 
     def test_schnorr_musig_new_signer(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         singer = TestSchnorrMusigNative.create_signer(musig)
         assert singer
         assert singer.contents.inner
 
     def test_schnorr_musig_delete_signer(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         singer = TestSchnorrMusigNative.create_signer(musig)
         musig.schnorr_musig_delete_signer(singer)
 
     def test_schnorr_musig_aggregate_pubkeys(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         public_keys = ['179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d',
                        '0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f',
                        'ceafd8cb15a100e7ad0de3d73f7dcce8b9e3243cb7dbd64e3b0b0a799a93b388',
@@ -47,7 +89,7 @@ class TestSchnorrMusigNative:
         assert aggregated_public_key.data
 
     def test_schnorr_musig_compute_precommitment(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         singer = TestSchnorrMusigNative.create_signer(musig)
         precommitment = TestSchnorrMusigNative.create_precommitment(musig, singer)
 
@@ -56,7 +98,7 @@ class TestSchnorrMusigNative:
         assert '93ae6e6df739d76c088755078ed857e95119909c97bdd5cdc8aa12286abc0984' == bytes(precommitment.data).hex()
 
     def test_schnorr_musig_receive_precommitments(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         singer = TestSchnorrMusigNative.create_signer(musig)
         precommitment = TestSchnorrMusigNative.create_precommitment(musig, singer)
 
@@ -73,7 +115,7 @@ class TestSchnorrMusigNative:
         assert 'a18005f171a323d022a625e71aa53864ca6d1851a1fc50585b7627fba3f6c69f' == bytes(commitment.data).hex()
 
     def test_schnorr_musig_receive_commitments(self):
-        musig = SchnorrMusigLoader.load()
+        musig = SchnorrMusigLoader.load(CTYPES_BACKEND)
         singer = TestSchnorrMusigNative.create_signer(musig)
         precommitment = TestSchnorrMusigNative.create_precommitment(musig, singer)
 
@@ -0,0 +1,77 @@
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_numpy import aggregate_public_keys_array
+from zksync.sdk.musig.schnorr_musig_numpy import verify_array
+from zksync.sdk.musig.schnorr_musig_numpy import verify_codes_array
+
+numpy = pytest.importorskip('numpy')
+
+
+class TestSchnorrMusigNumpy:
+    PUBLIC_KEYS = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d'),
+                   bytes.fromhex('0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f')]
+    PRIVATE_KEYS = [bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c'),
+                    bytes.fromhex('05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33')]
+    MESSAGES = [b'first', b'second message', b'', b'fourth']
+
+    def sign(self, musig):
+        group = SigningGroup(musig, self.PUBLIC_KEYS, self.PRIVATE_KEYS)
+        return [group.sign(message).signature for message in self.MESSAGES]
+
+    def test_verify_variable_length_messages(self):
+        musig = SchnorrMusig()
+        signatures = numpy.frombuffer(b''.join(self.sign(musig)), dtype=numpy.uint8).reshape(-1, 64).copy()
+        signatures[3, 0] ^= 1
+        aggregated_public_key = numpy.frombuffer(musig.aggregate_public_keys(*self.PUBLIC_KEYS), dtype=numpy.uint8)
+
+        messages = numpy.frombuffer(b''.join(self.MESSAGES), dtype=numpy.uint8)
+        lengths = numpy.array([len(message) for message in self.MESSAGES])
+        offsets = numpy.concatenate([[0], numpy.cumsum(lengths)[:-1]])
+
+        result = verify_array(musig, messages, signatures, aggregated_public_key, offsets, lengths, max_workers=2)
+        assert result.dtype == numpy.bool_
+        assert result.tolist() == [True, True, True, False]
+
+        keys = numpy.tile(aggregated_public_key, (4, 1))
+        codes = verify_codes_array(musig, messages, signatures, keys, offsets, lengths)
+        assert codes.dtype == numpy.uint8
+        assert codes.tolist() == [MusigRes.OK] * 3 + [MusigRes.SIGNATURE_VERIFICATION_FAILED]
+
+    def test_verify_fixed_length_messages(self):
+        musig = SchnorrMusig()
+        aggregated_public_key = musig.aggregate_public_keys(*self.PUBLIC_KEYS)
+        messages = [bytes([index]) * 32 for index in range(3)]
+        group = SigningGroup(musig, self.PUBLIC_KEYS, self.PRIVATE_KEYS)
+        signatures = [group.sign(message).signature for message in messages]
+
+        result = verify_array(musig, numpy.frombuffer(b''.join(messages), dtype=numpy.uint8).reshape(3, 32),
+                              numpy.frombuffer(b''.join(signatures), dtype=numpy.uint8).reshape(3, 64),
+                              numpy.frombuffer(aggregated_public_key, dtype=numpy.uint8))
+        assert result.all()
+
+    def test_invalid_arguments(self):
+        musig = SchnorrMusig()
+        signatures = numpy.zeros((2, 64), dtype=numpy.uint8)
+        key = numpy.zeros(32, dtype=numpy.uint8)
+        with pytest.raises(ValueError):
+            verify_array(musig, numpy.zeros(4, dtype=numpy.uint8), signatures, key, [0, 2], [2, 3])
+        with pytest.raises(ValueError):
+            verify_array(musig, numpy.zeros((2, 4), dtype=numpy.uint8), signatures.astype(numpy.int32), key)
+        with pytest.raises(ValueError):
+            verify_array(musig, numpy.zeros((2, 4), dtype=numpy.uint8), signatures[:, :32], key)
+
+    def test_aggregate_public_keys(self):
+        musig = SchnorrMusig()
+        keys = numpy.frombuffer(b''.join(self.PUBLIC_KEYS) * 2 + b'\xff' * 64, dtype=numpy.uint8).reshape(3, 2, 32)
+        aggregated, codes = aggregate_public_keys_array(musig, keys, max_workers=2)
+        assert aggregated.shape == (3, 32)
+        assert codes[:2].tolist() == [MusigRes.OK] * 2
+        assert codes[2] != MusigRes.OK
+        assert bytes(aggregated[0]) == musig.aggregate_public_keys(*self.PUBLIC_KEYS)
+        assert not aggregated[2].any()
+
+        single = numpy.frombuffer(b''.join(self.PUBLIC_KEYS), dtype=numpy.uint8).reshape(2, 32)
+        assert musig.aggregate_encoded_public_keys(single) == bytes(aggregated[1])
@@ -0,0 +1,83 @@
+import multiprocessing
+import os
+import pickle
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_cache import VerificationCache
+from zksync.sdk.musig.schnorr_musig_cache import shared_key_cache
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigForkedError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_process import MusigProcessPool
+from zksync.sdk.musig.schnorr_musig_seed import SeedSource
+from zksync.sdk.musig.schnorr_musig_seed import shared_seed_source
+
+PUBLIC_KEYS = [bytes.fromhex(key) for key in [
+    '179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d',
+    '0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f']]
+PRIVATE_KEYS = [bytes.fromhex(key) for key in [
+    '011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c',
+    '05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33']]
+
+
+def _aggregate(musig, public_keys):
+    return musig.aggregate_public_keys(*public_keys)
+
+
+class TestPickle:
+
+    def test_musig(self):
+        musig = SchnorrMusig(verification_cache=VerificationCache(max_size=10), seed_source=SeedSource(block_seeds=4))
+        musig.seed_source.take()
+        musig.verification_cache.put(b'message', b'\x01' * 64, b'\x02' * 32, MusigRes.OK)
+
+        copy = pickle.loads(pickle.dumps(musig))
+        assert copy.native is musig.native
+        assert copy.key_cache is shared_key_cache
+        assert copy.verification_cache.max_size == 10
+        assert len(copy.verification_cache) == 0
+        assert len(copy.seed_source._block) == 0
+        assert pickle.loads(pickle.dumps(SchnorrMusig())).seed_source is shared_seed_source
+        assert copy.aggregate_public_keys(*PUBLIC_KEYS) == musig.aggregate_public_keys(*PUBLIC_KEYS)
+
+    def test_signer(self):
+        with SchnorrMusig().create_signer(PUBLIC_KEYS, 0) as signer:
+            with pytest.raises(TypeError):
+                pickle.dumps(signer)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork()')
+class TestFork:
+
+    def test_inherited_signer(self):
+        signer = SchnorrMusig().create_signer(PUBLIC_KEYS, 0)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                signer.compute_precommitment()
+            except SchnorrMusigForkedError:
+                signer.revoke()
+                os._exit(0 if signer.forked and signer.revoked else 2)
+            except BaseException:
+                pass
+            os._exit(1)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert not signer.forked
+        assert signer.compute_precommitment()
+        signer.revoke()
+
+    def test_process_pool(self):
+        messages = [f'message {index}'.encode() for index in range(8)]
+        with MusigProcessPool(max_workers=2, mp_context=multiprocessing.get_context('fork')) as pool:
+            signatures = pool.sign_all(PUBLIC_KEYS, PRIVATE_KEYS, messages)
+            assert len(signatures) == 8
+
+            aggregated_public_key = pool.submit(_aggregate, PUBLIC_KEYS).result()
+            assert aggregated_public_key == SchnorrMusig().aggregate_public_keys(*PUBLIC_KEYS)
+
+            items = [(message, signature, aggregated_public_key) for message, signature in zip(messages, signatures)]
+            items.append((b'other', signatures[0], PUBLIC_KEYS))
+            assert pool.verify_batch(items).results == [True] * 8 + [False]
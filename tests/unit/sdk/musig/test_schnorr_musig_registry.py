@@ -0,0 +1,73 @@
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_registry import RECORD_HEADER
+from zksync.sdk.musig.schnorr_musig_registry import KeySetRegistry
+
+
+class TestKeySetRegistry:
+    KEYS = [bytes([index]) * 32 for index in (3, 1, 2)]
+    AGGREGATED = b'\x09' * 32
+
+    def test_add_and_get(self, tmp_path):
+        with KeySetRegistry(str(tmp_path / 'keys')) as registry:
+            key_set = registry.add('validators', self.KEYS, self.AGGREGATED)
+            assert key_set.public_keys == self.KEYS
+            assert key_set.encoded_public_keys == b''.join(self.KEYS)
+            assert key_set.aggregated_public_key == self.AGGREGATED
+            assert [key_set.position(key) for key in self.KEYS] == [0, 1, 2]
+            assert b'\x00' * 32 not in key_set
+            with pytest.raises(KeyError):
+                registry.get('unknown')
+
+    def test_warm_start(self, tmp_path):
+        path = str(tmp_path / 'keys')
+        with KeySetRegistry(path) as registry, KeySetRegistry(path) as other:
+            registry.add('first', self.KEYS, self.AGGREGATED)
+            assert 'first' in other
+            registry.add('first', self.KEYS[:1], self.KEYS[0])
+
+        with open(path, 'ab') as file:
+            file.write(b'\x40\x00')
+
+        with KeySetRegistry(path) as registry:
+            assert list(registry) == ['first']
+            assert registry.get('first').public_keys == self.KEYS[:1]
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        path = str(tmp_path / 'keys')
+        with KeySetRegistry(path) as registry:
+            registry.add('first', self.KEYS, self.AGGREGATED)
+        with open(path, 'ab') as file:
+            file.write(RECORD_HEADER.pack(4096, 5, 3) + b'torn')
+
+        with KeySetRegistry(path) as registry:
+            registry.add('second', self.KEYS[:1], self.KEYS[0])
+        with KeySetRegistry(path) as registry:
+            assert list(registry) == ['first', 'second']
+            assert registry.get('second').public_keys == self.KEYS[:1]
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / 'keys'
+        path.write_bytes(b'not a registry')
+        with pytest.raises(ValueError):
+            KeySetRegistry(str(path))
+
+        path.write_bytes(b'NOTMAGIC' + RECORD_HEADER.pack(20, 4, 0) + b'\xff' * 10)
+        with pytest.raises(ValueError, match='not a key set registry'):
+            KeySetRegistry(str(path))
+
+    def test_signer(self, tmp_path):
+        private_key = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+        message = b'hello'
+
+        musig = SchnorrMusig()
+        with KeySetRegistry(str(tmp_path / 'keys')) as registry:
+            musig.register_key_set(registry, 'single', [public_key])
+            key_set = registry.get('single')
+            with musig.create_key_set_signer(key_set, public_key) as signer:
+                assert signer.aggregated_public_key == musig.aggregate_public_keys(public_key)
+                signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment()))
+                signature = signer.aggregate_signature(signer.sign(private_key, message))
+            assert musig.verify(message, signature, key_set)
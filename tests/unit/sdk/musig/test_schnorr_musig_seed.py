@@ -0,0 +1,59 @@
+from ctypes import c_uint32
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig_buffer import is_aligned
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_seed import SeedSource
+from zksync.sdk.musig.schnorr_musig_seed import _discard_after_fork
+from zksync.sdk.musig.schnorr_musig_seed import seed_words
+
+
+class TestSeedSource:
+
+    def test_take(self):
+        source = SeedSource(block_seeds=4)
+        seeds = [bytes(source.take()) for _ in range(10)]
+        assert all(len(seed) == 16 for seed in seeds)
+        assert len(set(seeds)) == 10
+
+        batch = source.take(9)
+        assert len(batch) == 16 * 9
+
+    def test_discard_after_fork(self):
+        source = SeedSource(block_seeds=4)
+        source.take()
+        block = source._block
+        _discard_after_fork()
+        assert bytes(source.take()) not in bytes(block)
+
+    def test_invalid_seed_length(self):
+        with pytest.raises(ValueError):
+            SeedSource(seed_length=15)
+
+
+class TestSeedWords:
+
+    def test_seed_words(self):
+        seed = bytes(range(16))
+        data, length = seed_words(seed)
+        assert length == 4
+        assert bytes((c_uint32 * length).from_buffer_copy(data)) == seed
+
+    def test_unaligned_seed(self):
+        seed = bytes(range(16))
+        for buffer in [bytearray(b'\x00' + seed), b'\x00' + seed]:
+            view = memoryview(buffer)[1:]
+            data, length = seed_words(view)
+            assert not is_aligned(view, 4) and is_aligned(data, 4)
+            assert bytes((c_uint32 * length).from_buffer_copy(data)) == seed
+
+        aligned = memoryview(bytearray(b'\x00' * 4 + seed))[4:]
+        assert seed_words(aligned)[0] is aligned
+
+    def test_invalid_seed(self):
+        for seed in [b'', b'\x00' * 3, b'\x00' * 17]:
+            with pytest.raises(SchnorrMusigError) as error:
+                seed_words(seed)
+            assert error.value.code == MusigRes.INVALID_SEED
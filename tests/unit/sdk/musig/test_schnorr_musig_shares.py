@@ -0,0 +1,83 @@
+import gc
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigRevokedError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigShareError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_shares import SignatureShareAccumulator
+
+
+class TestSignatureShareAccumulator:
+    MSG = 'hello'.encode()
+    PRIVATE_KEYS = [bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c'),
+                    bytes.fromhex('05befa1dc5beb8aa74c348966f5254702bc0a9613e519eb3ef2fe8c444f40d33'),
+                    bytes.fromhex('03cd8947a90f73a875623574f8e0e3d3c6abd8f9367ba54433ed02b7a62533d9')]
+    PUBLIC_KEYS = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d'),
+                   bytes.fromhex('0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f'),
+                   bytes.fromhex('ceafd8cb15a100e7ad0de3d73f7dcce8b9e3243cb7dbd64e3b0b0a799a93b388')]
+
+    def setup_method(self):
+        gc.collect()
+
+    def session(self, musig):
+        signers = [musig.create_signer(self.PUBLIC_KEYS, index) for index in range(3)]
+        precommitments = musig.compute_precommitments(signers)
+        commitments = b''.join(signer.receive_precommitments(precommitments) for signer in signers)
+        for signer in signers:
+            signer.receive_commitments(commitments)
+        shares = [signer.sign(private_key, self.MSG) for signer, private_key in zip(signers, self.PRIVATE_KEYS)]
+        return signers, shares
+
+    def test_accumulate(self):
+        musig = SchnorrMusig()
+        signers, shares = self.session(musig)
+        accumulator = SignatureShareAccumulator(signers[2], 2, shares[2], self.MSG)
+        assert accumulator.missing == [0, 1]
+        assert accumulator.add(1, shares[1]) is None
+        assert accumulator.add(1, shares[1]) is None
+
+        signature = accumulator.add(0, shares[0])
+        assert accumulator.complete
+        assert musig.verify(self.MSG, signature, self.PUBLIC_KEYS)
+        for signer in signers:
+            signer.revoke()
+
+    def test_faulty_share(self):
+        musig = SchnorrMusig()
+        signers, shares = self.session(musig)
+        accumulator = SignatureShareAccumulator(signers[1], 1, shares[1], self.MSG)
+
+        with pytest.raises(SchnorrMusigShareError) as error:
+            accumulator.add(0, b'\xff' * 32)
+        assert (error.value.position, error.value.code) == (0, MusigRes.INVALID_SIGNATURE_SHARE)
+        with pytest.raises(SchnorrMusigShareError) as error:
+            accumulator.add(1, shares[0])
+        assert error.value.position == 1
+        with pytest.raises(SchnorrMusigShareError) as error:
+            accumulator.add(3, shares[0])
+        assert error.value.code == MusigRes.INVALID_PARTICIPANT_POSITION
+
+        assert accumulator.missing == [0, 2]
+        accumulator.add(0, shares[0])
+        assert musig.verify(self.MSG, accumulator.add(2, shares[2]), self.PUBLIC_KEYS)
+        for signer in signers:
+            signer.revoke()
+
+    def test_unattributed_failure(self):
+        musig = SchnorrMusig()
+        signers, shares = self.session(musig)
+        accumulator = SignatureShareAccumulator(signers[2], 2, shares[2], self.MSG, check_shares=False)
+        accumulator.add(1, shares[1])
+        with pytest.raises(SchnorrMusigShareError, match='cannot be attributed') as error:
+            accumulator.add(0, b'\xff' * 32)
+        assert (error.value.position, error.value.code) == (None, MusigRes.INVALID_SIGNATURE_SHARE)
+
+        accumulator = SignatureShareAccumulator(signers[1], 1, shares[1], self.MSG, check_shares=False)
+        accumulator.add(0, shares[0])
+        signers[1].revoke()
+        with pytest.raises(SchnorrMusigRevokedError):
+            accumulator.add(2, shares[2])
+        for signer in signers:
+            signer.revoke()
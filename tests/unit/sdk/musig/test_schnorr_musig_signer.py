@@ -0,0 +1,85 @@
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigConcurrentUseError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigStateError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_signer import SignerState
+
+
+class TestSchnorrMusigSignerState:
+    PRIVATE_KEY = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+    PUBLIC_KEY = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+    MSG = 'hello'.encode()
+
+    def setup_method(self):
+        gc.collect()
+
+    def session(self, musig, message):
+        with musig.create_signer([self.PUBLIC_KEY], 0) as signer:
+            signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment()))
+            return signer.aggregate_signature(signer.sign(self.PRIVATE_KEY, message))
+
+    def test_round_order(self):
+        musig = SchnorrMusig()
+        with musig.create_signer([self.PUBLIC_KEY], 0) as signer:
+            with pytest.raises(SchnorrMusigStateError) as error:
+                signer.sign(self.PRIVATE_KEY, self.MSG)
+            assert error.value.code == MusigRes.AGGREGATED_NONCE_COMMITMENT_NOT_COMPUTED
+
+            precommitment = signer.compute_precommitment()
+            assert signer.state == SignerState.PRECOMMITTED
+            with pytest.raises(SchnorrMusigStateError) as error:
+                signer.compute_precommitment()
+            assert error.value.code == MusigRes.INVALID_INPUT_DATA
+
+            signer.receive_commitments(signer.receive_precommitments(precommitment))
+            shares = signer.sign(self.PRIVATE_KEY, self.MSG)
+            with pytest.raises(SchnorrMusigStateError):
+                signer.sign(self.PRIVATE_KEY, b'another message')
+            assert signer.aggregate_signature(shares) == signer.aggregate_signature(shares)
+            assert signer.state == SignerState.AGGREGATED
+
+    def test_concurrent_use(self):
+        musig = SchnorrMusig()
+        with musig.create_signer([self.PUBLIC_KEY], 0) as signer:
+            signer._state_lock.acquire()
+            try:
+                with ThreadPoolExecutor(1) as executor:
+                    with pytest.raises(SchnorrMusigConcurrentUseError):
+                        executor.submit(signer.compute_precommitment).result()
+            finally:
+                signer._state_lock.release()
+            assert signer.state == SignerState.CREATED
+
+            revoked = threading.Event()
+            signer._state_lock.acquire()
+            thread = threading.Thread(target=lambda: (signer.revoke(), revoked.set()))
+            thread.start()
+            assert not revoked.wait(0.05)
+            signer._state_lock.release()
+            thread.join()
+            assert signer.revoked
+
+    def test_stress(self):
+        musig = SchnorrMusig()
+        signature = self.session(musig, self.MSG)
+        shared = musig.create_signer([self.PUBLIC_KEY], 0)
+
+        def work(index: int) -> bool:
+            assert musig.verify(self.MSG, signature, self.PUBLIC_KEY)
+            assert musig.verify(self.MSG, self.session(musig, self.MSG), self.PUBLIC_KEY)
+            try:
+                shared.compute_precommitment()
+                return True
+            except SchnorrMusigStateError:
+                return False
+
+        with ThreadPoolExecutor(8) as executor:
+            assert sum(executor.map(work, range(200))) == 1
+        assert shared.state == SignerState.PRECOMMITTED
+        shared.revoke()
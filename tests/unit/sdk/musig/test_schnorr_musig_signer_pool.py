@@ -0,0 +1,103 @@
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigRevokedError
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+
+class TestSchnorrMusigSignerLifecycle:
+    PUBLIC_KEYS = [bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d'),
+                   bytes.fromhex('0af4b9a4e9e2b5a4d4d0a6d2eb9af19abd9d8c5f009b50f3d15faa7e7064f69f')]
+    SEED = bytes.fromhex('a7410000f13ad610d9acb7602a0cb53a')
+
+    def setup_method(self):
+        gc.collect()
+
+    def test_context_manager(self):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        with musig.create_signer(self.PUBLIC_KEYS, 0) as signer:
+            assert SchnorrMusigSigner.live_handles() == live + 1
+        assert signer.revoked
+        assert SchnorrMusigSigner.live_handles() == live
+
+        signer.revoke()
+        assert SchnorrMusigSigner.live_handles() == live
+        with pytest.raises(SchnorrMusigRevokedError):
+            signer.compute_precommitment(self.SEED)
+
+    def test_garbage_collection(self):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        musig.create_signer(self.PUBLIC_KEYS, 1)
+        gc.collect()
+        assert SchnorrMusigSigner.live_handles() == live
+
+    def test_pool(self):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        with musig.create_signer_pool(self.PUBLIC_KEYS, 1, size=3) as pool:
+            assert len(pool) == 3
+            signers = [pool.acquire() for _ in range(4)]
+            assert (pool.hits, pool.misses) == (3, 1)
+            assert len({id(signer) for signer in signers}) == 4
+            assert pool.refill() == 3
+            for signer in signers:
+                signer.revoke()
+            assert SchnorrMusigSigner.live_handles() == live + 3
+
+        assert len(pool) == 0
+        assert SchnorrMusigSigner.live_handles() == live
+        with pytest.raises(SchnorrMusigRevokedError):
+            pool.acquire()
+
+    def test_concurrent_refill(self, monkeypatch):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        with musig.create_signer_pool(self.PUBLIC_KEYS, 0, size=4) as pool:
+            for _ in range(4):
+                pool.acquire().revoke()
+            prepare = pool._prepare
+            monkeypatch.setattr(pool, '_prepare', lambda: time.sleep(0.01) or prepare())
+            with ThreadPoolExecutor(4) as executor:
+                assert sum(executor.map(lambda _: pool.refill(), range(4))) == 4
+            assert len(pool) == 4
+            assert SchnorrMusigSigner.live_handles() == live + 4
+        assert SchnorrMusigSigner.live_handles() == live
+
+    def test_precommitment_pool(self):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        with musig.create_precommitment_pool(self.PUBLIC_KEYS[:1], 0, size=8) as pool:
+            assert pool.depth == 8
+            with ThreadPoolExecutor(4) as executor:
+                prepared = list(executor.map(lambda _: pool.acquire(), range(12)))
+            assert (pool.hits, pool.misses) == (8, 4)
+            assert len({id(entry.signer) for entry in prepared}) == 12
+            assert len({entry.precommitment for entry in prepared}) == 12
+
+            with prepared[0] as entry:
+                assert entry.signer.receive_precommitments(entry.precommitment)
+            for entry in prepared[1:]:
+                entry.revoke()
+
+            assert pool.refill() == 8
+            metrics = pool.metrics()
+            assert (metrics['depth'], metrics['prepared']) == (8, 20)
+            assert metrics['refill_rate'] > 0
+
+        assert SchnorrMusigSigner.live_handles() == live
+
+    def test_precommitment_expiry(self):
+        musig = SchnorrMusig()
+        live = SchnorrMusigSigner.live_handles()
+        with musig.create_precommitment_pool(self.PUBLIC_KEYS, 0, size=2, ttl=0) as pool:
+            assert pool.expire() == 2
+            with pool.acquire():
+                pass
+            assert (pool.expired, pool.hits, pool.misses) == (2, 0, 1)
+        assert SchnorrMusigSigner.live_handles() == live
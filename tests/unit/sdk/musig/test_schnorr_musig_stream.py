@@ -0,0 +1,52 @@
+import io
+
+import pytest
+
+from zksync.sdk.musig.__main__ import main
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_stream import read_records
+from zksync.sdk.musig.schnorr_musig_stream import verify_stream
+from zksync.sdk.musig.schnorr_musig_stream import write_records
+
+
+class TestSchnorrMusigStream:
+    PRIVATE_KEY = bytes.fromhex('011f5b99084c5c2e2d5e63488e0f7168d599a5c01fe9fec4c99605743da5e85c')
+    PUBLIC_KEY = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+    def records(self, musig, count):
+        aggregated_public_key = musig.aggregate_public_keys(self.PUBLIC_KEY)
+        with musig.create_signer([self.PUBLIC_KEY], 0) as signer:
+            signer.receive_commitments(signer.receive_precommitments(signer.compute_precommitment()))
+            signature = signer.aggregate_signature(signer.sign(self.PRIVATE_KEY, b'message'))
+        return [(b'message' if index % 3 else b'other', signature, aggregated_public_key) for index in range(count)]
+
+    def test_framing(self):
+        records = [(b'', b'\x01' * 64, b'\x02' * 32), (b'message', b'\x03' * 64, b'\x04' * 32)]
+        file = io.BytesIO()
+        assert write_records(file, records) == 2
+        assert list(read_records(io.BytesIO(file.getvalue()))) == records
+
+        with pytest.raises(ValueError):
+            list(read_records(io.BytesIO(file.getvalue()[:-1])))
+
+    def test_verify_stream(self):
+        musig = SchnorrMusig()
+        records = self.records(musig, 50)
+        expected = [(index, MusigRes.OK if index % 3 else MusigRes.SIGNATURE_VERIFICATION_FAILED)
+                    for index in range(50)]
+
+        assert list(verify_stream(musig, iter(records), max_workers=2, window=2, chunk_size=4)) == expected
+        assert sorted(verify_stream(musig, records, max_workers=2, chunk_size=4, ordered=False)) == expected
+        assert list(verify_stream(musig, [])) == []
+
+    def test_command(self, tmp_path, capsys):
+        path = tmp_path / 'records'
+        with open(path, 'wb') as file:
+            write_records(file, self.records(SchnorrMusig(), 6))
+
+        assert main(['verify', '--workers', '2', str(path)]) == 1
+        output = capsys.readouterr().out
+        assert 'records: 6' in output
+        assert 'invalid: 2' in output
+        assert 'throughput:' in output
@@ -0,0 +1,67 @@
+import pytest
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigWireError
+from zksync.sdk.musig.schnorr_musig_wire import HEADER
+from zksync.sdk.musig.schnorr_musig_wire import Round
+from zksync.sdk.musig.schnorr_musig_wire import RoundCollector
+from zksync.sdk.musig.schnorr_musig_wire import decode
+from zksync.sdk.musig.schnorr_musig_wire import decode_all
+from zksync.sdk.musig.schnorr_musig_wire import encode
+from zksync.sdk.musig.schnorr_musig_wire import encode_round
+
+
+class TestSchnorrMusigWire:
+    SESSION = bytes(range(16))
+
+    def test_encode_decode(self):
+        data = encode(self.SESSION, Round.AGGREGATED_SIGNATURE, 7, b'\x01' * 64)
+        assert len(data) == HEADER.size + 64
+
+        envelope, end = decode(data)
+        assert end == len(data)
+        assert envelope.session_id == self.SESSION
+        assert (envelope.round, envelope.position) == (Round.AGGREGATED_SIGNATURE, 7)
+        assert envelope.payload == b'\x01' * 64
+        assert envelope.payload.obj is data
+        assert envelope.encode() == data
+
+    def test_invalid(self):
+        data = bytearray(encode(self.SESSION, Round.COMMITMENT, 0, b'\x01' * 32))
+        with pytest.raises(SchnorrMusigWireError):
+            decode(data[:-1])
+        with pytest.raises(SchnorrMusigWireError):
+            encode(self.SESSION, Round.COMMITMENT, 0, b'\x01' * 31)
+
+        data[4] = 2
+        with pytest.raises(SchnorrMusigWireError):
+            decode(data)
+
+    def test_collector(self):
+        payloads = b''.join(bytes([index]) * 32 for index in range(3))
+        envelopes = list(decode_all(encode_round(self.SESSION, Round.SIGNATURE_SHARE, payloads)))
+        assert [envelope.position for envelope in envelopes] == [0, 1, 2]
+
+        collector = RoundCollector(self.SESSION, Round.SIGNATURE_SHARE, 3)
+        assert not collector.add(envelopes[2])
+        assert not collector.add(envelopes[2])
+        assert collector.payloads is None
+        assert collector.missing == [0, 1]
+        assert not collector.add(envelopes[0])
+        assert collector.add(envelopes[1])
+        assert collector.payloads == payloads
+
+        with pytest.raises(SchnorrMusigWireError):
+            collector.add(decode(encode(self.SESSION, Round.SIGNATURE_SHARE, 0, b'\x09' * 32))[0])
+        with pytest.raises(SchnorrMusigWireError):
+            collector.add(decode(encode(self.SESSION, Round.COMMITMENT, 0, b'\x00' * 32))[0])
+
+    def test_round(self):
+        public_key = bytes.fromhex('179c3a59147d30316c886628852348c9b42a18b821084ac9ef79bd73e9b94e8d')
+
+        musig = SchnorrMusig()
+        with musig.create_signer([public_key], 0) as signer:
+            precommitment = signer.compute_precommitment()
+            collector = RoundCollector(self.SESSION, Round.PRECOMMITMENT, 1)
+            collector.add(decode(encode(self.SESSION, Round.PRECOMMITMENT, 0, precommitment))[0])
+            assert signer.receive_precommitments(collector.payloads)
@@ -4,11 +4,16 @@ import importlib.resources as pkg_resources
 class LoggerConfig:
 
   @staticmethod
-  def console(verbosity: int = 0) -> dict:
+  def console(verbosity: int = 0, instrumentation: bool = False) -> dict:
+    '''
+    Builds a logging.config.dictConfig dictionary. With instrumentation=True every native
+    musig call is logged at DEBUG by the zksync.sdk.musig.instrumentation logger.
+    '''
     stream = pkg_resources.open_binary('zksync.config', 'console.yaml')
     config = yaml.load(stream, Loader=yaml.FullLoader)
     config['loggers']['zksync']['level'] = LoggerConfig.level(verbosity)
     config['loggers']['__main__']['level'] = LoggerConfig.level(verbosity)
+    config['loggers']['zksync.sdk.musig.instrumentation']['level'] = 10 if instrumentation else 30
     return config
 
   @staticmethod
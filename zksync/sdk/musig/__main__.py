@@ -0,0 +1,74 @@
+"""Command line tools.
+
+    python -m zksync.sdk.musig verify [--workers N] [--window N] [--chunk-size N] [--unordered] FILE
+
+FILE holds framed (message, aggregated public key, signature) records, see schnorr_musig_stream; `-` reads stdin.
+"""
+import argparse
+import sys
+import time
+from typing import List
+from typing import Optional
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_stream import DEFAULT_CHUNK_SIZE
+from zksync.sdk.musig.schnorr_musig_stream import read_records
+from zksync.sdk.musig.schnorr_musig_stream import verify_stream
+
+
+def verify(options: argparse.Namespace) -> int:
+    file = sys.stdin.buffer if options.file == '-' else open(options.file, 'rb')
+    valid = invalid = 0
+    errors = {}
+    start = time.perf_counter()
+    try:
+        for index, code in verify_stream(SchnorrMusig(), read_records(file), max_workers=options.workers,
+                                         window=options.window, chunk_size=options.chunk_size,
+                                         ordered=not options.unordered):
+            if code == MusigRes.OK:
+                valid += 1
+            elif code == MusigRes.SIGNATURE_VERIFICATION_FAILED:
+                invalid += 1
+                if options.verbose:
+                    print(f'record {index}: invalid signature', file=sys.stderr)
+            else:
+                name = getattr(code, 'name', str(code))
+                errors[name] = errors.get(name, 0) + 1
+                if options.verbose:
+                    print(f'record {index}: {name}', file=sys.stderr)
+    finally:
+        if file is not sys.stdin.buffer:
+            file.close()
+    elapsed = time.perf_counter() - start
+
+    total = valid + invalid + sum(errors.values())
+    print(f'records: {total}')
+    print(f'valid: {valid}')
+    print(f'invalid: {invalid}')
+    for name, count in sorted(errors.items()):
+        print(f'error {name}: {count}')
+    print(f'elapsed: {elapsed:.3f}s')
+    print(f'throughput: {total / elapsed if elapsed else 0.0:.1f} records/s')
+    return 0 if valid == total else 1
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m zksync.sdk.musig')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    verify_parser = commands.add_parser('verify', help='verify a file of framed signature records')
+    verify_parser.add_argument('file', help='record file, or - for stdin')
+    verify_parser.add_argument('--workers', type=int, help='verification threads (default: CPU count)')
+    verify_parser.add_argument('--window', type=int, help='chunks in flight (default: 2 per worker)')
+    verify_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='records per chunk')
+    verify_parser.add_argument('--unordered', action='store_true', help='consume results as chunks complete')
+    verify_parser.add_argument('--verbose', action='store_true', help='report every failing record')
+    verify_parser.set_defaults(handler=verify)
+
+    options = parser.parse_args(args)
+    return options.handler(options)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
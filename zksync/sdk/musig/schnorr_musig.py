@@ -1,34 +1,156 @@
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from ctypes import ArgumentError
+from typing import Iterable
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Union
 
-from _functools import reduce
-
+from zksync.sdk.musig.schnorr_musig_batch import BatchExecutor
+from zksync.sdk.musig.schnorr_musig_batch import BatchVerificationResult
+from zksync.sdk.musig.schnorr_musig_batch import KeyValidationResult
+from zksync.sdk.musig.schnorr_musig_batch import VerificationItem
+from zksync.sdk.musig.schnorr_musig_batch import chunk_ranges
+from zksync.sdk.musig.schnorr_musig_buffer import join
+from zksync.sdk.musig.schnorr_musig_buffer import nbytes
+from zksync.sdk.musig.schnorr_musig_cache import AggregatedPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_cache import ValidPublicKeyCache
+from zksync.sdk.musig.schnorr_musig_cache import VerificationCache
+from zksync.sdk.musig.schnorr_musig_cache import shared_key_cache
+from zksync.sdk.musig.schnorr_musig_cache import shared_valid_key_cache
 from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigInvalidKeyError
 from zksync.sdk.musig.schnorr_musig_native import SchnorrMusigLoader
+from zksync.sdk.musig.schnorr_musig_native import SchnorrMusigNative
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_prepared import PreparedPublicKey
+from zksync.sdk.musig.schnorr_musig_registry import KeySet
+from zksync.sdk.musig.schnorr_musig_registry import KeySetRegistry
+from zksync.sdk.musig.schnorr_musig_seed import SeedSource
+from zksync.sdk.musig.schnorr_musig_seed import shared_seed_source
 from zksync.sdk.musig.schnorr_musig_signer import AggregatedPublicKey
 from zksync.sdk.musig.schnorr_musig_signer import AggregatedPublicKeyPointer
 from zksync.sdk.musig.schnorr_musig_signer import MusigRes
 from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+from zksync.sdk.musig.schnorr_musig_signer_pool import DEFAULT_PRECOMMITMENT_TTL
+from zksync.sdk.musig.schnorr_musig_signer_pool import DEFAULT_SIGNER_POOL_SIZE
+from zksync.sdk.musig.schnorr_musig_signer_pool import SchnorrMusigPrecommitmentPool
+from zksync.sdk.musig.schnorr_musig_signer_pool import SchnorrMusigSignerPool
 
 
 class SchnorrMusig:
+    """Entry point for key aggregation, signer creation and verification.
+
+    Instances can be pickled, e.g. to hand them to a ProcessPoolExecutor: the unpickled copy
+    re-attaches to the loader's handle for the same backend and library path (the default handle
+    when `native` did not come from SchnorrMusigLoader), and to that process's shared caches.
+    Caches and seed sources owned by this instance arrive empty.
+    """
+
+    def __init__(self, key_cache: Optional[AggregatedPublicKeyCache] = None,
+                 native: Optional[SchnorrMusigNative] = None, seed_source: Optional[SeedSource] = None,
+                 verification_cache: Optional[VerificationCache] = None,
+                 valid_key_cache: Optional[ValidPublicKeyCache] = None) -> None:
+        self.native = SchnorrMusigLoader.load() if native is None else native
+        self.key_cache = shared_key_cache if key_cache is None else key_cache
+        self.seed_source = shared_seed_source if seed_source is None else seed_source
+        self.verification_cache = verification_cache
+        self.valid_key_cache = shared_valid_key_cache if valid_key_cache is None else valid_key_cache
 
-    def __init__(self) -> None:
-        self.native = SchnorrMusigLoader.load()
+    def __getstate__(self) -> dict:
+        return {
+            'native': SchnorrMusigLoader.handle_key(self.native),
+            'key_cache': None if self.key_cache is shared_key_cache else self.key_cache,
+            'seed_source': None if self.seed_source is shared_seed_source else self.seed_source,
+            'verification_cache': self.verification_cache,
+            'valid_key_cache': None if self.valid_key_cache is shared_valid_key_cache else self.valid_key_cache,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        key = state.pop('native')
+        self.__init__(native=SchnorrMusigLoader.load() if key is None else SchnorrMusigLoader.load(*key), **state)
 
     def create_signer(self, public_keys: List[bytes], position: int) -> SchnorrMusigSigner:
-        encoded_public_keys = reduce(lambda x, y: x + y, public_keys)
-        signer = self.native.schnorr_musig_new_signer(encoded_public_keys, len(encoded_public_keys), position)
-        return SchnorrMusigSigner(self, signer, public_keys)
+        encoded_public_keys = join(public_keys)
+        return SchnorrMusigSigner(self, self._new_signer(public_keys, encoded_public_keys, position), public_keys,
+                                  encoded_public_keys)
 
-    def verify(self, message: bytes, signature: bytes, public_keys: Union[bytes, List[bytes]]) -> bool:
-        if type(public_keys) == list:
-            encoded_public_keys = reduce(lambda x, y: x + y, public_keys)
-        else:
-            encoded_public_keys = public_keys
+    def register_key_set(self, registry: KeySetRegistry, set_id: str, public_keys: List[bytes]) -> KeySet:
+        return registry.add(set_id, public_keys, self.aggregate_public_keys(*public_keys))
+
+    def create_key_set_signer(self, key_set: KeySet, public_key: bytes) -> SchnorrMusigSigner:
+        """Creates a signer for `public_key` in a registered key set, reusing its stored aggregated key."""
+        encoded_public_keys = key_set.encoded_public_keys
+        signer = self._new_signer(key_set.public_keys, encoded_public_keys, key_set.position(public_key))
+        signer = SchnorrMusigSigner(self, signer, key_set.public_keys, encoded_public_keys)
+        signer._aggregated_public_key = key_set.aggregated_public_key
+        return signer
+
+    def create_signer_pool(self, public_keys: List[bytes], position: int,
+                           size: int = DEFAULT_SIGNER_POOL_SIZE) -> SchnorrMusigSignerPool:
+        pool = SchnorrMusigSignerPool(self, public_keys, position, size)
+        pool.refill()
+        return pool
+
+    def compute_precommitments(self, signers: Sequence[SchnorrMusigSigner], out=None) -> bytes:
+        """Computes a precommitment for every signer, packed in order into one buffer.
+
+        Seeds for the whole batch are drawn from `seed_source` at once. For signers of one session
+        the result can be passed to receive_precommitments() as-is.
+        """
+        count = len(signers)
+        precommitments = bytearray(STANDARD_ENCODING_LENGTH * count) if out is None else out
+        slots = memoryview(precommitments)
+        seeds = self.seed_source.take(count)
+        seed_length = self.seed_source.seed_length
+        for index, signer in enumerate(signers):
+            slot = slots[index * STANDARD_ENCODING_LENGTH:(index + 1) * STANDARD_ENCODING_LENGTH]
+            signer.compute_precommitment(seeds[index * seed_length:(index + 1) * seed_length], out=slot)
+
+        return bytes(precommitments) if out is None else out
 
-        code = self.native.schnorr_musig_verify(message, len(message), encoded_public_keys, len(encoded_public_keys),
-                                                signature, len(signature))
+    def create_precommitment_pool(self, public_keys: List[bytes], position: int,
+                                  size: int = DEFAULT_SIGNER_POOL_SIZE,
+                                  ttl: Optional[float] = DEFAULT_PRECOMMITMENT_TTL) -> SchnorrMusigPrecommitmentPool:
+        pool = SchnorrMusigPrecommitmentPool(self, public_keys, position, size, ttl)
+        pool.refill()
+        return pool
+
+    def prepare_public_key(self, *public_keys: bytes) -> PreparedPublicKey:
+        """Aggregates and validates a key set once for repeated verify() calls; raises SchnorrMusigError if invalid."""
+        return PreparedPublicKey(list(public_keys), self.aggregate_public_keys(*public_keys))
+
+    def validate_public_keys(self, public_keys: Sequence[bytes], max_workers: Optional[int] = None,
+                             executor: Optional[Executor] = None) -> KeyValidationResult:
+        """Checks every public key on its own, concurrently, and reports a native code per index.
+
+        Keys already in `valid_key_cache` are not checked again, and keys found valid are added to it.
+        """
+        codes: List[Optional[MusigRes]] = [None] * len(public_keys)
+        pending = []
+        for index, public_key in enumerate(public_keys):
+            if nbytes(public_key) == STANDARD_ENCODING_LENGTH and self.valid_key_cache.check(public_key):
+                codes[index] = MusigRes.OK
+            else:
+                pending.append(index)
+
+        def validate_range(start: int, end: int) -> None:
+            for index in pending[start:end]:
+                codes[index] = self._validate_public_key(public_keys[index])
+
+        if pending:
+            with BatchExecutor(executor, max_workers) as pool:
+                ranges = chunk_ranges(len(pending), pool.workers)
+                for future in [pool.submit(validate_range, start, end) for start, end in ranges]:
+                    future.result()
+
+        return KeyValidationResult(codes)
+
+    def verify(self, message: bytes, signature: bytes,
+               public_keys: Union[bytes, List[bytes], KeySet, PreparedPublicKey]) -> bool:
+        code = self.verify_code(message, signature, public_keys)
 
         if code == MusigRes.OK:
             return True
@@ -37,13 +159,140 @@ class SchnorrMusig:
         else:
             raise SchnorrMusigError(code)
 
+    def verify_code(self, message: bytes, signature: bytes,
+                    public_keys: Union[bytes, List[bytes], KeySet, PreparedPublicKey]) -> MusigRes:
+        if isinstance(public_keys, PreparedPublicKey):
+            encoded_public_keys = public_keys.aggregated_public_key
+        elif isinstance(public_keys, KeySet):
+            encoded_public_keys = public_keys.aggregated_public_key
+        elif type(public_keys) == list:
+            try:
+                encoded_public_keys = self.aggregate_encoded_public_keys(join(public_keys))
+            except SchnorrMusigError as e:
+                return e.code
+        else:
+            encoded_public_keys = public_keys
+
+        if self.verification_cache is None:
+            return self._verify(message, signature, encoded_public_keys)
+        return self.verification_cache.get_or_compute(
+            message, signature, encoded_public_keys, lambda: self._verify(message, signature, encoded_public_keys))
+
+    def verify_batch(self, items: Iterable[VerificationItem], max_workers: Optional[int] = None,
+                     executor: Optional[Executor] = None) -> BatchVerificationResult:
+        """Verifies (message, signature, public_keys) triples concurrently.
+
+        Native errors and malformed items are reported per item in the result instead of being raised.
+        """
+        items = list(items)
+        codes: List[Optional[MusigRes]] = [None] * len(items)
+
+        def verify_range(start: int, end: int) -> None:
+            for index in range(start, end):
+                codes[index] = self._verify_item(items[index])
+
+        with BatchExecutor(executor, max_workers) as pool:
+            ranges = chunk_ranges(len(items), pool.workers)
+            for future in [pool.submit(verify_range, start, end) for start, end in ranges]:
+                future.result()
+
+        return BatchVerificationResult(codes)
+
+    def verify_all(self, items: Iterable[VerificationItem], max_workers: Optional[int] = None,
+                   executor: Optional[Executor] = None) -> bool:
+        """Returns True only if every triple is valid, stopping at the first invalid one."""
+        items = list(items)
+        failed = False
+
+        def verify_range(start: int, end: int) -> bool:
+            for index in range(start, end):
+                if failed:
+                    return False
+                if self._verify_item(items[index]) != MusigRes.OK:
+                    return False
+            return True
+
+        with BatchExecutor(executor, max_workers) as pool:
+            pending = {pool.submit(verify_range, start, end) for start, end in chunk_ranges(len(items), pool.workers)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if not all(future.result() for future in done):
+                    failed = True
+                    for future in pending:
+                        future.cancel()
+                    return False
+
+        return True
+
     def aggregate_public_keys(self, *public_keys: bytes) -> bytes:
-        encoded_public_keys = reduce(lambda x, y: x + y, public_keys)
+        return self.aggregate_encoded_public_keys(join(public_keys))
+
+    def aggregate_encoded_public_keys(self, encoded_public_keys: bytes) -> bytes:
+        return self.key_cache.get_or_compute(encoded_public_keys,
+                                             lambda: self._aggregate_public_keys(encoded_public_keys))
+
+    def invalidate_public_keys(self, *public_keys: bytes) -> None:
+        self.key_cache.invalidate(join(public_keys) if public_keys else None)
+
+    def _aggregate_public_keys(self, encoded_public_keys: bytes) -> bytes:
         aggregated_public_key = AggregatedPublicKey()
-        code = self.native.schnorr_musig_aggregate_pubkeys(encoded_public_keys, len(encoded_public_keys),
+        code = self.native.schnorr_musig_aggregate_pubkeys(encoded_public_keys, nbytes(encoded_public_keys),
                                                            AggregatedPublicKeyPointer(aggregated_public_key))
 
+        if code == MusigRes.INVALID_PUBLIC_KEY:
+            self._raise_invalid_keys(encoded_public_keys)
         if code != MusigRes.OK:
             raise SchnorrMusigError(code)
 
         return bytes(aggregated_public_key.data)
+
+    def _new_signer(self, public_keys: List[bytes], encoded_public_keys: bytes, position: int):
+        signer = self.native.schnorr_musig_new_signer(encoded_public_keys, nbytes(encoded_public_keys), position)
+        if signer:
+            return signer
+
+        # The native call reports failures only as a null handle, so work out the cause here.
+        if nbytes(encoded_public_keys) % STANDARD_ENCODING_LENGTH:
+            raise SchnorrMusigError(MusigRes.INVALID_PUBKEY_LENGTH)
+        if not 0 <= position < len(public_keys):
+            raise SchnorrMusigError(MusigRes.INVALID_PARTICIPANT_POSITION,
+                                    f'position {position} is out of range for {len(public_keys)} keys')
+        self._raise_invalid_keys(encoded_public_keys)
+        raise SchnorrMusigError(MusigRes.INTERNAL_ERROR, 'schnorr_musig_new_signer returned a null handle')
+
+    def _raise_invalid_keys(self, encoded_public_keys: bytes) -> None:
+        """Raises SchnorrMusigInvalidKeyError naming the failing keys, if any of them is invalid."""
+        view = memoryview(encoded_public_keys).cast('B')
+        invalid = {}
+        for index in range(len(view) // STANDARD_ENCODING_LENGTH):
+            public_key = view[index * STANDARD_ENCODING_LENGTH:(index + 1) * STANDARD_ENCODING_LENGTH]
+            if not self.valid_key_cache.check(public_key):
+                code = self._validate_public_key(public_key)
+                if code != MusigRes.OK:
+                    invalid[index] = code
+        if invalid:
+            raise SchnorrMusigInvalidKeyError(invalid)
+
+    def _validate_public_key(self, public_key: bytes) -> MusigRes:
+        if nbytes(public_key) != STANDARD_ENCODING_LENGTH:
+            return MusigRes.INVALID_PUBKEY_LENGTH
+        aggregated_public_key = AggregatedPublicKey()
+        code = self.native.schnorr_musig_aggregate_pubkeys(public_key, STANDARD_ENCODING_LENGTH,
+                                                           AggregatedPublicKeyPointer(aggregated_public_key))
+        if code == MusigRes.OK:
+            self.valid_key_cache.add(public_key)
+        return code
+
+    def _verify(self, message: bytes, signature: bytes, encoded_public_keys: bytes) -> MusigRes:
+        return self.native.schnorr_musig_verify(message, nbytes(message), encoded_public_keys,
+                                                nbytes(encoded_public_keys), signature, nbytes(signature))
+
+    def _verify_item(self, item: VerificationItem) -> MusigRes:
+        try:
+            message, signature, public_keys = item
+            return self.verify_code(message, signature, public_keys)
+        except SchnorrMusigError as e:
+            return e.code
+        except (TypeError, ValueError, ArgumentError):
+            # A malformed item, e.g. a None key or a buffer ctypes cannot convert, fails on its own.
+            return MusigRes.INVALID_INPUT_DATA
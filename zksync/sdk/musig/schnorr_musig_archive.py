@@ -0,0 +1,235 @@
+"""Append-only, memory-mapped archive of aggregated signatures.
+
+The archive file starts with ARCHIVE_HEADER (magic and record size) followed by fixed-width records:
+
+    message digest   32 bytes  blake2b-256 of the message
+    aggregated key   32 bytes
+    signature        64 bytes
+    message offset   u64       into the `<path>.messages` file
+    message length   u32
+    checksum         u32       crc32 of the fields above and the message
+
+Messages are appended to the sidecar file before the record that points at them, and both writes
+are fsync'ed under an exclusive flock, so a record never refers to a message that is not on disk.
+A torn trailing record is ignored by readers and truncated by the next writer; records failing
+their checksum are skipped and counted in `corrupt`.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig_batch import BatchVerificationResult
+from zksync.sdk.musig.schnorr_musig_batch import VerificationItem
+from zksync.sdk.musig.schnorr_musig_buffer import nbytes
+from zksync.sdk.musig.schnorr_musig_native import AGG_SIG_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_registry import FileLock
+
+if TYPE_CHECKING:
+    from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+
+MAGIC = b'MUSIGSA1'
+MESSAGES_SUFFIX = '.messages'
+DIGEST_LENGTH = 32
+
+ARCHIVE_HEADER = struct.Struct('<8sI4x')
+RECORD = struct.Struct(f'<{DIGEST_LENGTH}s{STANDARD_ENCODING_LENGTH}s{AGG_SIG_ENCODING_LENGTH}sQII')
+CHECKSUM = struct.Struct('<I')
+
+
+class SignatureRecord:
+    """One archived signature; every field is a view into the archive's memory map."""
+
+    __slots__ = ('index', 'message_digest', 'aggregated_public_key', 'signature', 'message')
+
+    def __init__(self, index: int, message_digest: memoryview, aggregated_public_key: memoryview,
+                 signature: memoryview, message: memoryview) -> None:
+        self.index = index
+        self.message_digest = message_digest
+        self.aggregated_public_key = aggregated_public_key
+        self.signature = signature
+        self.message = message
+
+    def item(self) -> VerificationItem:
+        return self.message, self.signature, self.aggregated_public_key
+
+
+class SignatureArchive:
+    """Append-only store of (message, aggregated public key, signature) with O(1) lookup by message.
+
+    The digest index lives in memory and is filled from the mapped digest column; records appended
+    by other processes are picked up on the next lookup miss or refresh(). When a message has been
+    archived more than once, lookups return the latest record.
+    """
+
+    def __init__(self, path: str, fsync: bool = True) -> None:
+        self.path = path
+        self.fsync = fsync
+        self.corrupt = 0
+        self._lock = threading.RLock()
+        self._file = open(path, 'a+b')
+        self._messages = open(path + MESSAGES_SUFFIX, 'a+b')
+        self._map: Optional[mmap.mmap] = None
+        self._messages_map = memoryview(b'')
+        self._count = 0
+        self._index: Dict[bytes, int] = {}
+        self._invalid: Set[int] = set()
+        with self._locked():
+            if os.fstat(self._file.fileno()).st_size == 0:
+                self._file.write(ARCHIVE_HEADER.pack(MAGIC, RECORD.size))
+                self._sync(self._file)
+        self.refresh()
+        if self._map[:ARCHIVE_HEADER.size] != ARCHIVE_HEADER.pack(MAGIC, RECORD.size):
+            self.close()
+            raise ValueError(f'{path} is not a signature archive')
+
+    @staticmethod
+    def digest(message: bytes) -> bytes:
+        return hashlib.blake2b(message, digest_size=DIGEST_LENGTH).digest()
+
+    def refresh(self) -> None:
+        """Maps and indexes records appended since the last scan."""
+        with self._lock:
+            size = os.fstat(self._file.fileno()).st_size
+            if self._map is not None and size == len(self._map):
+                return
+            # Earlier maps stay alive for as long as records handed out still reference them.
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+            messages_size = os.fstat(self._messages.fileno()).st_size
+            if messages_size != len(self._messages_map):
+                self._messages_map = memoryview(mmap.mmap(self._messages.fileno(), messages_size,
+                                                          access=mmap.ACCESS_READ))
+
+            view = memoryview(self._map)
+            count = max(0, (size - ARCHIVE_HEADER.size) // RECORD.size)
+            for index in range(self._count, count):
+                offset = ARCHIVE_HEADER.size + index * RECORD.size
+                digest, _, _, message_offset, message_length, checksum = RECORD.unpack_from(view, offset)
+                message = self._messages_map[message_offset:message_offset + message_length]
+                if len(message) != message_length or \
+                        zlib.crc32(message, zlib.crc32(view[offset:offset + RECORD.size - CHECKSUM.size])) != checksum:
+                    self._invalid.add(index)
+                    self.corrupt += 1
+                    continue
+                self._index[digest] = index
+            self._count = count
+
+    def append(self, message: bytes, aggregated_public_key: bytes, signature: bytes) -> int:
+        """Archives one signature and returns its record index."""
+        return self.extend([(message, aggregated_public_key, signature)])
+
+    def extend(self, entries: Iterable[Tuple[bytes, bytes, bytes]]) -> int:
+        """Archives (message, aggregated public key, signature) triples with one lock and one fsync per file.
+
+        Returns the record index of the last entry written.
+        """
+        entries = list(entries)
+        for _, aggregated_public_key, signature in entries:
+            if nbytes(aggregated_public_key) != STANDARD_ENCODING_LENGTH:
+                raise ValueError(f'aggregated public key must be {STANDARD_ENCODING_LENGTH} bytes long')
+            if nbytes(signature) != AGG_SIG_ENCODING_LENGTH:
+                raise ValueError(f'signature must be {AGG_SIG_ENCODING_LENGTH} bytes long')
+
+        with self._lock, self._locked():
+            size = os.fstat(self._file.fileno()).st_size
+            torn = (size - ARCHIVE_HEADER.size) % RECORD.size
+            if torn:
+                self._file.truncate(size - torn)
+            first = (size - torn - ARCHIVE_HEADER.size) // RECORD.size
+
+            message_offset = os.fstat(self._messages.fileno()).st_size
+            records = []
+            for message, aggregated_public_key, signature in entries:
+                message = bytes(message)
+                fields = RECORD.pack(self.digest(message), bytes(aggregated_public_key), bytes(signature),
+                                     message_offset, len(message), 0)[:-CHECKSUM.size]
+                records.append(fields + CHECKSUM.pack(zlib.crc32(message, zlib.crc32(fields))))
+                message_offset += len(message)
+
+            self._messages.write(b''.join(bytes(message) for message, _, _ in entries))
+            self._sync(self._messages)
+            self._file.write(b''.join(records))
+            self._sync(self._file)
+        self.refresh()
+        return first + len(entries) - 1
+
+    def get(self, message: bytes) -> Optional[SignatureRecord]:
+        return self.get_digest(self.digest(message))
+
+    def get_digest(self, message_digest: bytes) -> Optional[SignatureRecord]:
+        """Looks a record up by the blake2b-256 digest of its message."""
+        with self._lock:
+            index = self._index.get(message_digest)
+            if index is None:
+                self.refresh()
+                index = self._index.get(message_digest)
+            return None if index is None else self._record(index)
+
+    def items(self) -> Iterator[VerificationItem]:
+        """(message, signature, aggregated public key) views of every record, for SchnorrMusig.verify_batch."""
+        return (record.item() for record in self)
+
+    def verify(self, musig: SchnorrMusig, max_workers: Optional[int] = None,
+               executor: Optional[Executor] = None) -> BatchVerificationResult:
+        """Re-verifies every valid record; result indices follow iteration order."""
+        return musig.verify_batch(self.items(), max_workers, executor)
+
+    def close(self) -> None:
+        with self._lock:
+            self._map = None
+            self._messages_map = memoryview(b'')
+            self._file.close()
+            self._messages.close()
+
+    def __iter__(self) -> Iterator[SignatureRecord]:
+        """Yields records in append order without copying, skipping ones that failed their checksum."""
+        with self._lock:
+            count = self._count
+        for index in range(count):
+            if index not in self._invalid:
+                yield self._record(index)
+
+    def __len__(self) -> int:
+        return self._count - len(self._invalid)
+
+    def __contains__(self, message: bytes) -> bool:
+        return self.get(message) is not None
+
+    def __enter__(self) -> SignatureArchive:
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        self.close()
+
+    def _record(self, index: int) -> SignatureRecord:
+        with self._lock:
+            view = memoryview(self._map)
+            messages = self._messages_map
+        offset = ARCHIVE_HEADER.size + index * RECORD.size
+        key_offset = offset + DIGEST_LENGTH
+        signature_offset = key_offset + STANDARD_ENCODING_LENGTH
+        _, _, _, message_offset, message_length, _ = RECORD.unpack_from(view, offset)
+        return SignatureRecord(index, view[offset:key_offset], view[key_offset:signature_offset],
+                               view[signature_offset:signature_offset + AGG_SIG_ENCODING_LENGTH],
+                               messages[message_offset:message_offset + message_length])
+
+    def _sync(self, file) -> None:
+        file.flush()
+        if self.fsync:
+            os.fsync(file.fileno())
+
+    def _locked(self):
+        return FileLock(self._file)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_batch import BatchVerificationResult
+from zksync.sdk.musig.schnorr_musig_batch import VerificationItem
+from zksync.sdk.musig.schnorr_musig_batch import chunk_ranges
+from zksync.sdk.musig.schnorr_musig_batch import default_workers
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+from zksync.sdk.musig.schnorr_musig_signer_pool import DEFAULT_SIGNER_POOL_SIZE
+from zksync.sdk.musig.schnorr_musig_signer_pool import SchnorrMusigSignerPool
+
+
+class AsyncSchnorrMusig:
+    """Awaitable SchnorrMusig: native calls run on a bounded thread pool instead of the event loop."""
+
+    def __init__(self, musig: Optional[SchnorrMusig] = None, executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None) -> None:
+        self.musig = SchnorrMusig() if musig is None else musig
+        self.workers = max_workers or getattr(executor, '_max_workers', None) or default_workers()
+        self._owns_executor = executor is None
+        self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix='musig') if executor is None else executor
+
+    async def run(self, fn, *args):
+        return await asyncio.wrap_future(self.executor.submit(fn, *args))
+
+    async def create_signer(self, public_keys: List[bytes], position: int) -> AsyncSchnorrMusigSigner:
+        future = self.executor.submit(self.musig.create_signer, public_keys, position)
+        try:
+            signer = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(_revoke_result)
+            raise
+        return AsyncSchnorrMusigSigner(self, signer)
+
+    async def create_signer_pool(self, public_keys: List[bytes], position: int,
+                                 size: int = DEFAULT_SIGNER_POOL_SIZE) -> SchnorrMusigSignerPool:
+        return await self.run(self.musig.create_signer_pool, public_keys, position, size)
+
+    async def verify(self, message: bytes, signature: bytes, public_keys: Union[bytes, List[bytes]]) -> bool:
+        return await self.run(self.musig.verify, message, signature, public_keys)
+
+    async def verify_code(self, message: bytes, signature: bytes,
+                          public_keys: Union[bytes, List[bytes]]) -> MusigRes:
+        return await self.run(self.musig.verify_code, message, signature, public_keys)
+
+    async def verify_batch(self, items: Iterable[VerificationItem]) -> BatchVerificationResult:
+        items = list(items)
+        chunks = await asyncio.gather(*[self.run(self._verify_range, items, start, end)
+                                        for start, end in chunk_ranges(len(items), self.workers)])
+        return BatchVerificationResult([code for chunk in chunks for code in chunk])
+
+    async def verify_all(self, items: Iterable[VerificationItem]) -> bool:
+        items = list(items)
+        tasks = [asyncio.ensure_future(self.run(self._verify_range, items, start, end))
+                 for start, end in chunk_ranges(len(items), self.workers)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                if any(code != MusigRes.OK for code in await task):
+                    return False
+            return True
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aggregate_public_keys(self, *public_keys: bytes) -> bytes:
+        return await self.run(self.musig.aggregate_public_keys, *public_keys)
+
+    async def aggregate_encoded_public_keys(self, encoded_public_keys: bytes) -> bytes:
+        return await self.run(self.musig.aggregate_encoded_public_keys, encoded_public_keys)
+
+    def invalidate_public_keys(self, *public_keys: bytes) -> None:
+        self.musig.invalidate_public_keys(*public_keys)
+
+    async def close(self) -> None:
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def __aenter__(self) -> AsyncSchnorrMusig:
+        return self
+
+    async def __aexit__(self, type_, value, traceback) -> None:
+        await self.close()
+
+    def _verify_range(self, items: List[VerificationItem], start: int, end: int) -> List[MusigRes]:
+        return [self.musig._verify_item(items[index]) for index in range(start, end)]
+
+
+class AsyncSchnorrMusigSigner:
+    """Awaitable SchnorrMusigSigner.
+
+    Round calls on one signer are serialized. revoke(), including the one run when a cancelled
+    task leaves an `async with` block, waits for an in-flight native call before freeing the handle.
+    """
+
+    def __init__(self, musig: AsyncSchnorrMusig, signer: SchnorrMusigSigner) -> None:
+        self.musig = musig
+        self.signer = signer
+        self._lock = asyncio.Lock()
+        self._in_flight: Optional[Future] = None
+
+    @property
+    def aggregated_public_key(self) -> bytes:
+        return self.signer.aggregated_public_key
+
+    @property
+    def revoked(self) -> bool:
+        return self.signer.revoked
+
+    async def sign(self, private_key: bytes, message: bytes, out=None) -> bytes:
+        return await self._run(self.signer.sign, private_key, message, out)
+
+    async def compute_precommitment(self, seed: Optional[bytes] = None, out=None) -> bytes:
+        return await self._run(self.signer.compute_precommitment, seed, out)
+
+    async def receive_precommitments(self, *precommitments: bytes, out=None) -> bytes:
+        return await self._run(lambda: self.signer.receive_precommitments(*precommitments, out=out))
+
+    async def receive_commitments(self, *commitments: bytes, out=None) -> bytes:
+        return await self._run(lambda: self.signer.receive_commitments(*commitments, out=out))
+
+    async def aggregate_signature(self, *signatures: bytes, out=None) -> bytes:
+        return await self._run(lambda: self.signer.aggregate_signature(*signatures, out=out))
+
+    async def verify(self, message: bytes, signature: bytes) -> bool:
+        return await self.musig.run(self.signer.verify, message, signature)
+
+    def revoke(self) -> None:
+        in_flight = self._in_flight
+        if in_flight is not None and not in_flight.done():
+            in_flight.add_done_callback(lambda _: self.signer.revoke())
+        else:
+            self.signer.revoke()
+
+    async def __aenter__(self) -> AsyncSchnorrMusigSigner:
+        return self
+
+    async def __aexit__(self, type_, value, traceback) -> None:
+        self.revoke()
+
+    async def _run(self, fn, *args):
+        async with self._lock:
+            self._in_flight = self.musig.executor.submit(fn, *args)
+            return await asyncio.wrap_future(self._in_flight)
+
+
+def _revoke_result(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().revoke()
@@ -0,0 +1,102 @@
+import math
+import os
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_prepared import PreparedPublicKey
+from zksync.sdk.musig.schnorr_musig_registry import KeySet
+
+VerificationItem = Tuple[bytes, bytes, Union[bytes, List[bytes], KeySet, PreparedPublicKey]]
+
+CHUNKS_PER_WORKER = 4
+
+
+class BatchVerificationResult:
+
+    def __init__(self, codes: List[MusigRes]) -> None:
+        self.codes = codes
+
+    @property
+    def results(self) -> List[bool]:
+        return [code == MusigRes.OK for code in self.codes]
+
+    @property
+    def all_valid(self) -> bool:
+        return all(code == MusigRes.OK for code in self.codes)
+
+    @property
+    def errors(self) -> Dict[int, SchnorrMusigError]:
+        return {index: SchnorrMusigError(code) for index, code in enumerate(self.codes)
+                if code not in (MusigRes.OK, MusigRes.SIGNATURE_VERIFICATION_FAILED)}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[bool]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> bool:
+        return self.codes[index] == MusigRes.OK
+
+
+class KeyValidationResult:
+
+    def __init__(self, codes: List[MusigRes]) -> None:
+        self.codes = codes
+
+    @property
+    def all_valid(self) -> bool:
+        return all(code == MusigRes.OK for code in self.codes)
+
+    @property
+    def invalid(self) -> Dict[int, MusigRes]:
+        return {index: code for index, code in enumerate(self.codes) if code != MusigRes.OK}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[bool]:
+        return (code == MusigRes.OK for code in self.codes)
+
+    def __getitem__(self, index: int) -> bool:
+        return self.codes[index] == MusigRes.OK
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def chunk_ranges(count: int, workers: int) -> List[Tuple[int, int]]:
+    if count == 0:
+        return []
+    size = max(1, math.ceil(count / (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+class BatchExecutor:
+
+    def __init__(self, executor: Optional[Executor], max_workers: Optional[int]) -> None:
+        self.executor = executor
+        self.owned = executor is None
+        self.workers = max_workers or getattr(executor, '_max_workers', None) or default_workers()
+
+    def __enter__(self) -> 'BatchExecutor':
+        if self.owned:
+            self.executor = ThreadPoolExecutor(self.workers)
+        return self
+
+    def submit(self, fn, *args) -> Future:
+        return self.executor.submit(fn, *args)
+
+    def __exit__(self, type_, value, traceback) -> None:
+        if self.owned:
+            self.executor.shutdown(wait=True)
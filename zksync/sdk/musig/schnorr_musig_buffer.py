@@ -0,0 +1,110 @@
+import ctypes
+from ctypes import POINTER
+from ctypes import Structure
+from ctypes import c_char_p
+from ctypes import c_int
+from ctypes import c_ssize_t
+from ctypes import c_ubyte
+from ctypes import c_void_p
+from ctypes import py_object
+from typing import Sequence
+from typing import Type
+from typing import TypeVar
+
+T = TypeVar('T', bound=Structure)
+
+
+class _PyBuffer(Structure):
+    _fields_ = [
+        ("buf", c_void_p),
+        ("obj", c_void_p),
+        ("len", c_ssize_t),
+        ("itemsize", c_ssize_t),
+        ("readonly", c_int),
+        ("ndim", c_int),
+        ("format", c_char_p),
+        ("shape", c_void_p),
+        ("strides", c_void_p),
+        ("suboffsets", c_void_p),
+        ("internal", c_void_p),
+    ]
+
+
+PY_BUF_SIMPLE = 0
+
+try:
+    _get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+    _get_buffer.argtypes = [py_object, POINTER(_PyBuffer), c_int]
+    _get_buffer.restype = c_int
+    _release_buffer = ctypes.pythonapi.PyBuffer_Release
+    _release_buffer.argtypes = [POINTER(_PyBuffer)]
+    _release_buffer.restype = None
+except AttributeError:
+    _get_buffer = None
+    _release_buffer = None
+
+
+class ReadOnlyBuffer:
+    """Exposes the address of a read-only buffer (e.g. a memoryview over bytes or an ACCESS_READ mmap).
+
+    ctypes can only borrow writable buffers through from_buffer, so the buffer is exported with
+    PyObject_GetBuffer and released when this object is collected, right after the native call.
+    """
+
+    def __init__(self, data) -> None:
+        self._view = _PyBuffer()
+        _get_buffer(data, self._view, PY_BUF_SIMPLE)
+        self._as_parameter_ = c_void_p(self._view.buf)
+
+    def __del__(self) -> None:
+        if self._view.obj:
+            _release_buffer(self._view)
+
+
+class ByteBuffer:
+    """ctypes argtype for `const uint8_t *` inputs accepting any C-contiguous buffer without copying."""
+
+    @classmethod
+    def from_param(cls, data):
+        # A c_void_p is taken as the address of the data, not as an 8-byte buffer holding it.
+        if data is None or isinstance(data, (bytes, ctypes.Array, ctypes._Pointer, c_void_p)):
+            return data
+        view = memoryview(data)
+        if not view.readonly:
+            return (c_ubyte * view.nbytes).from_buffer(view)
+        if _get_buffer is not None:
+            return ReadOnlyBuffer(view)
+        return view.tobytes()
+
+
+def nbytes(data) -> int:
+    return len(data) if isinstance(data, bytes) else memoryview(data).nbytes
+
+
+def is_aligned(data, alignment: int) -> bool:
+    """Tells whether ByteBuffer hands `data` to native code at a multiple of `alignment`.
+
+    Copies made by from_param() are fresh bytes objects, which CPython keeps word aligned.
+    """
+    if isinstance(data, bytes):
+        return ctypes.cast(data, c_void_p).value % alignment == 0
+    view = memoryview(data)
+    if not view.readonly:
+        return ctypes.addressof((c_ubyte * view.nbytes).from_buffer(view)) % alignment == 0
+    if _get_buffer is not None:
+        return ReadOnlyBuffer(view)._as_parameter_.value % alignment == 0
+    return True
+
+
+def join(parts: Sequence) -> bytes:
+    """Concatenates buffers in linear time; a single pre-packed buffer is passed through uncopied."""
+    if len(parts) == 1:
+        return parts[0]
+    return b''.join(parts)
+
+
+def output(structure: Type[T], out=None) -> T:
+    """Returns a native result structure, backed by the caller's writable buffer when one is given."""
+    if out is None:
+        return structure()
+    return structure.from_buffer(out)
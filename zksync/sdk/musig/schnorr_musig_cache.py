@@ -0,0 +1,225 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+from typing import Optional
+
+from zksync.sdk.musig.schnorr_musig_buffer import nbytes
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+DEFAULT_KEY_CACHE_SIZE = 1024
+DEFAULT_VERIFICATION_CACHE_SIZE = 65536
+DEFAULT_VALID_KEY_CACHE_SIZE = 65536
+
+# Approximate footprint of one verification cache entry: digest, expiry, code and OrderedDict slot.
+VERIFICATION_ENTRY_SIZE = 200
+
+
+class AggregatedPublicKeyCache:
+    """Bounded LRU map from an ordered public key set to its aggregated public key.
+
+    Caches in this module pickle as empty caches with the same settings, so handing one to
+    another process does not copy its entries.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_KEY_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return AggregatedPublicKeyCache, (self.max_size,)
+
+    @staticmethod
+    def digest(encoded_public_keys: bytes) -> bytes:
+        return hashlib.blake2b(encoded_public_keys, digest_size=32).digest()
+
+    def get(self, encoded_public_keys: bytes) -> Optional[bytes]:
+        key = self.digest(encoded_public_keys)
+        with self._lock:
+            aggregated_public_key = self._entries.get(key)
+            if aggregated_public_key is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return aggregated_public_key
+
+    def put(self, encoded_public_keys: bytes, aggregated_public_key: bytes) -> None:
+        if self.max_size <= 0:
+            return
+        key = self.digest(encoded_public_keys)
+        with self._lock:
+            self._entries[key] = aggregated_public_key
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, encoded_public_keys: bytes, compute: Callable[[], bytes]) -> bytes:
+        aggregated_public_key = self.get(encoded_public_keys)
+        if aggregated_public_key is None:
+            aggregated_public_key = compute()
+            self.put(encoded_public_keys, aggregated_public_key)
+        return aggregated_public_key
+
+    def invalidate(self, encoded_public_keys: Optional[bytes] = None) -> None:
+        """Drops one key set, or every entry when called without arguments."""
+        with self._lock:
+            if encoded_public_keys is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.digest(encoded_public_keys), None)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, encoded_public_keys: bytes) -> bool:
+        return self.digest(encoded_public_keys) in self._entries
+
+
+class VerificationCache:
+    """Bounded LRU memo of native verification results keyed by (message, signature, public key).
+
+    Only MusigRes.OK is stored unless `cache_failures` is set, so a rejected signature is always
+    verified again. Entries expire after `ttl` seconds when given, and `max_bytes` caps the entry
+    count at roughly VERIFICATION_ENTRY_SIZE bytes per entry.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VERIFICATION_CACHE_SIZE, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None, cache_failures: bool = False) -> None:
+        self.max_size = max_size if max_bytes is None else min(max_size, max_bytes // VERIFICATION_ENTRY_SIZE)
+        self.ttl = ttl
+        self.cache_failures = cache_failures
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return VerificationCache, (self.max_size, self.ttl, None, self.cache_failures)
+
+    @staticmethod
+    def digest(message: bytes, signature: bytes, public_key: bytes) -> bytes:
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (message, signature, public_key):
+            digest.update(nbytes(part).to_bytes(8, 'little'))
+            digest.update(part)
+        return digest.digest()
+
+    def get(self, message: bytes, signature: bytes, public_key: bytes) -> Optional[MusigRes]:
+        key = self.digest(message, signature, public_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, message: bytes, signature: bytes, public_key: bytes, code: MusigRes) -> None:
+        if self.max_size <= 0 or (code != MusigRes.OK and not self.cache_failures):
+            return
+        key = self.digest(message, signature, public_key)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, code)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, message: bytes, signature: bytes, public_key: bytes,
+                       compute: Callable[[], MusigRes]) -> MusigRes:
+        code = self.get(message, signature, public_key)
+        if code is None:
+            code = compute()
+            self.put(message, signature, public_key, code)
+        return code
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def memory_usage(self) -> int:
+        return len(self._entries) * VERIFICATION_ENTRY_SIZE
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ValidPublicKeyCache:
+    """Bounded LRU set of individual public keys that passed native validation.
+
+    Only valid keys are remembered, so a rejected key is checked again on every call.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VALID_KEY_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return ValidPublicKeyCache, (self.max_size,)
+
+    def check(self, public_key: bytes) -> bool:
+        """Returns whether `public_key` is known to be valid, counting a hit or a miss."""
+        public_key = bytes(public_key)
+        with self._lock:
+            if public_key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(public_key)
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, public_key: bytes) -> None:
+        if self.max_size <= 0:
+            return
+        public_key = bytes(public_key)
+        with self._lock:
+            self._entries[public_key] = None
+            self._entries.move_to_end(public_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, public_key: Optional[bytes] = None) -> None:
+        """Drops one key, or every entry when called without arguments."""
+        with self._lock:
+            if public_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(bytes(public_key), None)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, public_key: bytes) -> bool:
+        return bytes(public_key) in self._entries
+
+
+shared_key_cache = AggregatedPublicKeyCache()
+shared_valid_key_cache = ValidPublicKeyCache()
@@ -0,0 +1,95 @@
+import ctypes
+from ctypes import c_void_p
+
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+try:
+    from zksync.sdk.musig._schnorr_musig_cffi import ffi
+    from zksync.sdk.musig._schnorr_musig_cffi import lib
+except ImportError:
+    ffi = None
+    lib = None
+
+
+def is_available() -> bool:
+    return lib is not None
+
+
+class SchnorrMusigCffi:
+    """cffi API-mode counterpart of SchnorrMusigNative.
+
+    Accepts the same arguments as the ctypes handle (bytes-like inputs, ctypes arrays,
+    ctypes structure pointers) so the SDK can use either backend unchanged.
+    """
+
+    backend = 'cffi'
+
+    def __init__(self) -> None:
+        if lib is None:
+            raise ImportError('cffi binding is not built, run zksync/sdk/musig/schnorr_musig_cffi_build.py')
+        self.ffi = ffi
+        self.lib = lib
+
+    def schnorr_musig_new_signer(self, encoded_pubkeys, encoded_pubkeys_len, position):
+        return lib.schnorr_musig_new_signer(_bytes(encoded_pubkeys), _size(encoded_pubkeys_len), _size(position))
+
+    def schnorr_musig_delete_signer(self, signer) -> None:
+        lib.schnorr_musig_delete_signer(_pointer('MusigSigner *', signer))
+
+    def schnorr_musig_aggregate_pubkeys(self, encoded_pubkeys, encoded_pubkeys_len, aggregate_pubkeys) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_aggregate_pubkeys(_bytes(encoded_pubkeys), _size(encoded_pubkeys_len),
+                                                            _pointer('AggregatedPublicKey *', aggregate_pubkeys)))
+
+    def schnorr_musig_compute_precommitment(self, signer, seed, seed_len, precommitment) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_compute_precommitment(_pointer('MusigSigner *', signer),
+                                                                _pointer('uint32_t *', seed), _size(seed_len),
+                                                                _pointer('Precommitment *', precommitment)))
+
+    def schnorr_musig_receive_precommitments(self, signer, input, input_len, commitment) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_receive_precommitments(_pointer('MusigSigner *', signer), _bytes(input),
+                                                                 _size(input_len),
+                                                                 _pointer('Commitment *', commitment)))
+
+    def schnorr_musig_receive_commitments(self, signer, input, input_len, commitment) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_receive_commitments(_pointer('MusigSigner *', signer), _bytes(input),
+                                                              _size(input_len),
+                                                              _pointer('AggregatedCommitment *', commitment)))
+
+    def schnorr_musig_receive_signature_shares(self, signer, input, input_len, signature_shares) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_receive_signature_shares(_pointer('MusigSigner *', signer), _bytes(input),
+                                                                   _size(input_len),
+                                                                   _pointer('AggregatedSignature *',
+                                                                            signature_shares)))
+
+    def schnorr_musig_sign(self, signer, private_key, private_key_len, message, message_len, signature) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_sign(_pointer('MusigSigner *', signer), _bytes(private_key),
+                                               _size(private_key_len), _bytes(message), _size(message_len),
+                                               _pointer('Signature *', signature)))
+
+    def schnorr_musig_verify(self, message, message_len, encoded_pubkeys, encoded_pubkeys_len, encoded_signature,
+                             encoded_signature_len) -> MusigRes:
+        return MusigRes(lib.schnorr_musig_verify(_bytes(message), _size(message_len), _bytes(encoded_pubkeys),
+                                                 _size(encoded_pubkeys_len), _bytes(encoded_signature),
+                                                 _size(encoded_signature_len)))
+
+
+def _size(value) -> int:
+    return value.value if isinstance(value, ctypes._SimpleCData) else value
+
+
+def _bytes(value):
+    if isinstance(value, (ffi.CData, bytes)):
+        return value
+    if isinstance(value, (c_void_p, ctypes._Pointer)):
+        return _pointer('uint8_t *', value)
+    return ffi.from_buffer('uint8_t[]', value)
+
+
+def _pointer(ctype: str, value):
+    if isinstance(value, ffi.CData):
+        return value
+    if isinstance(value, ctypes._Pointer):
+        return ffi.cast(ctype, ctypes.cast(value, c_void_p).value or 0)
+    if isinstance(value, c_void_p):
+        return ffi.cast(ctype, value.value or 0)
+    return ffi.cast(ctype, ffi.from_buffer(value))
@@ -0,0 +1,41 @@
+"""Builds the optional cffi API-mode binding from zksync/schnorr_musig_patched.h.
+
+Run ``python zksync/sdk/musig/schnorr_musig_cffi_build.py`` (or install with
+``ZKSYNC_MUSIG_CFFI=1``) with libmusig_c on the linker path. Set
+``MUSIG_C_LIB_DIR`` when the library lives outside the default search path.
+"""
+import os
+import re
+
+from cffi import FFI
+
+MODULE_NAME = 'zksync.sdk.musig._schnorr_musig_cffi'
+HEADER_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+HEADER_NAME = 'schnorr_musig_patched.h'
+
+
+def read_cdef(path: str) -> str:
+    with open(path) as f:
+        header = f.read()
+
+    header = re.sub(r'/\*.*?\*/', '', header, flags=re.S)
+    defines = dict(re.findall(r'^#define\s+(\w+)\s+(\d+)\s*$', header, flags=re.M))
+    header = '\n'.join(line for line in header.splitlines() if not line.startswith('#'))
+    for name, value in defines.items():
+        header = re.sub(r'\b%s\b' % name, value, header)
+    return header
+
+
+ffibuilder = FFI()
+ffibuilder.cdef(read_cdef(os.path.join(HEADER_DIRECTORY, HEADER_NAME)))
+ffibuilder.set_source(
+    MODULE_NAME,
+    '#include "%s"' % HEADER_NAME,
+    include_dirs=[HEADER_DIRECTORY],
+    libraries=['musig_c'],
+    library_dirs=[path for path in [os.environ.get('MUSIG_C_LIB_DIR')] if path],
+    runtime_library_dirs=[path for path in [os.environ.get('MUSIG_C_LIB_DIR')] if path],
+)
+
+if __name__ == '__main__':
+    ffibuilder.compile(tmpdir=os.path.join(HEADER_DIRECTORY, '..'), verbose=True)
@@ -0,0 +1,432 @@
+"""Asyncio signing coordinator and participant client.
+
+Each participant keeps one connection to the coordinator, announced by its public key, and any
+number of sessions are multiplexed over it. A session runs as:
+
+    coordinator  START(session, position, keys, message)              -> every participant
+    participant  ENVELOPE(PRECOMMITMENT | COMMITMENT | SIGNATURE_SHARE) -> coordinator
+    coordinator  ROUND(all payloads of the round, in position order)  -> every participant
+    participant  ENVELOPE(AGGREGATED_SIGNATURE), from position 0      -> coordinator
+
+An aggregated signature is only accepted from position 0 once the SIGNATURE_SHARE round has been
+broadcast, and is verified before sign() returns it when the coordinator is given a musig.
+
+Either side sends ABORT(session, reason) to end a session early. Every round has a deadline, so a
+straggler only fails its own sessions. Outgoing frames pass through a bounded queue per connection
+and incoming round messages through a bounded queue per session, so slow peers apply backpressure
+instead of growing buffers. The coordinator never waits for queue space: a peer whose outbox is full
+fails the session it is being sent, and other sessions carry on.
+
+Frames are a u32 length (of kind and body), a u8 MessageKind and the body; ENVELOPE bodies use the
+schnorr_musig_wire envelope.
+"""
+from __future__ import annotations
+
+import asyncio
+import enum
+import inspect
+import os
+import struct
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig_async import AsyncSchnorrMusig
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigWireError
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_wire import SESSION_ID_LENGTH
+from zksync.sdk.musig.schnorr_musig_wire import Envelope
+from zksync.sdk.musig.schnorr_musig_wire import Round
+from zksync.sdk.musig.schnorr_musig_wire import RoundCollector
+from zksync.sdk.musig.schnorr_musig_wire import decode
+from zksync.sdk.musig.schnorr_musig_wire import encode
+
+DEFAULT_ROUND_TIMEOUT = 10.0
+DEFAULT_QUEUE_SIZE = 64
+MAX_FRAME_LENGTH = 16 << 20
+
+FRAME = struct.Struct('<IB')
+START = struct.Struct(f'<{SESSION_ID_LENGTH}sII')
+ROUND = struct.Struct(f'<{SESSION_ID_LENGTH}sB')
+ABORT = struct.Struct(f'<{SESSION_ID_LENGTH}s')
+
+ROUNDS = (Round.PRECOMMITMENT, Round.COMMITMENT, Round.SIGNATURE_SHARE)
+
+
+class MessageKind(enum.IntEnum):
+    HELLO = 1
+    START = 2
+    ENVELOPE = 3
+    ROUND = 4
+    ABORT = 5
+
+
+class SigningSessionError(Exception):
+    pass
+
+
+class SigningSessionTimeout(SigningSessionError):
+
+    def __init__(self, stage: str, missing: List[int]) -> None:
+        super().__init__(f'{stage} timed out waiting for positions {missing}')
+        self.stage = stage
+        self.missing = missing
+
+
+class SigningSessionStalled(SigningSessionError):
+
+    def __init__(self, stage: str, positions: List[int]) -> None:
+        super().__init__(f'{stage} could not be sent to positions {positions}, their outboxes are full')
+        self.stage = stage
+        self.positions = positions
+
+
+def frame(kind: MessageKind, *parts: bytes) -> bytes:
+    return FRAME.pack(1 + sum(memoryview(part).nbytes for part in parts), kind) + b''.join(parts)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[MessageKind, memoryview]:
+    length, kind = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if not 1 <= length <= MAX_FRAME_LENGTH:
+        raise SchnorrMusigWireError(f'invalid frame length {length}')
+    body = await reader.readexactly(length - 1)
+    try:
+        return MessageKind(kind), memoryview(body)
+    except ValueError:
+        raise SchnorrMusigWireError(f'unknown message kind {kind}') from None
+
+
+class _Connection:
+    """A stream with a bounded outbox drained by a single writer task."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, queue_size: int) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.outbox: asyncio.Queue = asyncio.Queue(queue_size)
+        self._writer_task = asyncio.ensure_future(self._write())
+
+    async def send(self, data: bytes) -> None:
+        await self.outbox.put(data)
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                data = await self.outbox.get()
+                self.writer.write(data)
+                await self.writer.drain()
+        except ConnectionError:
+            # Closing ends the reader too, which fails the peer's sessions as disconnected.
+            self.writer.close()
+
+    async def close(self) -> None:
+        self._writer_task.cancel()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+
+class _CoordinatorSession:
+
+    def __init__(self, session_id: bytes, public_keys: List[bytes]) -> None:
+        loop = asyncio.get_running_loop()
+        self.session_id = session_id
+        self.public_keys = public_keys
+        self.collectors = {round: RoundCollector(session_id, round, len(public_keys)) for round in ROUNDS}
+        self.rounds = {round: loop.create_future() for round in ROUNDS}
+        self.signature = loop.create_future()
+        self.shares_sent = False
+
+    def receive(self, public_key: bytes, envelope: Envelope) -> None:
+        if not 0 <= envelope.position < len(self.public_keys) or self.public_keys[envelope.position] != public_key:
+            raise SchnorrMusigWireError(f'participant does not hold position {envelope.position}')
+        if envelope.round == Round.AGGREGATED_SIGNATURE:
+            if envelope.position != 0:
+                raise SchnorrMusigWireError(f'aggregated signature must come from position 0, '
+                                            f'not {envelope.position}')
+            if self.shares_sent and not self.signature.done():
+                self.signature.set_result(bytes(envelope.payload))
+        elif self.collectors[envelope.round].add(envelope) and not self.rounds[envelope.round].done():
+            self.rounds[envelope.round].set_result(self.collectors[envelope.round].payloads)
+
+    def fail(self, error: Exception) -> None:
+        for future in [*self.rounds.values(), self.signature]:
+            if not future.done():
+                future.set_exception(error)
+                # Later rounds are never awaited once the session has failed.
+                future.exception()
+
+
+class SigningCoordinator:
+    """Runs signing sessions between participants connected over TCP or Unix sockets."""
+
+    def __init__(self, round_timeout: float = DEFAULT_ROUND_TIMEOUT, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 musig: Optional[AsyncSchnorrMusig] = None) -> None:
+        self.round_timeout = round_timeout
+        self.queue_size = queue_size
+        self.musig = musig
+        self.participants: Dict[bytes, _Connection] = {}
+        self._sessions: Dict[bytes, _CoordinatorSession] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connected: Optional[asyncio.Condition] = None
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0) -> SigningCoordinator:
+        self._connected = asyncio.Condition()
+        self._server = await asyncio.start_server(self._accept, host, port)
+        return self
+
+    async def start_unix(self, path: str) -> SigningCoordinator:
+        self._connected = asyncio.Condition()
+        self._server = await asyncio.start_unix_server(self._accept, path)
+        return self
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def sign(self, public_keys: List[bytes], message: bytes) -> bytes:
+        """Runs one session for `public_keys` and returns the aggregated signature."""
+        session = _CoordinatorSession(os.urandom(SESSION_ID_LENGTH), public_keys)
+        self._sessions[session.session_id] = session
+        connections: List[_Connection] = []
+        try:
+            connections = await self._wait_for_participants(public_keys)
+            keys = b''.join(public_keys)
+            self._broadcast(MessageKind.START.name, connections, lambda position: frame(
+                MessageKind.START, START.pack(session.session_id, position, len(public_keys)), keys, message))
+
+            for round in ROUNDS:
+                payloads = await self._deadline(session.rounds[round], round.name,
+                                                lambda: session.collectors[round].missing)
+                data = frame(MessageKind.ROUND, ROUND.pack(session.session_id, round), payloads)
+                self._broadcast(round.name, connections, lambda position: data, shared=True)
+            session.shares_sent = True
+
+            signature = await self._deadline(session.signature, Round.AGGREGATED_SIGNATURE.name, lambda: [0])
+            if self.musig is not None and not await self.musig.verify(message, signature, public_keys):
+                raise SigningSessionError('aggregated signature from position 0 does not verify')
+            return signature
+        except BaseException as e:
+            session.fail(e if isinstance(e, SigningSessionError) else SigningSessionError(str(e)))
+            await self._abort(session.session_id, _unique(connections), str(e) or type(e).__name__)
+            raise
+        finally:
+            del self._sessions[session.session_id]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for connection in list(self.participants.values()):
+            await connection.close()
+
+    async def __aenter__(self) -> SigningCoordinator:
+        return self
+
+    async def __aexit__(self, type_, value, traceback) -> None:
+        await self.close()
+
+    async def _wait_for_participants(self, public_keys: List[bytes]) -> List[_Connection]:
+        connections: List[Optional[_Connection]] = []
+
+        def connected() -> bool:
+            # Taken in the predicate: a participant may disconnect before wait_for() resumes this task.
+            connections[:] = [self.participants.get(public_key) for public_key in public_keys]
+            return None not in connections
+
+        async with self._connected:
+            try:
+                await asyncio.wait_for(self._connected.wait_for(connected), self.round_timeout)
+            except asyncio.TimeoutError:
+                raise SigningSessionTimeout('connect', [position for position, public_key in enumerate(public_keys)
+                                                        if public_key not in self.participants]) from None
+        return connections
+
+    async def _deadline(self, future: asyncio.Future, stage: str, missing: Callable[[], List[int]]):
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.round_timeout)
+        except asyncio.TimeoutError:
+            raise SigningSessionTimeout(stage, missing()) from None
+
+    def _broadcast(self, stage: str, connections: List[_Connection], data: Callable[[int], bytes],
+                   shared: bool = False) -> None:
+        """Queues data(position) for every position without waiting; raises if any outbox is full.
+
+        With `shared`, the frame is the same for every position and is queued once per connection.
+        """
+        queued: Dict[int, bool] = {}
+        stalled = []
+        for position, connection in enumerate(connections):
+            if not shared or id(connection) not in queued:
+                try:
+                    connection.outbox.put_nowait(data(position))
+                    queued[id(connection)] = True
+                except asyncio.QueueFull:
+                    queued[id(connection)] = False
+            if not queued[id(connection)]:
+                stalled.append(position)
+        if stalled:
+            raise SigningSessionStalled(stage, stalled)
+
+    async def _abort(self, session_id: bytes, connections: List[_Connection], reason: str) -> None:
+        data = frame(MessageKind.ABORT, ABORT.pack(session_id), reason.encode())
+        for connection in connections:
+            try:
+                connection.outbox.put_nowait(data)
+            except asyncio.QueueFull:
+                pass
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(reader, writer, self.queue_size)
+        public_key = None
+        try:
+            kind, body = await read_frame(reader)
+            if kind != MessageKind.HELLO or len(body) != STANDARD_ENCODING_LENGTH:
+                return
+            public_key = bytes(body)
+            async with self._connected:
+                self.participants[public_key] = connection
+                self._connected.notify_all()
+
+            while True:
+                kind, body = await read_frame(reader)
+                if kind == MessageKind.ENVELOPE:
+                    envelope, _ = decode(body)
+                    session = self._sessions.get(envelope.session_id)
+                    if session is not None:
+                        try:
+                            session.receive(public_key, envelope)
+                        except SchnorrMusigWireError as e:
+                            session.fail(SigningSessionError(str(e)))
+                elif kind == MessageKind.ABORT:
+                    session = self._sessions.get(bytes(body[:SESSION_ID_LENGTH]))
+                    if session is not None:
+                        session.fail(SigningSessionError(bytes(body[SESSION_ID_LENGTH:]).decode(errors='replace')))
+        except (asyncio.IncompleteReadError, ConnectionError, SchnorrMusigWireError):
+            pass
+        finally:
+            if public_key is not None and self.participants.get(public_key) is connection:
+                del self.participants[public_key]
+                for session in list(self._sessions.values()):
+                    if public_key in session.public_keys:
+                        session.fail(SigningSessionError('participant disconnected'))
+            await connection.close()
+
+
+class _Aborted(Exception):
+    pass
+
+
+class SigningParticipant:
+    """Signs every session the coordinator starts for its public key.
+
+    `approve(message, public_keys)` may veto a session; it can be a plain function or a coroutine.
+    """
+
+    def __init__(self, musig: AsyncSchnorrMusig, private_key: bytes, public_key: bytes,
+                 approve: Optional[Callable] = None, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        self.musig = musig
+        self.private_key = private_key
+        self.public_key = public_key
+        self.approve = approve
+        self.queue_size = queue_size
+        self._connection: Optional[_Connection] = None
+        self._task: Optional[asyncio.Future] = None
+        self._sessions: Dict[Tuple[bytes, int], asyncio.Queue] = {}
+        self._session_tasks: List[asyncio.Future] = []
+
+    async def connect_tcp(self, host: str, port: int) -> SigningParticipant:
+        return await self._connect(*await asyncio.open_connection(host, port))
+
+    async def connect_unix(self, path: str) -> SigningParticipant:
+        return await self._connect(*await asyncio.open_unix_connection(path))
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        for task in self._session_tasks:
+            task.cancel()
+        if self._connection is not None:
+            await self._connection.close()
+
+    async def __aenter__(self) -> SigningParticipant:
+        return self
+
+    async def __aexit__(self, type_, value, traceback) -> None:
+        await self.close()
+
+    async def _connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> SigningParticipant:
+        self._connection = _Connection(reader, writer, self.queue_size)
+        await self._connection.send(frame(MessageKind.HELLO, self.public_key))
+        self._task = asyncio.ensure_future(self._read())
+        return self
+
+    async def _read(self) -> None:
+        try:
+            while True:
+                kind, body = await read_frame(self._connection.reader)
+                session_id = bytes(body[:SESSION_ID_LENGTH])
+                if kind == MessageKind.START:
+                    _, position, count = START.unpack_from(body)
+                    keys = body[START.size:START.size + count * STANDARD_ENCODING_LENGTH]
+                    public_keys = [bytes(keys[index:index + STANDARD_ENCODING_LENGTH])
+                                   for index in range(0, len(keys), STANDARD_ENCODING_LENGTH)]
+                    inbox: asyncio.Queue = asyncio.Queue(self.queue_size)
+                    self._sessions[session_id, position] = inbox
+                    self._session_tasks.append(asyncio.ensure_future(self._sign(
+                        session_id, position, public_keys, bytes(body[START.size + len(keys):]), inbox)))
+                    self._session_tasks = [task for task in self._session_tasks if not task.done()]
+                elif kind in (MessageKind.ROUND, MessageKind.ABORT):
+                    for (active_session_id, _), inbox in list(self._sessions.items()):
+                        if active_session_id == session_id:
+                            await inbox.put((kind, body))
+        except (asyncio.IncompleteReadError, ConnectionError, SchnorrMusigWireError):
+            pass
+        finally:
+            for inbox in self._sessions.values():
+                try:
+                    inbox.put_nowait((MessageKind.ABORT, memoryview(bytes(SESSION_ID_LENGTH))))
+                except asyncio.QueueFull:
+                    pass
+
+    async def _sign(self, session_id: bytes, position: int, public_keys: List[bytes], message: bytes,
+                    inbox: asyncio.Queue) -> None:
+        async def send(round: Round, payload: bytes) -> None:
+            await self._connection.send(frame(MessageKind.ENVELOPE, encode(session_id, round, position, payload)))
+
+        async def receive(round: Round) -> memoryview:
+            kind, body = await inbox.get()
+            if kind == MessageKind.ABORT:
+                raise _Aborted()
+            if ROUND.unpack_from(body)[1] != round:
+                raise SigningSessionError(f'expected {round.name} round')
+            return body[ROUND.size:]
+
+        try:
+            approved = True if self.approve is None else self.approve(message, public_keys)
+            if inspect.isawaitable(approved):
+                approved = await approved
+            if not approved:
+                raise SigningSessionError('session rejected by participant')
+
+            async with await self.musig.create_signer(public_keys, position) as signer:
+                await send(Round.PRECOMMITMENT, await signer.compute_precommitment())
+                await send(Round.COMMITMENT, await signer.receive_precommitments(await receive(Round.PRECOMMITMENT)))
+                await signer.receive_commitments(await receive(Round.COMMITMENT))
+                await send(Round.SIGNATURE_SHARE, await signer.sign(self.private_key, message))
+                shares = await receive(Round.SIGNATURE_SHARE)
+                if position == 0:
+                    await send(Round.AGGREGATED_SIGNATURE, await signer.aggregate_signature(shares))
+        except _Aborted:
+            pass
+        except Exception as e:
+            await self._connection.send(frame(MessageKind.ABORT, ABORT.pack(session_id), str(e).encode()))
+        finally:
+            self._sessions.pop((session_id, position), None)
+
+
+def _unique(connections: List[_Connection]) -> List[_Connection]:
+    return list({id(connection): connection for connection in connections}.values())
@@ -1,7 +1,56 @@
+from typing import Dict
+from typing import Optional
+
 from zksync.sdk.musig.schnorr_musig_native import MusigRes
 
 
 class SchnorrMusigError(Exception):
 
-    def __init__(self, code: MusigRes) -> None:
+    def __init__(self, code: MusigRes, message: Optional[str] = None) -> None:
+        super().__init__(message or getattr(code, 'name', code))
         self.code = code
+
+
+class SchnorrMusigRevokedError(SchnorrMusigError):
+
+    def __init__(self, message: str = 'signer has been revoked') -> None:
+        super().__init__(MusigRes.INVALID_INPUT_DATA, message)
+
+
+class SchnorrMusigForkedError(SchnorrMusigRevokedError):
+
+    def __init__(self, message: str = 'signer was inherited from another process') -> None:
+        super().__init__(message)
+
+
+class SchnorrMusigWireError(SchnorrMusigError):
+
+    def __init__(self, message: str) -> None:
+        super().__init__(MusigRes.ENCODING_ERROR, message)
+
+
+class SchnorrMusigStateError(SchnorrMusigError):
+    pass
+
+
+class SchnorrMusigConcurrentUseError(SchnorrMusigStateError):
+
+    def __init__(self, message: str = 'signer is in use by another thread') -> None:
+        super().__init__(MusigRes.INVALID_INPUT_DATA, message)
+
+
+class SchnorrMusigShareError(SchnorrMusigError):
+    """A signature share was rejected; `position` is the sender, or None when it cannot be attributed."""
+
+    def __init__(self, position: Optional[int], code: MusigRes, message: Optional[str] = None) -> None:
+        super().__init__(code, message or f'{getattr(code, "name", code)} from position {position}')
+        self.position = position
+
+
+class SchnorrMusigInvalidKeyError(SchnorrMusigError):
+    """One or more public keys failed validation; `invalid` maps each failing index to its native code."""
+
+    def __init__(self, invalid: Dict[int, MusigRes]) -> None:
+        indices = sorted(invalid)
+        super().__init__(invalid[indices[0]], f'invalid public keys at indices {indices}')
+        self.invalid = invalid
@@ -0,0 +1,97 @@
+import time
+from contextlib import nullcontext
+from concurrent.futures import Executor
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_batch import BatchExecutor
+from zksync.sdk.musig.schnorr_musig_native import AGG_SIG_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+
+class SigningGroupResult:
+
+    def __init__(self, signature: bytes, timings: Dict[str, float]) -> None:
+        self.signature = signature
+        self.timings = timings
+
+
+class SigningGroup:
+    """Runs a whole MuSig session for participants hosted in one process.
+
+    Each round writes every participant's output into one shared buffer, which is then handed
+    to all signers as-is for the next round. Per-signer native calls run sequentially, or on a
+    thread pool when `max_workers` or `executor` is given.
+    """
+
+    ROUNDS = ('create', 'precommit', 'commit', 'aggregate_commitment', 'sign', 'aggregate')
+
+    def __init__(self, musig: SchnorrMusig, public_keys: List[bytes], private_keys: List[bytes],
+                 max_workers: Optional[int] = None, executor: Optional[Executor] = None) -> None:
+        if len(public_keys) != len(private_keys):
+            raise ValueError('every participant needs a private key')
+        self.musig = musig
+        self.public_keys = public_keys
+        self.private_keys = private_keys
+        self.max_workers = max_workers
+        self.executor = executor
+        self.signers: List[SchnorrMusigSigner] = []
+
+    def __len__(self) -> int:
+        return len(self.public_keys)
+
+    def sign(self, message: bytes, seeds: Optional[Sequence[bytes]] = None) -> SigningGroupResult:
+        count = len(self)
+        if seeds is None:
+            block, length = self.musig.seed_source.take(count), self.musig.seed_source.seed_length
+            seeds = [block[index * length:(index + 1) * length] for index in range(count)]
+        precommitments = bytearray(STANDARD_ENCODING_LENGTH * count)
+        commitments = bytearray(STANDARD_ENCODING_LENGTH * count)
+        aggregated_commitments = bytearray(STANDARD_ENCODING_LENGTH * count)
+        shares = bytearray(STANDARD_ENCODING_LENGTH * count)
+        signature = bytearray(AGG_SIG_ENCODING_LENGTH)
+        timings: Dict[str, float] = {}
+
+        parallel = self.executor is not None or self.max_workers is not None
+        with BatchExecutor(self.executor, self.max_workers) if parallel else nullcontext() as pool:
+            def each(name: str, fn: Callable[[int], object]) -> list:
+                start = time.perf_counter()
+                if pool is None:
+                    results = [fn(index) for index in range(count)]
+                else:
+                    results = [future.result() for future in [pool.submit(fn, index) for index in range(count)]]
+                timings[name] = time.perf_counter() - start
+                return results
+
+            self.signers = each('create', lambda index: self.musig.create_signer(self.public_keys, index))
+            try:
+                each('precommit', lambda index: self.signers[index].compute_precommitment(
+                    seeds[index], out=_slot(precommitments, index)))
+                each('commit', lambda index: self.signers[index].receive_precommitments(
+                    precommitments, out=_slot(commitments, index)))
+                each('aggregate_commitment', lambda index: self.signers[index].receive_commitments(
+                    commitments, out=_slot(aggregated_commitments, index)))
+                each('sign', lambda index: self.signers[index].sign(
+                    self.private_keys[index], message, out=_slot(shares, index)))
+
+                start = time.perf_counter()
+                self.signers[0].aggregate_signature(shares, out=signature)
+                timings['aggregate'] = time.perf_counter() - start
+            finally:
+                self.close()
+
+        return SigningGroupResult(bytes(signature), timings)
+
+    def close(self) -> None:
+        signers, self.signers = self.signers, []
+        for signer in signers:
+            signer.revoke()
+
+
+def _slot(buffer: bytearray, index: int) -> memoryview:
+    return memoryview(buffer)[index * STANDARD_ENCODING_LENGTH:(index + 1) * STANDARD_ENCODING_LENGTH]
@@ -0,0 +1,182 @@
+import abc
+import bisect
+import logging
+import os
+import threading
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_native import SchnorrMusigNative
+
+INSTRUMENTATION_ENVIRONMENT_VARIABLE = 'ZKSYNC_MUSIG_INSTRUMENTATION'
+INSTRUMENTATION_LOGGER = 'zksync.sdk.musig.instrumentation'
+METRICS_SINK = 'metrics'
+LOG_SINK = 'log'
+
+# Upper bounds of the latency histogram buckets: 1us, 2us, 4us, ... ~1s, then +inf.
+LATENCY_BUCKETS = [1e-6 * 2 ** index for index in range(21)]
+
+# Positions of the length arguments of each native function and the byte width of one unit.
+INPUT_LENGTHS = {
+    'schnorr_musig_new_signer': ((1, 1),),
+    'schnorr_musig_delete_signer': (),
+    'schnorr_musig_aggregate_pubkeys': ((1, 1),),
+    'schnorr_musig_compute_precommitment': ((2, 4),),
+    'schnorr_musig_receive_precommitments': ((2, 1),),
+    'schnorr_musig_receive_commitments': ((2, 1),),
+    'schnorr_musig_receive_signature_shares': ((2, 1),),
+    'schnorr_musig_sign': ((2, 1), (4, 1)),
+    'schnorr_musig_verify': ((1, 1), (3, 1), (5, 1)),
+}
+
+logger = logging.getLogger(INSTRUMENTATION_LOGGER)
+
+
+class InstrumentationSink(abc.ABC):
+
+    @abc.abstractmethod
+    def record(self, function: str, elapsed: float, input_size: int, code: Optional[MusigRes]) -> None:
+        pass
+
+
+class FunctionMetrics:
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.input_bytes = 0
+        self.latency = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.codes: Dict[str, int] = {}
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total_time': self.total_time,
+            'input_bytes': self.input_bytes,
+            'latency_buckets': dict(zip([str(bound) for bound in LATENCY_BUCKETS] + ['inf'], self.latency)),
+            'codes': dict(self.codes),
+        }
+
+
+class MetricsSink(InstrumentationSink):
+    """Aggregates call counts, latency histograms, input sizes and MusigRes outcomes per function."""
+
+    def __init__(self) -> None:
+        self.functions: Dict[str, FunctionMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, function: str, elapsed: float, input_size: int, code: Optional[MusigRes]) -> None:
+        with self._lock:
+            metrics = self.functions.get(function)
+            if metrics is None:
+                metrics = self.functions[function] = FunctionMetrics()
+            metrics.calls += 1
+            metrics.total_time += elapsed
+            metrics.input_bytes += input_size
+            metrics.latency[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            if code is not None:
+                name = getattr(code, 'name', str(code))
+                metrics.codes[name] = metrics.codes.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {function: metrics.as_dict() for function, metrics in self.functions.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.functions.clear()
+
+
+class LoggingSink(InstrumentationSink):
+
+    def record(self, function: str, elapsed: float, input_size: int, code: Optional[MusigRes]) -> None:
+        logger.debug('%s %.1fus %d bytes %s', function, elapsed * 1e6, input_size, getattr(code, 'name', code))
+
+
+class FanOutSink(InstrumentationSink):
+
+    def __init__(self, sinks: Sequence[InstrumentationSink]) -> None:
+        self.sinks = list(sinks)
+
+    def record(self, function: str, elapsed: float, input_size: int, code: Optional[MusigRes]) -> None:
+        for sink in self.sinks:
+            sink.record(function, elapsed, input_size, code)
+
+
+class Instrumentation:
+    """Process-wide switch for native call instrumentation; `sink` is None while disabled."""
+
+    def __init__(self) -> None:
+        self.sink: Optional[InstrumentationSink] = None
+
+    def enable(self, sink: InstrumentationSink) -> None:
+        self.sink = sink
+
+    def disable(self) -> None:
+        self.sink = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.sink is not None
+
+    def configure(self) -> bool:
+        """Enables the sinks requested by $ZKSYNC_MUSIG_INSTRUMENTATION and the instrumentation logger level.
+
+        Returns whether native handles should be wrapped.
+        """
+        names = [name.strip() for name in os.environ.get(INSTRUMENTATION_ENVIRONMENT_VARIABLE, '').split(',')
+                 if name.strip()]
+        if logger.isEnabledFor(logging.DEBUG) and LOG_SINK not in names:
+            names.append(LOG_SINK)
+        if not names:
+            return self.sink is not None
+
+        sinks: List[InstrumentationSink] = []
+        for name in names:
+            if name == METRICS_SINK:
+                sinks.append(MetricsSink())
+            elif name == LOG_SINK:
+                sinks.append(LoggingSink())
+            else:
+                raise ValueError(f'Unknown instrumentation sink: {name}')
+        if self.sink is None:
+            self.enable(sinks[0] if len(sinks) == 1 else FanOutSink(sinks))
+        return True
+
+
+instrumentation = Instrumentation()
+
+
+class InstrumentedNative:
+    """Wraps a native handle and reports every call to `instrumentation.sink` while one is set."""
+
+    def __init__(self, native: SchnorrMusigNative, instrumentation: Instrumentation = instrumentation) -> None:
+        self.native = native
+        self.backend = getattr(native, 'backend', None)
+        for function, lengths in INPUT_LENGTHS.items():
+            setattr(self, function, _instrument(function, getattr(native, function), lengths, instrumentation))
+
+
+def _instrument(function: str, call, lengths, instrumentation: Instrumentation):
+    def instrumented(*args):
+        sink = instrumentation.sink
+        if sink is None:
+            return call(*args)
+
+        start = time.perf_counter()
+        result = call(*args)
+        elapsed = time.perf_counter() - start
+        input_size = sum(_length(args[index]) * width for index, width in lengths)
+        sink.record(function, elapsed, input_size, result if isinstance(result, int) else None)
+        return result
+
+    instrumented.__name__ = function
+    return instrumented
+
+
+def _length(value) -> int:
+    return getattr(value, 'value', value)
@@ -1,12 +1,25 @@
 import abc
 import ctypes.util
+import os
+import threading
 from ctypes import Structure
 from ctypes import c_size_t
 from ctypes import c_ubyte
 from ctypes import c_uint32
 from enum import IntEnum
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig_buffer import ByteBuffer
 
 LIBRARY_NAME = 'musig_c'
+DEFAULT_LIBRARY_PATH = './libmusig_c.so'
+LIBRARY_PATH_ENVIRONMENT_VARIABLE = 'ZKSYNC_MUSIG_LIBRARY'
+BACKEND_ENVIRONMENT_VARIABLE = 'ZKSYNC_MUSIG_BACKEND'
+CTYPES_BACKEND = 'ctypes'
+CFFI_BACKEND = 'cffi'
+AUTO_BACKEND = 'auto'
 STANDARD_ENCODING_LENGTH = 32
 AGG_SIG_ENCODING_LENGTH = 64
 
@@ -24,14 +37,14 @@ class MusigRes(IntEnum):
     NONCE_COMMITMENTS_NOT_RECEIVED = 104,
     NONCE_COMMITMENTS_AND_PARTICIPANTS_NOT_MATCH = 105,
     SIGNATURE_SHARE_AND_PARTICIPANTS_NOT_MATCH = 106,
-    COMMITMENT_IS_NOT_IN_CORRECT_SUBGROUP = 106,
-    INVALID_COMMITMENT = 107,
-    INVALID_PUBLIC_KEY = 108,
-    INVALID_PARTICIPANT_POSITION = 109,
-    AGGREGATED_NONCE_COMMITMENT_NOT_COMPUTED = 110,
-    CHALLENGE_NOT_GENERATED = 111,
-    INVALID_SIGNATURE_SHARE = 112,
-    INVALID_SEED = 113
+    COMMITMENT_IS_NOT_IN_CORRECT_SUBGROUP = 107,
+    INVALID_COMMITMENT = 108,
+    INVALID_PUBLIC_KEY = 109,
+    INVALID_PARTICIPANT_POSITION = 110,
+    AGGREGATED_NONCE_COMMITMENT_NOT_COMPUTED = 111,
+    CHALLENGE_NOT_GENERATED = 112,
+    INVALID_SIGNATURE_SHARE = 113,
+    INVALID_SEED = 114
 
 
 class AggregatedPublicKey(Structure):
@@ -162,19 +175,111 @@ class SchnorrMusigNative(ctypes.CDLL):
 
 
 class SchnorrMusigLoader:
+    """Resolves and loads the native library once per process.
+
+    Handles are cached per (backend, library path), so every SchnorrMusig shares one handle
+    and ctypes.util.find_library, which may spawn ldconfig/gcc, runs at most once.
+    """
+
+    _lock = threading.RLock()
+    _handles: Dict[Tuple[str, Optional[str]], SchnorrMusigNative] = {}
+    _found_library_path: Optional[str] = None
+
+    @staticmethod
+    def load(backend: Optional[str] = None, path: Optional[str] = None) -> SchnorrMusigNative:
+        """Returns the process-wide native handle.
+
+        The backend defaults to $ZKSYNC_MUSIG_BACKEND, or 'auto' which prefers the compiled
+        cffi binding and falls back to ctypes when it is not built. An explicit library path
+        (argument or $ZKSYNC_MUSIG_LIBRARY) can only be honoured by ctypes, so 'auto' then
+        selects ctypes.
+
+        The handle is wrapped in InstrumentedNative when instrumentation is enabled or
+        configured ($ZKSYNC_MUSIG_INSTRUMENTATION, or the instrumentation logger at DEBUG)
+        at the time of the first load.
+        """
+        backend = backend or os.environ.get(BACKEND_ENVIRONMENT_VARIABLE, AUTO_BACKEND)
+        if backend not in (AUTO_BACKEND, CFFI_BACKEND, CTYPES_BACKEND):
+            raise ValueError(f'Unknown musig backend: {backend}')
+        path = path or os.environ.get(LIBRARY_PATH_ENVIRONMENT_VARIABLE)
+
+        if backend == AUTO_BACKEND:
+            from zksync.sdk.musig import schnorr_musig_cffi
+            backend = CFFI_BACKEND if schnorr_musig_cffi.is_available() and path is None else CTYPES_BACKEND
+
+        key = (backend, path if backend == CTYPES_BACKEND else None)
+        handle = SchnorrMusigLoader._handles.get(key)
+        if handle is None:
+            with SchnorrMusigLoader._lock:
+                handle = SchnorrMusigLoader._handles.get(key)
+                if handle is None:
+                    if backend == CFFI_BACKEND:
+                        from zksync.sdk.musig.schnorr_musig_cffi import SchnorrMusigCffi
+                        handle = SchnorrMusigCffi()
+                    else:
+                        handle = SchnorrMusigLoader.load_ctypes(path)
+                    from zksync.sdk.musig.schnorr_musig_instrumentation import InstrumentedNative
+                    from zksync.sdk.musig.schnorr_musig_instrumentation import instrumentation
+                    if instrumentation.configure():
+                        handle = InstrumentedNative(handle)
+                    SchnorrMusigLoader._handles[key] = handle
+        return handle
+
+    @staticmethod
+    def handle_key(handle) -> Optional[Tuple[str, Optional[str]]]:
+        """Returns the (backend, path) a handle was loaded with, or None if the loader did not create it."""
+        with SchnorrMusigLoader._lock:
+            for key, value in SchnorrMusigLoader._handles.items():
+                if value is handle:
+                    return key
+        return None
 
     @staticmethod
-    def load() -> SchnorrMusigNative:
-        libPath = ctypes.util.find_library(LIBRARY_NAME)
-        if libPath == None:
-            libPath = "./libmusig_c.so"
+    def library_path(path: Optional[str] = None) -> str:
+        path = path or os.environ.get(LIBRARY_PATH_ENVIRONMENT_VARIABLE)
+        if path:
+            return path
+
+        with SchnorrMusigLoader._lock:
+            if SchnorrMusigLoader._found_library_path is None:
+                SchnorrMusigLoader._found_library_path = ctypes.util.find_library(LIBRARY_NAME) or DEFAULT_LIBRARY_PATH
+            return SchnorrMusigLoader._found_library_path
+
+    @staticmethod
+    def reset() -> None:
+        """Forgets cached handles and the resolved library path."""
+        with SchnorrMusigLoader._lock:
+            SchnorrMusigLoader._handles.clear()
+            SchnorrMusigLoader._found_library_path = None
+
+    @staticmethod
+    def load_ctypes(path: Optional[str] = None) -> SchnorrMusigNative:
+        libPath = SchnorrMusigLoader.library_path(path)
         library: SchnorrMusigNative = ctypes.CDLL(libPath)
+        library.backend = CTYPES_BACKEND
+
+        library.schnorr_musig_new_signer.argtypes = [ByteBuffer, c_size_t, c_size_t]
         library.schnorr_musig_new_signer.restype = MusigSignerPointer
+        library.schnorr_musig_delete_signer.argtypes = [MusigSignerPointer]
+        library.schnorr_musig_delete_signer.restype = None
+        library.schnorr_musig_aggregate_pubkeys.argtypes = [ByteBuffer, c_size_t, AggregatedPublicKeyPointer]
         library.schnorr_musig_aggregate_pubkeys.restype = MusigRes
+        # The seed is a little-endian uint32 array; seed_words() hands its bytes over as they are.
+        library.schnorr_musig_compute_precommitment.argtypes = [MusigSignerPointer, ByteBuffer, c_size_t,
+                                                                PrecommitmentPointer]
         library.schnorr_musig_compute_precommitment.restype = MusigRes
+        library.schnorr_musig_receive_precommitments.argtypes = [MusigSignerPointer, ByteBuffer, c_size_t,
+                                                                 CommitmentPointer]
         library.schnorr_musig_receive_precommitments.restype = MusigRes
+        library.schnorr_musig_receive_commitments.argtypes = [MusigSignerPointer, ByteBuffer, c_size_t,
+                                                              AggregatedCommitmentPointer]
         library.schnorr_musig_receive_commitments.restype = MusigRes
+        library.schnorr_musig_receive_signature_shares.argtypes = [MusigSignerPointer, ByteBuffer, c_size_t,
+                                                                   AggregatedSignaturePointer]
         library.schnorr_musig_receive_signature_shares.restype = MusigRes
+        library.schnorr_musig_sign.argtypes = [MusigSignerPointer, ByteBuffer, c_size_t, ByteBuffer, c_size_t,
+                                               SignaturePointer]
         library.schnorr_musig_sign.restype = MusigRes
+        library.schnorr_musig_verify.argtypes = [ByteBuffer, c_size_t, ByteBuffer, c_size_t, ByteBuffer, c_size_t]
         library.schnorr_musig_verify.restype = MusigRes
         return library
@@ -0,0 +1,159 @@
+"""Columnar entry points over NumPy uint8 arrays; NumPy is an optional dependency (`pip install .[numpy]`).
+
+Rows are handed to the native library as addresses into the caller's arrays. No per-row bytes
+objects are created: each worker thread reuses one pointer argument per input column and only
+moves its address between calls. These calls bypass the SDK's key and verification caches.
+"""
+from concurrent.futures import Executor
+from ctypes import c_void_p
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_batch import BatchExecutor
+from zksync.sdk.musig.schnorr_musig_batch import chunk_ranges
+from zksync.sdk.musig.schnorr_musig_buffer import output
+from zksync.sdk.musig.schnorr_musig_native import AGG_SIG_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_native import AggregatedPublicKey
+from zksync.sdk.musig.schnorr_musig_native import AggregatedPublicKeyPointer
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def is_available() -> bool:
+    return numpy is not None
+
+
+def verify_array(musig: SchnorrMusig, messages, signatures, public_keys, offsets=None, lengths=None,
+                 max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+    """Verifies row i of `signatures` (n, 64) over message i against row i of `public_keys`.
+
+    Returns a boolean array of shape (n,); see verify_codes_array() for the arguments.
+    """
+    return verify_codes_array(musig, messages, signatures, public_keys, offsets, lengths, max_workers,
+                              executor) == MusigRes.OK
+
+
+def verify_codes_array(musig: SchnorrMusig, messages, signatures, public_keys, offsets=None, lengths=None,
+                       max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+    """Verifies every row and returns the native MusigRes codes as a uint8 array of shape (n,).
+
+    `messages` is either a 2-D array with one fixed-length message per row, or a 1-D buffer with
+    `offsets` and `lengths` arrays locating message i at messages[offsets[i]:offsets[i] + lengths[i]].
+    `public_keys` holds one aggregated public key per row, shape (n, 32), or a single key of shape
+    (32,) used for every row.
+    """
+    _require()
+    signatures = _rows(signatures, AGG_SIG_ENCODING_LENGTH, 'signatures')
+    count = len(signatures)
+    public_keys = _contiguous(public_keys)
+    if public_keys.shape == (STANDARD_ENCODING_LENGTH,):
+        key_stride = 0
+    else:
+        public_keys = _rows(public_keys, STANDARD_ENCODING_LENGTH, 'public_keys')
+        key_stride = STANDARD_ENCODING_LENGTH
+        if len(public_keys) != count:
+            raise ValueError('public_keys must have one row per signature')
+    messages, offsets, lengths = _messages(messages, offsets, lengths, count)
+
+    codes = numpy.empty(count, dtype=numpy.uint8)
+    verify = musig.native.schnorr_musig_verify
+    message_base = messages.ctypes.data
+    key_base = public_keys.ctypes.data
+    signature_base = signatures.ctypes.data
+
+    def verify_range(start: int, end: int) -> None:
+        message, key, signature = c_void_p(), c_void_p(), c_void_p()
+        results: List[int] = []
+        for index, (offset, length) in enumerate(zip(offsets[start:end], lengths[start:end]), start):
+            message.value = message_base + offset
+            key.value = key_base + index * key_stride
+            signature.value = signature_base + index * AGG_SIG_ENCODING_LENGTH
+            results.append(verify(message, length, key, STANDARD_ENCODING_LENGTH, signature,
+                                  AGG_SIG_ENCODING_LENGTH))
+        codes[start:end] = results
+
+    with BatchExecutor(executor, max_workers) as pool:
+        for future in [pool.submit(verify_range, start, end) for start, end in chunk_ranges(count, pool.workers)]:
+            future.result()
+    return codes
+
+
+def aggregate_public_keys_array(musig: SchnorrMusig, public_keys, max_workers: Optional[int] = None,
+                                executor: Optional[Executor] = None) -> Tuple[object, object]:
+    """Aggregates n key sets of m keys each, given as an array of shape (n, m, 32).
+
+    Returns the aggregated keys, shape (n, 32), and the MusigRes codes, uint8 of shape (n,). Rows
+    whose code is not OK are left zeroed. For a single key set of shape (m, 32), use
+    SchnorrMusig.aggregate_encoded_public_keys(), which accepts the array as it is.
+    """
+    _require()
+    public_keys = _contiguous(public_keys)
+    if public_keys.ndim != 3 or public_keys.shape[2] != STANDARD_ENCODING_LENGTH:
+        raise ValueError(f'public_keys must have shape (n, m, {STANDARD_ENCODING_LENGTH})')
+    count, width = public_keys.shape[0], public_keys.shape[1] * STANDARD_ENCODING_LENGTH
+
+    aggregated = numpy.zeros((count, STANDARD_ENCODING_LENGTH), dtype=numpy.uint8)
+    codes = numpy.empty(count, dtype=numpy.uint8)
+    aggregate = musig.native.schnorr_musig_aggregate_pubkeys
+    key_base = public_keys.ctypes.data
+
+    def aggregate_range(start: int, end: int) -> None:
+        keys = c_void_p()
+        results: List[int] = []
+        for index in range(start, end):
+            keys.value = key_base + index * width
+            results.append(aggregate(keys, width,
+                                     AggregatedPublicKeyPointer(output(AggregatedPublicKey, aggregated[index]))))
+        codes[start:end] = results
+        aggregated[start:end][codes[start:end] != MusigRes.OK] = 0
+
+    with BatchExecutor(executor, max_workers) as pool:
+        for future in [pool.submit(aggregate_range, start, end) for start, end in chunk_ranges(count, pool.workers)]:
+            future.result()
+    return aggregated, codes
+
+
+def _require() -> None:
+    if numpy is None:
+        raise ImportError('the columnar API requires numpy, install it with `pip install zksync-sdk[numpy]`')
+
+
+def _contiguous(array):
+    """Returns a C-contiguous uint8 array, copying only when the input is not one already."""
+    array = numpy.asarray(array)
+    if array.dtype != numpy.uint8:
+        raise ValueError(f'expected a uint8 array, got {array.dtype}')
+    return numpy.ascontiguousarray(array)
+
+
+def _rows(array, width: int, name: str):
+    array = _contiguous(array)
+    if array.ndim != 2 or array.shape[1] != width:
+        raise ValueError(f'{name} must have shape (n, {width})')
+    return array
+
+
+def _messages(messages, offsets, lengths, count: int) -> Tuple[object, List[int], List[int]]:
+    messages = _contiguous(messages)
+    if offsets is None and lengths is None:
+        if messages.ndim != 2 or len(messages) != count:
+            raise ValueError('messages must have one row per signature, or come with offsets and lengths')
+        width = messages.shape[1]
+        return messages, list(range(0, count * width, width)), [width] * count
+
+    if messages.ndim != 1 or offsets is None or lengths is None:
+        raise ValueError('offsets and lengths locate messages in a 1-D buffer and must be given together')
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    lengths = numpy.asarray(lengths, dtype=numpy.int64)
+    if offsets.shape != (count,) or lengths.shape != (count,):
+        raise ValueError('offsets and lengths must have one entry per signature')
+    if count and ((offsets < 0).any() or (lengths < 0).any() or (offsets + lengths > len(messages)).any()):
+        raise ValueError('message offsets and lengths must lie within the messages buffer')
+    return messages, offsets.tolist(), lengths.tolist()
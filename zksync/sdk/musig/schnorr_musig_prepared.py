@@ -0,0 +1,29 @@
+from typing import List
+
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+
+
+class PreparedPublicKey:
+    """An aggregated public key validated once, for verifying many messages against the same key set.
+
+    libmusig_c has no call that keeps a decoded point between verifications, so the native side
+    still decodes the key on every verify. What a prepared key saves is the per-call aggregation,
+    cache digest and argument conversion of passing a key list.
+    """
+
+    __slots__ = ('public_keys', 'aggregated_public_key')
+
+    def __init__(self, public_keys: List[bytes], aggregated_public_key: bytes) -> None:
+        if len(aggregated_public_key) != STANDARD_ENCODING_LENGTH:
+            raise ValueError(f'aggregated public key must be {STANDARD_ENCODING_LENGTH} bytes long')
+        self.public_keys = public_keys
+        self.aggregated_public_key = bytes(aggregated_public_key)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PreparedPublicKey) and other.aggregated_public_key == self.aggregated_public_key
+
+    def __hash__(self) -> int:
+        return hash(self.aggregated_public_key)
+
+    def __repr__(self) -> str:
+        return f'PreparedPublicKey({self.aggregated_public_key.hex()})'
@@ -0,0 +1,92 @@
+"""Verification and signing spread over a ProcessPoolExecutor.
+
+Each worker unpickles one SchnorrMusig in its initializer, which loads the native library once
+for the life of the worker, and reuses it for every task. Tasks carry plain bytes only: signers
+never cross a process boundary, and KeySet items must be passed as a PreparedPublicKey or an
+aggregated key instead because they are backed by an mmap.
+"""
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_batch import BatchVerificationResult
+from zksync.sdk.musig.schnorr_musig_batch import VerificationItem
+from zksync.sdk.musig.schnorr_musig_batch import chunk_ranges
+from zksync.sdk.musig.schnorr_musig_batch import default_workers
+from zksync.sdk.musig.schnorr_musig_group import SigningGroup
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+_worker_musig: Optional[SchnorrMusig] = None
+
+
+def _initialize(musig: SchnorrMusig) -> None:
+    global _worker_musig
+    _worker_musig = musig
+
+
+def worker_musig() -> SchnorrMusig:
+    """The SchnorrMusig of the current pool worker, for functions passed to MusigProcessPool.submit()."""
+    if _worker_musig is None:
+        raise RuntimeError('not running in a MusigProcessPool worker')
+    return _worker_musig
+
+
+def _call(fn: Callable, args: tuple):
+    return fn(worker_musig(), *args)
+
+
+def _verify_range(musig: SchnorrMusig, items: List[VerificationItem]) -> List[MusigRes]:
+    return [musig._verify_item(item) for item in items]
+
+
+def _sign_range(musig: SchnorrMusig, public_keys: List[bytes], private_keys: List[bytes],
+                messages: List[bytes]) -> List[bytes]:
+    group = SigningGroup(musig, public_keys, private_keys)
+    return [group.sign(message).signature for message in messages]
+
+
+class MusigProcessPool:
+    """A process pool whose workers each keep one attached SchnorrMusig.
+
+    `mp_context` is passed to ProcessPoolExecutor; the default start method of the platform is
+    used otherwise. Signers inherited through fork cannot be used in workers.
+    """
+
+    def __init__(self, musig: Optional[SchnorrMusig] = None, max_workers: Optional[int] = None,
+                 mp_context=None) -> None:
+        self.musig = SchnorrMusig() if musig is None else musig
+        self.workers = max_workers or default_workers()
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=mp_context, initializer=_initialize,
+                                            initargs=(self.musig,))
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Runs fn(musig, *args) in a worker; fn and its arguments must be picklable."""
+        return self.executor.submit(_call, fn, args)
+
+    def verify_batch(self, items: Iterable[VerificationItem]) -> BatchVerificationResult:
+        """Verifies (message, signature, public_keys) triples across the workers, like SchnorrMusig.verify_batch."""
+        items = list(items)
+        futures = [self.submit(_verify_range, items[start:end])
+                   for start, end in chunk_ranges(len(items), self.workers)]
+        return BatchVerificationResult([code for future in futures for code in future.result()])
+
+    def sign_all(self, public_keys: List[bytes], private_keys: List[bytes],
+                 messages: Sequence[bytes]) -> List[bytes]:
+        """Signs every message with a whole in-process session per message, spread across the workers."""
+        futures = [self.submit(_sign_range, public_keys, private_keys, list(messages[start:end]))
+                   for start, end in chunk_ranges(len(messages), self.workers)]
+        return [signature for future in futures for signature in future.result()]
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'MusigProcessPool':
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        self.close()
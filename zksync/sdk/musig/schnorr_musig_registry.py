@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+MAGIC = b'MUSIGKS1'
+
+# Record length, key set ID length and key count, followed by the UTF-8 key set ID, the aggregated
+# public key, the public keys in signing order and the position index sorted by public key.
+RECORD_HEADER = struct.Struct('<IHI')
+INDEX_ENTRY = struct.Struct(f'<{STANDARD_ENCODING_LENGTH}sI')
+
+
+class KeySet:
+    """A registered key set; positions are looked up in the on-disk index without loading it."""
+
+    def __init__(self, registry: KeySetRegistry, set_id: str, offset: int, count: int) -> None:
+        self.registry = registry
+        self.set_id = set_id
+        self.count = count
+        self._keys_offset = offset + STANDARD_ENCODING_LENGTH
+        self._index_offset = self._keys_offset + STANDARD_ENCODING_LENGTH * count
+        self.aggregated_public_key = registry._read(offset, STANDARD_ENCODING_LENGTH)
+        self.encoded_public_keys = registry._read(self._keys_offset, STANDARD_ENCODING_LENGTH * count)
+
+    @property
+    def public_keys(self) -> List[bytes]:
+        keys = self.encoded_public_keys
+        return [keys[index:index + STANDARD_ENCODING_LENGTH] for index in
+                range(0, len(keys), STANDARD_ENCODING_LENGTH)]
+
+    def position(self, public_key: bytes) -> int:
+        public_key = bytes(public_key)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            key, position = self.registry._index_entry(self._index_offset + middle * INDEX_ENTRY.size)
+            if key < public_key:
+                low = middle + 1
+            elif key > public_key:
+                high = middle
+            else:
+                return position
+        raise KeyError(f'public key is not in key set {self.set_id}')
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, public_key: bytes) -> bool:
+        try:
+            self.position(public_key)
+            return True
+        except KeyError:
+            return False
+
+
+class KeySetRegistry:
+    """Append-only, memory-mapped store of key sets with their aggregated keys and position indexes.
+
+    Opening an existing file only scans record headers. Key sets appended by other processes are
+    picked up on the next lookup miss or refresh(); re-adding an ID shadows the older record.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._file = open(path, 'a+b')
+        self._map: Optional[mmap.mmap] = None
+        self._scanned = len(MAGIC)
+        self._offsets: Dict[str, int] = {}
+        with self._locked():
+            self._file.seek(0, os.SEEK_END)
+            if self._file.tell() == 0:
+                self._file.write(MAGIC)
+                self._sync()
+            self._file.seek(0)
+            magic = self._file.read(len(MAGIC))
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not a key set registry')
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Maps records appended since the last scan; a partially written trailing record is skipped."""
+        with self._lock:
+            size = os.fstat(self._file.fileno()).st_size
+            if self._map is not None and size == len(self._map):
+                return
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+
+            offset = self._scanned
+            while offset + RECORD_HEADER.size <= size:
+                length, id_length, count = RECORD_HEADER.unpack_from(self._map, offset)
+                if length < RECORD_HEADER.size or offset + length > size:
+                    break
+                start = offset + RECORD_HEADER.size
+                set_id = self._map[start:start + id_length].decode()
+                self._offsets[set_id] = offset
+                offset += length
+            self._scanned = offset
+
+    def add(self, set_id: str, public_keys: List[bytes], aggregated_public_key: bytes) -> KeySet:
+        if any(len(public_key) != STANDARD_ENCODING_LENGTH for public_key in public_keys):
+            raise ValueError(f'public keys must be {STANDARD_ENCODING_LENGTH} bytes long')
+        if len(aggregated_public_key) != STANDARD_ENCODING_LENGTH:
+            raise ValueError(f'aggregated public key must be {STANDARD_ENCODING_LENGTH} bytes long')
+
+        encoded_id = set_id.encode()
+        index = sorted((bytes(public_key), position) for position, public_key in enumerate(public_keys))
+        record = b''.join([encoded_id, bytes(aggregated_public_key), *[bytes(key) for key in public_keys],
+                           *[INDEX_ENTRY.pack(key, position) for key, position in index]])
+        header = RECORD_HEADER.pack(RECORD_HEADER.size + len(record), len(encoded_id), len(public_keys))
+
+        with self._lock, self._locked():
+            self.refresh()
+            if os.fstat(self._file.fileno()).st_size > self._scanned:
+                # A writer crashed mid-record; appending after its bytes would hide this record too.
+                self._map.close()
+                self._map = None
+                self._file.truncate(self._scanned)
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(header + record)
+            self._sync()
+        self.refresh()
+        return self.get(set_id)
+
+    def get(self, set_id: str) -> KeySet:
+        with self._lock:
+            if set_id not in self._offsets:
+                self.refresh()
+            offset = self._offsets[set_id]
+            _, id_length, count = RECORD_HEADER.unpack_from(self._map, offset)
+            return KeySet(self, set_id, offset + RECORD_HEADER.size + id_length, count)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+    def __contains__(self, set_id: str) -> bool:
+        with self._lock:
+            if set_id not in self._offsets:
+                self.refresh()
+            return set_id in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._offsets))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __enter__(self) -> KeySetRegistry:
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        self.close()
+
+    def _read(self, offset: int, length: int) -> bytes:
+        with self._lock:
+            return self._map[offset:offset + length]
+
+    def _index_entry(self, offset: int):
+        with self._lock:
+            return INDEX_ENTRY.unpack_from(self._map, offset)
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _locked(self):
+        return FileLock(self._file)
+
+
+class FileLock:
+    """Serializes appends from several processes where flock() is available."""
+
+    def __init__(self, file) -> None:
+        self.file = file
+
+    def __enter__(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+
+    def __exit__(self, type_, value, traceback) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,84 @@
+import os
+import struct
+import sys
+import threading
+import weakref
+from ctypes import alignment
+from ctypes import c_uint32
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig_buffer import is_aligned
+from zksync.sdk.musig.schnorr_musig_buffer import nbytes
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+
+SEED_LENGTH = 16
+DEFAULT_BLOCK_SEEDS = 1024
+
+_sources: 'weakref.WeakSet[SeedSource]' = weakref.WeakSet()
+
+
+class SeedSource:
+    """Hands out precommitment seeds carved from large os.urandom blocks.
+
+    Every seed is returned exactly once. Buffered randomness is discarded in a forked child and
+    left out when pickling, so two processes never reuse a nonce seed.
+    """
+
+    def __init__(self, seed_length: int = SEED_LENGTH, block_seeds: int = DEFAULT_BLOCK_SEEDS) -> None:
+        if seed_length <= 0 or seed_length % 4:
+            raise ValueError('seed length must be a positive multiple of 4 bytes')
+        self.seed_length = seed_length
+        self.block_seeds = block_seeds
+        self._block = memoryview(b'')
+        self._offset = 0
+        self._lock = threading.Lock()
+        _sources.add(self)
+
+    def __reduce__(self):
+        return SeedSource, (self.seed_length, self.block_seeds)
+
+    def take(self, count: int = 1) -> memoryview:
+        """Returns `count` seeds packed back to back, without copying out of the random block."""
+        length = count * self.seed_length
+        with self._lock:
+            if self._offset + length > len(self._block):
+                self._block = memoryview(os.urandom(max(length, self.block_seeds * self.seed_length)))
+                self._offset = 0
+            seeds = self._block[self._offset:self._offset + length]
+            self._offset += length
+        return seeds
+
+    def discard(self) -> None:
+        with self._lock:
+            self._block = memoryview(b'')
+            self._offset = 0
+
+
+def seed_words(seed) -> Tuple[object, int]:
+    """Validates a seed and returns it as a native uint32 array argument with its length in words.
+
+    On little-endian hosts the caller's buffer is handed to native code as-is, unless it is not
+    4-byte aligned, e.g. a memoryview slice at an odd offset, in which case it is copied.
+    """
+    length = nbytes(seed)
+    if length == 0 or length % 4:
+        raise SchnorrMusigError(MusigRes.INVALID_SEED, 'seed length must be a non-zero multiple of 4 bytes')
+    count = length // 4
+    if sys.byteorder != 'little':
+        return (c_uint32 * count)(*struct.unpack('<%dI' % count, seed)), count
+    if not is_aligned(seed, alignment(c_uint32)):
+        return bytes(seed), count
+    return seed, count
+
+
+def _discard_after_fork() -> None:
+    for source in list(_sources):
+        source._lock = threading.Lock()
+        source.discard()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_discard_after_fork)
+
+shared_seed_source = SeedSource()
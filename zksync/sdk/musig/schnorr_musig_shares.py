@@ -0,0 +1,97 @@
+import threading
+from typing import List
+from typing import Optional
+
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigRevokedError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigShareError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigStateError
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+
+class SignatureShareAccumulator:
+    """Takes signature shares one at a time for a signer that has signed, and aggregates on the last one.
+
+    libmusig_c has no call that checks a single share against its sender's commitment and key. Each
+    arriving share is instead checked alone: it is aggregated in a probe where every other slot holds
+    this signer's own share, so a share the library cannot decode is reported at once with its position.
+    A share that decodes but is mathematically wrong only shows up when the final signature fails to
+    verify, and is reported without a position.
+    """
+
+    def __init__(self, signer: SchnorrMusigSigner, position: int, share: bytes, message: bytes,
+                 check_shares: bool = True) -> None:
+        self.signer = signer
+        self.message = message
+        self.participants = len(signer.public_keys)
+        self.check_shares = check_shares
+        self.signature: Optional[bytes] = None
+        self.shares = bytearray(STANDARD_ENCODING_LENGTH * self.participants)
+        self._template = bytes(share) * self.participants
+        self._received = bytearray(self.participants)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._store(position, share)
+
+    def add(self, position: int, share: bytes) -> Optional[bytes]:
+        """Accepts the share from `position`; returns the aggregated signature once every share has arrived."""
+        with self._lock:
+            if not 0 <= position < self.participants:
+                raise SchnorrMusigShareError(position, MusigRes.INVALID_PARTICIPANT_POSITION)
+            if len(share) != STANDARD_ENCODING_LENGTH:
+                raise SchnorrMusigShareError(position, MusigRes.INVALID_SIGNATURE_SHARE,
+                                             f'share from position {position} is not {STANDARD_ENCODING_LENGTH} bytes')
+            if self._received[position]:
+                if self._slot(position) != share:
+                    raise SchnorrMusigShareError(position, MusigRes.INVALID_SIGNATURE_SHARE,
+                                                 f'conflicting shares from position {position}')
+                return self.signature
+
+            if self.check_shares:
+                self._check(position, share)
+            self._store(position, share)
+            if self._count == self.participants:
+                self.signature = self._finish()
+            return self.signature
+
+    @property
+    def complete(self) -> bool:
+        return self.signature is not None
+
+    @property
+    def missing(self) -> List[int]:
+        return [position for position, received in enumerate(self._received) if not received]
+
+    def _slot(self, position: int) -> memoryview:
+        return memoryview(self.shares)[position * STANDARD_ENCODING_LENGTH:(position + 1) * STANDARD_ENCODING_LENGTH]
+
+    def _store(self, position: int, share: bytes) -> None:
+        self._slot(position)[:] = share
+        self._received[position] = 1
+        self._count += 1
+
+    def _check(self, position: int, share: bytes) -> None:
+        probe = bytearray(self._template)
+        probe[position * STANDARD_ENCODING_LENGTH:(position + 1) * STANDARD_ENCODING_LENGTH] = share
+        try:
+            self.signer.aggregate_signature(probe)
+        except (SchnorrMusigStateError, SchnorrMusigRevokedError):
+            raise
+        except SchnorrMusigError as e:
+            # Every other slot holds this signer's own share, so a native failure is the candidate's.
+            raise SchnorrMusigShareError(position, e.code) from None
+
+    def _finish(self) -> bytes:
+        try:
+            signature = self.signer.aggregate_signature(self.shares)
+        except (SchnorrMusigStateError, SchnorrMusigRevokedError):
+            raise
+        except SchnorrMusigError as e:
+            raise SchnorrMusigShareError(None, e.code, f'aggregating the shares failed with {e.code.name}; '
+                                                       f'the faulty share cannot be attributed') from None
+        if not self.signer.verify(self.message, signature):
+            raise SchnorrMusigShareError(None, MusigRes.SIGNATURE_VERIFICATION_FAILED,
+                                         'aggregated signature does not verify; the faulty share cannot be attributed')
+        return signature
@@ -1,95 +1,212 @@
 from __future__ import annotations
 
+import enum
+import os
+import threading
+import weakref
+
+from zksync.sdk.musig.schnorr_musig_buffer import join
+from zksync.sdk.musig.schnorr_musig_buffer import nbytes
+from zksync.sdk.musig.schnorr_musig_buffer import output
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigConcurrentUseError
 from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigForkedError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigRevokedError
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigStateError
 from zksync.sdk.musig.schnorr_musig_native import *
+from zksync.sdk.musig.schnorr_musig_seed import seed_words
 
 from typing import List
+from typing import Optional
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from zksync.sdk.musig.schnorr_musig import SchnorrMusig
 
+# Incremented in every forked child; signers created under an older generation were inherited.
+_generation = 0
 
-class SchnorrMusigSigner:
-
-    def __init__(self, musig: SchnorrMusig, signer: MusigSignerPointer, public_keys: List[bytes]) -> None:
-        self.musig = musig
-        self.signer = signer
-        self.public_keys = public_keys
-        self.aggregated_public_key = self.musig.aggregate_public_keys(*public_keys)
-
-    def sign(self, private_key: bytes, message: bytes) -> bytes:
-        signature = Signature()
-        code = self.musig.native.schnorr_musig_sign(self.signer, private_key, len(private_key), message, len(message),
-                                                    SignaturePointer(signature))
-        if code != MusigRes.OK:
-            raise SchnorrMusigError(code)
-
-        return bytes(signature.data)
-
-    def compute_precommitment(self, seed: bytes) -> bytes:
-        seed_len = int(len(seed) / 4)
-        seed_data = [c_uint32(int.from_bytes(seed[index * 4: index * 4 + 4], byteorder='little')) for index in
-                     range(seed_len)]
-
-        precommitment = Precommitment()
-        code = self.musig.native.schnorr_musig_compute_precommitment(
-            self.signer, (c_uint32 * seed_len)(*seed_data), seed_len, PrecommitmentPointer(precommitment))
-
-        if code != MusigRes.OK:
-            raise SchnorrMusigError(code)
-
-        return bytes(precommitment.data)
-
-    def receive_precommitments(self, *precommitments: bytes) -> bytes:
-        precommitments_data = bytes()
-        for precommitment in precommitments:
-            precommitments_data += precommitment
 
-        commitment = Commitment()
-        code = self.musig.native.schnorr_musig_receive_precommitments(self.signer, precommitments_data,
-                                                                      len(precommitments_data),
-                                                                      CommitmentPointer(commitment))
+class SignerState(enum.IntEnum):
+    CREATED = 0
+    PRECOMMITTED = 1
+    COMMITTED = 2
+    COMMITMENTS_RECEIVED = 3
+    SIGNED = 4
+    AGGREGATED = 5
 
-        if code != MusigRes.OK:
-            raise SchnorrMusigError(code)
-
-        return bytes(commitment.data)
-
-    def receive_commitments(self, *commitments: bytes) -> bytes:
-        commitments_data = bytes()
-        for commitment in commitments:
-            commitments_data += commitment
-
-        aggregated_commitment = AggregatedCommitment()
-        code = self.musig.native.schnorr_musig_receive_commitments(self.signer, commitments_data, len(commitments_data),
-                                                                   AggregatedCommitmentPointer(aggregated_commitment))
 
-        if code != MusigRes.OK:
-            raise SchnorrMusigError(code)
+class SchnorrMusigSigner:
+    """Single-participant MuSig session state backed by a native MusigSigner handle.
 
-        return bytes(aggregated_commitment.data)
+    The handle is freed by revoke(), on leaving a `with` block, or when the signer is
+    garbage collected, whichever happens first.
 
-    def aggregate_signature(self, *signatures: bytes) -> bytes:
-        signatures_data = bytes()
-        for signature in signatures:
-            signatures_data += signature
+    Round methods must be called once each, in order; only aggregate_signature() may be repeated.
+    A signer may be handed between threads, but a round call made while another thread is inside
+    one on the same signer raises SchnorrMusigConcurrentUseError instead of racing on native state.
+    revoke() waits for an in-flight round call. verify() touches no signer state and takes no lock.
 
-        aggregated_signature = AggregatedSignature()
-        code = self.musig.native.schnorr_musig_receive_signature_shares(self.signer, signatures_data,
-                                                                        len(signatures_data),
-                                                                        AggregatedSignaturePointer(
-                                                                            aggregated_signature))
+    A signer belongs to the process that created it. It cannot be pickled, and after a fork the child's
+    copy raises SchnorrMusigForkedError from every round, so parent and child never continue one
+    session with the same nonce.
+    """
 
-        if code != MusigRes.OK:
-            raise SchnorrMusigError(code)
+    _live_lock = threading.Lock()
+    _live_handles = 0
 
-        return bytes(aggregated_signature.data)
+    def __init__(self, musig: SchnorrMusig, signer: MusigSignerPointer, public_keys: List[bytes],
+                 encoded_public_keys: Optional[bytes] = None) -> None:
+        self.musig = musig
+        self.signer = signer
+        self.public_keys = public_keys
+        self.encoded_public_keys = b''.join(public_keys) if encoded_public_keys is None else encoded_public_keys
+        self._aggregated_public_key: Optional[bytes] = None
+        self.state = SignerState.CREATED
+        self._state_lock = threading.Lock()
+        self._generation = _generation
+
+        with SchnorrMusigSigner._live_lock:
+            SchnorrMusigSigner._live_handles += 1
+        self._finalizer = weakref.finalize(self, SchnorrMusigSigner._delete_signer, musig.native, signer)
+
+    @staticmethod
+    def live_handles() -> int:
+        """Number of native signer handles created and not yet freed in this process."""
+        return SchnorrMusigSigner._live_handles
+
+    @staticmethod
+    def _delete_signer(native: SchnorrMusigNative, signer: MusigSignerPointer) -> None:
+        native.schnorr_musig_delete_signer(signer)
+        with SchnorrMusigSigner._live_lock:
+            SchnorrMusigSigner._live_handles -= 1
+
+    def __reduce__(self):
+        raise TypeError('SchnorrMusigSigner wraps a native handle and cannot be pickled')
+
+    @property
+    def forked(self) -> bool:
+        """Whether this signer was created in a parent process and inherited through fork()."""
+        return self._generation != _generation
+
+    @property
+    def revoked(self) -> bool:
+        return not self._finalizer.alive
+
+    def __enter__(self) -> SchnorrMusigSigner:
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        self.revoke()
+
+    def _begin(self, required: SignerState, early: MusigRes, repeatable: bool = False) -> MusigSignerPointer:
+        """Takes the round lock and checks the state; the caller must release the lock."""
+        if not self._state_lock.acquire(blocking=False):
+            raise SchnorrMusigConcurrentUseError()
+        try:
+            if self._generation != _generation:
+                raise SchnorrMusigForkedError()
+            if not self._finalizer.alive:
+                raise SchnorrMusigRevokedError()
+            if self.state < required:
+                raise SchnorrMusigStateError(early, f'signer is {self.state.name}, expected {required.name}')
+            if self.state > required and not repeatable:
+                raise SchnorrMusigStateError(MusigRes.INVALID_INPUT_DATA,
+                                             f'signer is {self.state.name}, round already completed')
+        except BaseException:
+            self._state_lock.release()
+            raise
+        return self.signer
+
+    @property
+    def aggregated_public_key(self) -> bytes:
+        if self._aggregated_public_key is None:
+            self._aggregated_public_key = self.musig.aggregate_encoded_public_keys(self.encoded_public_keys)
+        return self._aggregated_public_key
+
+    def sign(self, private_key: bytes, message: bytes, out=None) -> bytes:
+        signature = output(Signature, out)
+        signer = self._begin(SignerState.COMMITMENTS_RECEIVED, MusigRes.AGGREGATED_NONCE_COMMITMENT_NOT_COMPUTED)
+        try:
+            code = self.musig.native.schnorr_musig_sign(signer, private_key, nbytes(private_key), message,
+                                                        nbytes(message), SignaturePointer(signature))
+            if code != MusigRes.OK:
+                raise SchnorrMusigError(code)
+            self.state = SignerState.SIGNED
+        finally:
+            self._state_lock.release()
+
+        return bytes(signature.data) if out is None else out
+
+    def compute_precommitment(self, seed: Optional[bytes] = None, out=None) -> bytes:
+        """Uses a fresh seed from `musig.seed_source` when none is given."""
+        seed_data, seed_len = seed_words(self.musig.seed_source.take() if seed is None else seed)
+
+        precommitment = output(Precommitment, out)
+        signer = self._begin(SignerState.CREATED, MusigRes.INVALID_INPUT_DATA)
+        try:
+            code = self.musig.native.schnorr_musig_compute_precommitment(signer, seed_data, seed_len,
+                                                                         PrecommitmentPointer(precommitment))
+            if code != MusigRes.OK:
+                raise SchnorrMusigError(code)
+            self.state = SignerState.PRECOMMITTED
+        finally:
+            self._state_lock.release()
+
+        return bytes(precommitment.data) if out is None else out
+
+    def receive_precommitments(self, *precommitments: bytes, out=None) -> bytes:
+        """Accepts one buffer per participant, or a single buffer with all of them packed in order."""
+        precommitments_data = join(precommitments)
+
+        commitment = output(Commitment, out)
+        signer = self._begin(SignerState.PRECOMMITTED, MusigRes.NONCE_COMMITMENT_NOT_GENERATED)
+        try:
+            code = self.musig.native.schnorr_musig_receive_precommitments(signer, precommitments_data,
+                                                                          nbytes(precommitments_data),
+                                                                          CommitmentPointer(commitment))
+            if code != MusigRes.OK:
+                raise SchnorrMusigError(code)
+            self.state = SignerState.COMMITTED
+        finally:
+            self._state_lock.release()
+
+        return bytes(commitment.data) if out is None else out
+
+    def receive_commitments(self, *commitments: bytes, out=None) -> bytes:
+        commitments_data = join(commitments)
+
+        aggregated_commitment = output(AggregatedCommitment, out)
+        signer = self._begin(SignerState.COMMITTED, MusigRes.NONCE_PRECOMMITMENTS_NOT_RECEIVED)
+        try:
+            code = self.musig.native.schnorr_musig_receive_commitments(
+                signer, commitments_data, nbytes(commitments_data), AggregatedCommitmentPointer(aggregated_commitment))
+            if code != MusigRes.OK:
+                raise SchnorrMusigError(code)
+            self.state = SignerState.COMMITMENTS_RECEIVED
+        finally:
+            self._state_lock.release()
+
+        return bytes(aggregated_commitment.data) if out is None else out
+
+    def aggregate_signature(self, *signatures: bytes, out=None) -> bytes:
+        signatures_data = join(signatures)
+
+        aggregated_signature = output(AggregatedSignature, out)
+        signer = self._begin(SignerState.SIGNED, MusigRes.CHALLENGE_NOT_GENERATED, repeatable=True)
+        try:
+            code = self.musig.native.schnorr_musig_receive_signature_shares(
+                signer, signatures_data, nbytes(signatures_data), AggregatedSignaturePointer(aggregated_signature))
+            if code != MusigRes.OK:
+                raise SchnorrMusigError(code)
+            self.state = SignerState.AGGREGATED
+        finally:
+            self._state_lock.release()
+
+        return bytes(aggregated_signature.data) if out is None else out
 
     def verify(self, message: bytes, signature: bytes) -> bool:
-        code = self.musig.native.schnorr_musig_verify(message, len(message), self.aggregated_public_key,
-                                                      len(self.aggregated_public_key),
-                                                      signature, len(signature))
+        code = self.musig.verify_code(message, signature, self.aggregated_public_key)
 
         if code == MusigRes.OK:
             return True
@@ -98,5 +215,21 @@ class SchnorrMusigSigner:
         else:
             raise SchnorrMusigError(code)
 
-    def revoke(self):
-        self.musig.native.schnorr_musig_delete_signer(self.signer)
+    def revoke(self) -> None:
+        """Frees the native handle once no round call is running; calling it again is a no-op."""
+        if self._generation != _generation:
+            # A round lock held at fork time has no owner in this process.
+            self._finalizer()
+            return
+        with self._state_lock:
+            self._finalizer()
+
+
+def _after_fork() -> None:
+    global _generation
+    _generation += 1
+    SchnorrMusigSigner._live_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigRevokedError
+from zksync.sdk.musig.schnorr_musig_signer import SchnorrMusigSigner
+
+if TYPE_CHECKING:
+    from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+
+DEFAULT_SIGNER_POOL_SIZE = 16
+DEFAULT_PRECOMMITMENT_TTL = 300.0
+REFILL_RATE_WINDOW = 60.0
+
+
+class SchnorrMusigSignerPool:
+    """Keeps fresh signers for one key set and position ready ahead of signing requests.
+
+    A signer carries per-session nonce state, so every acquired signer is handed out once and
+    owned by the caller afterwards. Call refill() off the critical path to top the pool up.
+    """
+
+    def __init__(self, musig: SchnorrMusig, public_keys: List[bytes], position: int,
+                 size: int = DEFAULT_SIGNER_POOL_SIZE) -> None:
+        self.musig = musig
+        self.public_keys = public_keys
+        self.position = position
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._signers: deque = deque()
+        self._lock = threading.Lock()
+        self._reserved = 0
+        self._closed = False
+
+    def refill(self) -> int:
+        """Creates signers until the pool holds `size` of them and returns how many were added.
+
+        Each signer's slot is reserved under the lock before it is created, so concurrent refills
+        never take the pool past `size`.
+        """
+        created = 0
+        while True:
+            with self._lock:
+                if self._closed or len(self._signers) + self._reserved >= self.size:
+                    break
+                self._reserved += 1
+            try:
+                entry = self._prepare()
+            except BaseException:
+                with self._lock:
+                    self._reserved -= 1
+                raise
+            with self._lock:
+                self._reserved -= 1
+                if self._closed:
+                    self._discard(entry)
+                    break
+                self._signers.append(entry)
+            created += 1
+        return created
+
+    def acquire(self) -> SchnorrMusigSigner:
+        with self._lock:
+            if self._closed:
+                raise SchnorrMusigRevokedError('signer pool has been closed')
+            if self._signers:
+                self.hits += 1
+                return self._signers.popleft()
+            self.misses += 1
+        return self._prepare()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            entries, self._signers = self._signers, deque()
+        for entry in entries:
+            self._discard(entry)
+
+    def __len__(self) -> int:
+        return len(self._signers)
+
+    def __enter__(self) -> SchnorrMusigSignerPool:
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        self.close()
+
+    def _prepare(self):
+        return self.musig.create_signer(self.public_keys, self.position)
+
+    def _discard(self, entry) -> None:
+        entry.revoke()
+
+
+class PreparedSigner:
+    """A signer whose precommitment round has already been computed locally."""
+
+    def __init__(self, signer: SchnorrMusigSigner, precommitment: bytes, expires: Optional[float]) -> None:
+        self.signer = signer
+        self.precommitment = precommitment
+        self.expires = expires
+
+    def revoke(self) -> None:
+        self.signer.revoke()
+
+    def __enter__(self) -> PreparedSigner:
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        self.revoke()
+
+
+class SchnorrMusigPrecommitmentPool(SchnorrMusigSignerPool):
+    """Keeps signers with precommitments computed ahead of time, so signing starts at the commitment round.
+
+    Each prepared nonce is handed out exactly once: acquire() pops an entry under the pool lock and
+    the caller owns it afterwards. Entries older than `ttl` seconds are revoked instead of used.
+    """
+
+    def __init__(self, musig: SchnorrMusig, public_keys: List[bytes], position: int,
+                 size: int = DEFAULT_SIGNER_POOL_SIZE, ttl: Optional[float] = DEFAULT_PRECOMMITMENT_TTL) -> None:
+        super().__init__(musig, public_keys, position, size)
+        self.ttl = ttl
+        self.expired = 0
+        self.prepared = 0
+        self._refills: deque = deque()
+
+    def refill(self) -> int:
+        self.expire()
+        created = super().refill()
+        now = time.monotonic()
+        with self._lock:
+            self._refills.append((now, created))
+            while self._refills and self._refills[0][0] < now - REFILL_RATE_WINDOW:
+                self._refills.popleft()
+        return created
+
+    def acquire(self) -> PreparedSigner:
+        self.expire()
+        return super().acquire()
+
+    def expire(self) -> int:
+        """Revokes entries past their TTL and returns how many were dropped."""
+        if self.ttl is None:
+            return 0
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            while self._signers and self._signers[0].expires <= now:
+                expired.append(self._signers.popleft())
+            self.expired += len(expired)
+        for entry in expired:
+            self._discard(entry)
+        return len(expired)
+
+    @property
+    def depth(self) -> int:
+        return len(self._signers)
+
+    @property
+    def refill_rate(self) -> float:
+        """Entries prepared per second over the last REFILL_RATE_WINDOW seconds."""
+        with self._lock:
+            return sum(created for _, created in self._refills) / REFILL_RATE_WINDOW
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            'depth': self.depth,
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'prepared': self.prepared,
+            'refill_rate': self.refill_rate,
+        }
+
+    def _prepare(self) -> PreparedSigner:
+        signer = self.musig.create_signer(self.public_keys, self.position)
+        try:
+            precommitment = signer.compute_precommitment()
+        except BaseException:
+            signer.revoke()
+            raise
+        with self._lock:
+            self.prepared += 1
+        return PreparedSigner(signer, precommitment, None if self.ttl is None else time.monotonic() + self.ttl)
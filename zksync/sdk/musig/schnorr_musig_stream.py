@@ -0,0 +1,111 @@
+import struct
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from itertools import islice
+from typing import BinaryIO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig import SchnorrMusig
+from zksync.sdk.musig.schnorr_musig_batch import BatchExecutor
+from zksync.sdk.musig.schnorr_musig_batch import VerificationItem
+from zksync.sdk.musig.schnorr_musig_native import AGG_SIG_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_native import MusigRes
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+
+DEFAULT_CHUNK_SIZE = 256
+WINDOW_PER_WORKER = 2
+
+# Framed record: message length, message, aggregated public key, aggregated signature.
+RECORD_HEADER = struct.Struct('<I')
+READ_SIZE = 1 << 20
+
+
+def write_records(file: BinaryIO, records: Iterable[VerificationItem]) -> int:
+    """Writes (message, signature, aggregated public key) triples as framed records; returns the count."""
+    count = 0
+    for message, signature, public_key in records:
+        if len(public_key) != STANDARD_ENCODING_LENGTH or len(signature) != AGG_SIG_ENCODING_LENGTH:
+            raise ValueError(f'record {count} does not hold an aggregated public key and signature')
+        file.write(RECORD_HEADER.pack(len(message)))
+        file.write(message)
+        file.write(public_key)
+        file.write(signature)
+        count += 1
+    return count
+
+
+def read_records(file: BinaryIO) -> Iterator[VerificationItem]:
+    """Yields (message, signature, aggregated public key) triples from a framed file, reading it in blocks."""
+    buffer = b''
+    offset = 0
+    while True:
+        block = file.read(READ_SIZE)
+        buffer = buffer[offset:] + block
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(buffer):
+            (length,) = RECORD_HEADER.unpack_from(buffer, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + length + STANDARD_ENCODING_LENGTH + AGG_SIG_ENCODING_LENGTH
+            if end > len(buffer):
+                break
+            key = start + length
+            yield buffer[start:key], buffer[key + STANDARD_ENCODING_LENGTH:end], \
+                buffer[key:key + STANDARD_ENCODING_LENGTH]
+            offset = end
+        if not block:
+            if offset != len(buffer):
+                raise ValueError('truncated verification record')
+            return
+
+
+def verify_stream(musig: SchnorrMusig, records: Iterable[VerificationItem], max_workers: Optional[int] = None,
+                  executor: Optional[Executor] = None, window: Optional[int] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, ordered: bool = True) -> Iterator[Tuple[int, MusigRes]]:
+    """Verifies records lazily and yields (index, code) pairs.
+
+    At most `window` chunks of `chunk_size` records are in flight, so memory stays bounded however
+    long `records` is. Results come in input order unless `ordered` is False, in which case each
+    chunk is yielded as soon as it completes.
+    """
+    records = iter(records)
+
+    def verify_chunk(start: int, chunk: List[VerificationItem]) -> List[Tuple[int, MusigRes]]:
+        return [(start + index, musig._verify_item(item)) for index, item in enumerate(chunk)]
+
+    with BatchExecutor(executor, max_workers) as pool:
+        window = window or pool.workers * WINDOW_PER_WORKER
+        pending = deque()
+        start = 0
+
+        def submit() -> bool:
+            nonlocal start
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return False
+            pending.append(pool.submit(verify_chunk, start, chunk))
+            start += len(chunk)
+            return True
+
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < window:
+                    exhausted = not submit()
+                if not pending:
+                    return
+                if ordered:
+                    yield from pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,175 @@
+"""Binary envelope for round messages exchanged between participants.
+
+Every envelope is length-prefixed and little-endian:
+
+    frame length   u32  bytes following this field
+    version        u8   WIRE_VERSION
+    round          u8   Round
+    session ID     16 bytes
+    position       u32  sender's position in the key set
+    payload        32 bytes, or 64 for an aggregated signature
+"""
+from __future__ import annotations
+
+import enum
+import struct
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from zksync.sdk.musig.schnorr_musig_error import SchnorrMusigWireError
+from zksync.sdk.musig.schnorr_musig_native import AGG_SIG_ENCODING_LENGTH
+from zksync.sdk.musig.schnorr_musig_native import STANDARD_ENCODING_LENGTH
+
+WIRE_VERSION = 1
+SESSION_ID_LENGTH = 16
+
+HEADER = struct.Struct(f'<IBB{SESSION_ID_LENGTH}sI')
+FRAME_LENGTH = struct.Struct('<I')
+
+
+class Round(enum.IntEnum):
+    PRECOMMITMENT = 1
+    COMMITMENT = 2
+    SIGNATURE_SHARE = 3
+    AGGREGATED_SIGNATURE = 4
+
+
+PAYLOAD_LENGTHS = {
+    Round.PRECOMMITMENT: STANDARD_ENCODING_LENGTH,
+    Round.COMMITMENT: STANDARD_ENCODING_LENGTH,
+    Round.SIGNATURE_SHARE: STANDARD_ENCODING_LENGTH,
+    Round.AGGREGATED_SIGNATURE: AGG_SIG_ENCODING_LENGTH,
+}
+
+
+class Envelope:
+    """A decoded round message; `payload` is a view into the buffer it was decoded from."""
+
+    __slots__ = ('session_id', 'round', 'position', 'payload')
+
+    def __init__(self, session_id: bytes, round: Round, position: int, payload: memoryview) -> None:
+        self.session_id = session_id
+        self.round = round
+        self.position = position
+        self.payload = payload
+
+    def encode(self) -> bytes:
+        return encode(self.session_id, self.round, self.position, self.payload)
+
+
+def envelope_size(round: Round) -> int:
+    return HEADER.size + PAYLOAD_LENGTHS[round]
+
+
+def encode(session_id: bytes, round: Round, position: int, payload: bytes) -> bytes:
+    out = bytearray(envelope_size(round))
+    encode_into(out, 0, session_id, round, position, payload)
+    return bytes(out)
+
+
+def encode_into(buffer, offset: int, session_id: bytes, round: Round, position: int, payload: bytes) -> int:
+    """Writes one envelope at `offset` of a writable buffer and returns the offset just past it."""
+    length = PAYLOAD_LENGTHS[round]
+    if len(session_id) != SESSION_ID_LENGTH:
+        raise SchnorrMusigWireError(f'session ID must be {SESSION_ID_LENGTH} bytes long')
+    if memoryview(payload).nbytes != length:
+        raise SchnorrMusigWireError(f'{round.name} payload must be {length} bytes long')
+
+    HEADER.pack_into(buffer, offset, HEADER.size - FRAME_LENGTH.size + length, WIRE_VERSION, round, session_id,
+                     position)
+    end = offset + HEADER.size + length
+    memoryview(buffer)[offset + HEADER.size:end] = memoryview(payload).cast('B')
+    return end
+
+
+def encode_round(session_id: bytes, round: Round, payloads: bytes, first_position: int = 0) -> bytes:
+    """Encodes a contiguous buffer of payloads as consecutive envelopes, one per position."""
+    length = PAYLOAD_LENGTHS[round]
+    payloads = memoryview(payloads).cast('B')
+    if len(payloads) % length:
+        raise SchnorrMusigWireError(f'{round.name} payloads must be a multiple of {length} bytes long')
+
+    count = len(payloads) // length
+    out = bytearray(envelope_size(round) * count)
+    offset = 0
+    for index in range(count):
+        offset = encode_into(out, offset, session_id, round, first_position + index,
+                             payloads[index * length:(index + 1) * length])
+    return bytes(out)
+
+
+def decode(buffer, offset: int = 0) -> Tuple[Envelope, int]:
+    """Decodes the envelope at `offset` without copying its payload; returns it and the next offset."""
+    view = memoryview(buffer).cast('B')
+    if offset + HEADER.size > len(view):
+        raise SchnorrMusigWireError('truncated envelope header')
+
+    frame_length, version, round, session_id, position = HEADER.unpack_from(view, offset)
+    if version != WIRE_VERSION:
+        raise SchnorrMusigWireError(f'unsupported wire version {version}')
+    try:
+        round = Round(round)
+    except ValueError:
+        raise SchnorrMusigWireError(f'unknown round {round}') from None
+
+    end = offset + FRAME_LENGTH.size + frame_length
+    if end - offset != envelope_size(round):
+        raise SchnorrMusigWireError(f'invalid {round.name} envelope length {frame_length}')
+    if end > len(view):
+        raise SchnorrMusigWireError('truncated envelope payload')
+
+    return Envelope(session_id, round, position, view[offset + HEADER.size:end]), end
+
+
+def decode_all(buffer) -> Iterator[Envelope]:
+    view = memoryview(buffer).cast('B')
+    offset = 0
+    while offset < len(view):
+        envelope, offset = decode(view, offset)
+        yield envelope
+
+
+class RoundCollector:
+    """Gathers one round's payloads in position order into a single buffer for the receive_* methods."""
+
+    def __init__(self, session_id: bytes, round: Round, participants: int) -> None:
+        self.session_id = session_id
+        self.round = round
+        self.participants = participants
+        self.payload_length = PAYLOAD_LENGTHS[round]
+        self.buffer = bytearray(self.payload_length * participants)
+        self._received = bytearray(participants)
+        self._count = 0
+
+    def add(self, envelope: Envelope) -> bool:
+        """Stores the payload and returns whether the round is complete; repeated positions must match."""
+        if envelope.session_id != self.session_id or envelope.round != self.round:
+            raise SchnorrMusigWireError('envelope belongs to another session or round')
+        if not 0 <= envelope.position < self.participants:
+            raise SchnorrMusigWireError(f'position {envelope.position} is out of range')
+
+        start = envelope.position * self.payload_length
+        slot = memoryview(self.buffer)[start:start + self.payload_length]
+        if self._received[envelope.position]:
+            if slot != envelope.payload:
+                raise SchnorrMusigWireError(f'conflicting payloads for position {envelope.position}')
+        else:
+            slot[:] = envelope.payload
+            self._received[envelope.position] = 1
+            self._count += 1
+        return self.complete
+
+    @property
+    def complete(self) -> bool:
+        return self._count == self.participants
+
+    @property
+    def missing(self) -> List[int]:
+        return [position for position, received in enumerate(self._received) if not received]
+
+    @property
+    def payloads(self) -> Optional[memoryview]:
+        """All payloads back to back once every position has arrived, otherwise None."""
+        return memoryview(self.buffer) if self.complete else None